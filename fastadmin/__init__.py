@@ -49,6 +49,9 @@ from fastadmin.models.schemas import (  # noqa: F401
     ActionInputSchema,
     ActionResponseSchema,
     ActionResponseType,
+    ListCountStrategy,
+    ListPagination,
+    ListResult,
     ModelWidgetAction,
     WidgetActionArgumentProps,
     WidgetActionChartProps,
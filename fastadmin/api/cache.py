@@ -0,0 +1,87 @@
+"""In-process caches of the admin API.
+
+:class:`TTLCache` is a small size- and time-bounded mapping: entries expire ``ttl`` seconds
+after they were stored and the least recently used entry is evicted once ``maxsize`` entries
+are held. It is not shared between processes, so every worker warms up its own copy.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from typing import Any
+
+
+class TTLCache:
+    """Size- and time-bounded LRU cache"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        """This method is used to initialize the cache.
+
+        :params maxsize: a maximum number of entries (the least recently used entry is evicted beyond it).
+        :params ttl: a number of seconds entries live for (0 or less disables the cache).
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        # keys from the least to the most recently used (expired ones included until they are read)
+        return iter(list(self._entries))
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """This method is used to get a value which has not expired yet.
+
+        :params key: a key.
+        :params default: a value to return when the key is missing or expired.
+        :return: A value or default.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """This method is used to store a value.
+
+        :params key: a key.
+        :params value: a value.
+        :return: None.
+        """
+        if self.ttl <= 0 or self.maxsize <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """This method is used to remove a value (no-op if absent).
+
+        :params key: a key.
+        :return: None.
+        """
+        self._entries.pop(key, None)
+
+    def delete_matching(self, predicate: Callable[[Hashable], bool]) -> None:
+        """This method is used to remove the values of the keys matching a predicate.
+
+        :params predicate: a function taking a key.
+        :return: None.
+        """
+        for key in [key for key in self._entries if predicate(key)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """This method is used to remove all values.
+
+        :return: None.
+        """
+        self._entries.clear()
@@ -18,14 +18,79 @@ Example:
     register_encoder(datetime.datetime, lambda dt: dt.strftime("%Y-%m-%d %H:%M"))
 
 Encoders are matched via ``isinstance`` in registration order, so register more
-specific types before their base types.
+specific types before their base types. The match is resolved once per value type
+and cached (including "no encoder" results); the cache is dropped whenever the
+registry changes.
 """
 
+from abc import ABCMeta, get_cache_token
 from collections.abc import Callable
 from typing import Any
 
+
+class _EncodersRegistry(dict):
+    """Registry of the custom encoders which drops the dispatch cache whenever it changes"""
+
+    def __setitem__(self, key: type, value: Callable[[Any], Any]) -> None:
+        super().__setitem__(key, value)
+        _clear_dispatch_cache()
+
+    def __delitem__(self, key: type) -> None:
+        super().__delitem__(key)
+        _clear_dispatch_cache()
+
+    def __ior__(self, other: Any) -> "_EncodersRegistry":
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        _clear_dispatch_cache()
+
+    def pop(self, *args: Any) -> Any:
+        try:
+            return super().pop(*args)
+        finally:
+            _clear_dispatch_cache()
+
+    def popitem(self) -> tuple[type, Callable[[Any], Any]]:
+        try:
+            return super().popitem()
+        finally:
+            _clear_dispatch_cache()
+
+    def setdefault(self, key: type, default: Any = None) -> Any:
+        try:
+            return super().setdefault(key, default)
+        finally:
+            _clear_dispatch_cache()
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        _clear_dispatch_cache()
+
+
 # Maps a type to a function converting an instance of that type to a JSON-serializable value.
-CUSTOM_ENCODERS: dict[type, Callable[[Any], Any]] = {}
+CUSTOM_ENCODERS: dict[type, Callable[[Any], Any]] = _EncodersRegistry()
+
+# Maps a value type to its resolved encoder, or None when no registered type matches.
+_ENCODERS_DISPATCH_CACHE: dict[type, Callable[[Any], Any] | None] = {}
+# ABC registry token the cache was built with (None while no ABC encoder is registered),
+# so ``SomeABC.register(cls)`` after a lookup invalidates the cache like functools.singledispatch.
+_encoders_cache_token: object | None = None
+# False while a registered type customizes ``isinstance`` (e.g. a runtime checkable Protocol),
+# whose result depends on the value and not only on its type, so nothing is cached.
+_encoders_cacheable = True
+
+
+def _clear_dispatch_cache() -> None:
+    global _encoders_cache_token, _encoders_cacheable
+    _ENCODERS_DISPATCH_CACHE.clear()
+    _encoders_cache_token = get_cache_token() if any(isinstance(type_, ABCMeta) for type_ in CUSTOM_ENCODERS) else None
+    _encoders_cacheable = all(
+        type(type_).__instancecheck__ in (type.__instancecheck__, ABCMeta.__instancecheck__)
+        for type_ in CUSTOM_ENCODERS
+    )
 
 
 def register_encoder(type_: type, encoder: Callable[[Any], Any]) -> None:
@@ -55,6 +120,26 @@ def clear_encoders() -> None:
     CUSTOM_ENCODERS.clear()
 
 
+def get_encoder(cls: type) -> Callable[[Any], Any] | None:
+    """Return the custom encoder for instances of a type, resolved once and cached.
+
+    The first registered type the class is a subclass of (following its MRO and
+    ABC registrations) wins, matching ``isinstance`` in registration order.
+
+    :params cls: the type of the value to encode.
+    :return: the encoder, or None if no registered type matches.
+    """
+    if _encoders_cache_token is not None and _encoders_cache_token != get_cache_token():
+        _clear_dispatch_cache()
+    try:
+        return _ENCODERS_DISPATCH_CACHE[cls]
+    except KeyError:
+        pass
+    encoder = next((encoder for type_, encoder in CUSTOM_ENCODERS.items() if issubclass(cls, type_)), None)
+    _ENCODERS_DISPATCH_CACHE[cls] = encoder
+    return encoder
+
+
 def apply_custom_encoders(value: Any) -> Any:
     """Return ``value`` encoded by the first matching custom encoder, else unchanged.
 
@@ -64,7 +149,14 @@ def apply_custom_encoders(value: Any) -> Any:
     :params value: the value to encode.
     :return: the encoded value, or the original value if no encoder matches.
     """
-    for type_, encoder in CUSTOM_ENCODERS.items():
-        if isinstance(value, type_):
-            return encoder(value)
-    return value
+    if not CUSTOM_ENCODERS:
+        return value
+    cls = type(value)
+    if _encoders_cacheable and value.__class__ is cls:
+        encoder = get_encoder(cls)
+    else:
+        # proxies reporting another __class__ and value-dependent isinstance checks are not cached
+        encoder = next((encoder for type_, encoder in CUSTOM_ENCODERS.items() if isinstance(value, type_)), None)
+    if encoder is None:
+        return value
+    return encoder(value)
@@ -0,0 +1,142 @@
+"""Background export jobs of the admin API.
+
+An export of more rows than ``ADMIN_EXPORT_JOB_THRESHOLD`` is not streamed in the request:
+:class:`ExportJobManager` runs it as an asyncio task on the application event loop, writing the
+export stream to a temporary file (the writes run in a worker thread), and the client polls the job and downloads the file once it is
+done. Jobs and their files are removed ``ttl`` seconds after they finish. Jobs are kept in process,
+so a job can only be polled and downloaded through the worker which started it.
+"""
+
+import asyncio
+import logging
+import os
+import tempfile
+import time
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from pathlib import Path
+from uuid import uuid4
+
+from fastadmin.api.schemas import ExportJobStatus
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ExportJob:
+    """Export job"""
+
+    id: str
+    user_id: str
+    model: str
+    file_name: str
+    content_type: str
+    path: str
+    status: ExportJobStatus = ExportJobStatus.PENDING
+    rows: int = 0
+    total: int | None = None
+    size: int = 0
+    detail: str | None = None
+    expires_at: float | None = None
+
+    def add_rows(self, count: int) -> None:
+        """This method is used to report the progress of the job.
+
+        :params count: a number of exported objects.
+        :return: None.
+        """
+        self.rows += count
+
+
+class ExportJobManager:
+    """Background export jobs writing export streams to temporary files"""
+
+    def __init__(self, directory: str | None, ttl: float, clock: Callable[[], float] = time.monotonic):
+        """This method is used to initialize the manager.
+
+        :params directory: a directory of the export files (None for the system temporary directory).
+        :params ttl: a number of seconds finished jobs and their files are kept for.
+        :params clock: a function returning the current time in seconds (for the expiry of the jobs).
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self.clock = clock
+        self._jobs: dict[str, ExportJob] = {}
+        # references to the running tasks, so they are not garbage collected
+        self._tasks: set[asyncio.Task] = set()
+
+    def create(self, user_id: str, model: str, file_name: str, content_type: str) -> ExportJob:
+        """This method is used to create a pending job (see run).
+
+        :params user_id: an id of the user the job belongs to.
+        :params model: a name of the exported model.
+        :params file_name: a name of the export file.
+        :params content_type: a content type of the export file.
+        :return: An export job.
+        """
+        self.cleanup()
+        fd, path = tempfile.mkstemp(prefix="fastadmin-export-", dir=self.directory)
+        os.close(fd)
+        job = ExportJob(
+            id=uuid4().hex,
+            user_id=str(user_id),
+            model=model,
+            file_name=file_name,
+            content_type=content_type,
+            path=path,
+        )
+        self._jobs[job.id] = job
+        return job
+
+    def run(self, job: ExportJob, stream: AsyncIterator[bytes], total: int | None = None) -> None:
+        """This method is used to run a job in the background.
+
+        :params job: a pending job.
+        :params stream: an export stream to write to the job file.
+        :params total: a number of objects of the export (for the progress of the job).
+        :return: None.
+        """
+        job.total = total
+        task = asyncio.create_task(self._run(job, stream))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, job: ExportJob, stream: AsyncIterator[bytes]) -> None:
+        job.status = ExportJobStatus.RUNNING
+        try:
+            with Path(job.path).open("wb") as output:
+                async for chunk in stream:
+                    await asyncio.to_thread(output.write, chunk)
+                    job.size += len(chunk)
+        except Exception:
+            logger.exception("Error exporting %s", job.model)
+            job.status = ExportJobStatus.FAILED
+            job.detail = f"Error exporting {job.model}."
+            self._remove_file(job)
+        else:
+            job.status = ExportJobStatus.DONE
+        finally:
+            job.expires_at = self.clock() + self.ttl
+
+    def get(self, job_id: str) -> ExportJob | None:
+        """This method is used to get a job which has not expired yet.
+
+        :params job_id: an id of the job.
+        :return: An export job or None.
+        """
+        self.cleanup()
+        return self._jobs.get(job_id)
+
+    def cleanup(self) -> None:
+        """This method is used to remove the expired jobs and their files.
+
+        :return: None.
+        """
+        now = self.clock()
+        for job in [job for job in self._jobs.values() if job.expires_at is not None and job.expires_at <= now]:
+            self._remove_file(job)
+            del self._jobs[job.id]
+
+    @staticmethod
+    def _remove_file(job: ExportJob) -> None:
+        Path(job.path).unlink(missing_ok=True)
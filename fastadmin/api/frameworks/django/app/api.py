@@ -1,5 +1,6 @@
 import json
 import logging
+import tempfile
 from dataclasses import asdict
 from datetime import datetime, time
 from functools import wraps
@@ -7,19 +8,29 @@ from typing import Any
 from uuid import UUID
 
 from django.core.files.uploadedfile import UploadedFile
+from django.core.handlers.asgi import ASGIRequest
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models.fields.files import FieldFile, ImageFieldFile
+from django.http import FileResponse, StreamingHttpResponse
 from django.http import JsonResponse as BaseJsonResponse
-from django.http import StreamingHttpResponse
 from django.http.request import HttpRequest
 
 from fastadmin.api.exceptions import AdminApiException
-from fastadmin.api.helpers import is_valid_id, parse_list_filters_from_query_params
+from fastadmin.api.helpers import (
+    aiter_file_range,
+    get_file_range_response,
+    get_list_response,
+    is_valid_id,
+    iter_file_range,
+    parse_fields_query_param,
+    parse_list_filters_from_query_params,
+)
 from fastadmin.api.schemas import (
     ExportInputSchema,
+    ExportJobSchema,
     SignInInputSchema,
 )
-from fastadmin.api.service import ApiService, get_user_id_from_session_id
+from fastadmin.api.service import ApiService
 from fastadmin.models.schemas import (
     ActionInputSchema,
     ActionResponseSchema,
@@ -31,6 +42,9 @@ from fastadmin.settings import settings
 logger = logging.getLogger(__name__)
 api_service = ApiService()
 
+# Size of an export held in memory before it is spooled to a temporary file.
+_EXPORT_SPOOL_MAX_SIZE = 1024 * 1024
+
 
 class JsonEncoder(DjangoJSONEncoder):
     def default(self, o):
@@ -137,15 +151,8 @@ async def me(request: HttpRequest) -> JsonResponse:
     if request.method != "GET":
         return JsonResponse({"detail": "Method not allowed"}, status=405)
     try:
-        user_id = await get_user_id_from_session_id(
-            request.COOKIES.get(settings.ADMIN_SESSION_ID_KEY, None),
-        )
-        if user_id is None:
-            raise AdminApiException(401, "User is not authenticated.")
-        obj = await api_service.get(
+        obj = await api_service.me(
             request.COOKIES.get(settings.ADMIN_SESSION_ID_KEY, None),
-            settings.ADMIN_USER_MODEL,
-            user_id,
             request=request,
         )
         return JsonResponse(obj)
@@ -164,6 +171,8 @@ async def list_objs(request: HttpRequest, model: str) -> JsonResponse:
     :params sort_by: a sort by string.
     :params offset: an offset.
     :params limit: a limit.
+    :params fields: a comma-separated list of fields to return.
+    :params cursor: a cursor of the page to return (cursor pagination).
     :return: A list of objects.
     """
     if request.method != "GET":
@@ -173,13 +182,14 @@ async def list_objs(request: HttpRequest, model: str) -> JsonResponse:
         sort_by = request.GET.get("sort_by") or None
         offset = int(request.GET.get("offset", 0))
         limit = int(request.GET.get("limit", 10))
+        fields = parse_fields_query_param(request.GET.get("fields"))
         list_filters = parse_list_filters_from_query_params(
             request.GET.keys,
             request.GET.getlist,
-            exclude={"search", "sort_by", "offset", "limit"},
+            exclude={"search", "sort_by", "offset", "limit", "fields", "cursor"},
         )
 
-        objs, total = await api_service.list(
+        result = await api_service.list(
             request.COOKIES.get(settings.ADMIN_SESSION_ID_KEY, None),
             model,
             search=search,
@@ -188,13 +198,10 @@ async def list_objs(request: HttpRequest, model: str) -> JsonResponse:
             offset=offset,
             limit=limit,
             request=request,
+            fields=fields,
+            cursor=request.GET.get("cursor") or None,
         )
-        return JsonResponse(
-            {
-                "total": total,
-                "results": objs,
-            }
-        )
+        return JsonResponse(get_list_response(result))
     except ValueError:
         return JsonResponse({"detail": "Invalid format of get parameters"}, status=422)
     except AdminApiException as e:
@@ -207,6 +214,7 @@ async def get(request: HttpRequest, model: str, id: UUID | int | str) -> JsonRes
 
     :params model: a name of model.
     :params id: an id of object.
+    :params fields: a comma-separated list of fields to return.
     :return: An object.
     """
     if request.method != "GET":
@@ -219,6 +227,7 @@ async def get(request: HttpRequest, model: str, id: UUID | int | str) -> JsonRes
             model,
             id,
             request=request,
+            fields=parse_fields_query_param(request.GET.get("fields")),
         )
         return JsonResponse(obj)
 
@@ -338,7 +347,7 @@ async def upload_file(
 
 
 @csrf_exempt
-async def export(request: HttpRequest, model: str) -> JsonResponse | StreamingHttpResponse:
+async def export(request: HttpRequest, model: str) -> JsonResponse | StreamingHttpResponse | FileResponse:
     """This method is used to export a list of objects.
 
     :params request: a request object.
@@ -359,7 +368,7 @@ async def export(request: HttpRequest, model: str) -> JsonResponse | StreamingHt
     )
     try:
         payload = _load_json_body(request, ExportInputSchema)
-        file_name, content_type, stream = await api_service.export(
+        export = await api_service.export(
             request.COOKIES.get(settings.ADMIN_SESSION_ID_KEY, None),
             model,
             payload,
@@ -367,8 +376,22 @@ async def export(request: HttpRequest, model: str) -> JsonResponse | StreamingHt
             sort_by=sort_by,
             filters=list_filters,
             request=request,
+            # under WSGI the event loop of an async view ends with the request
+            background_jobs=isinstance(request, ASGIRequest),
         )
-        response = StreamingHttpResponse(stream, content_type=content_type)
+        if isinstance(export, ExportJobSchema):
+            return JsonResponse(asdict(export), status=202)
+        file_name, content_type, stream = export
+        if isinstance(request, ASGIRequest):
+            response = StreamingHttpResponse(stream, content_type=content_type)
+        else:
+            # WSGI collects an async iterator into memory before it sends the body, so the export
+            # stream is spooled (to disk past _EXPORT_SPOOL_MAX_SIZE) and the file is streamed back.
+            spool = tempfile.SpooledTemporaryFile(max_size=_EXPORT_SPOOL_MAX_SIZE)  # noqa: SIM115
+            async for chunk in stream:
+                spool.write(chunk)
+            spool.seek(0)
+            response = FileResponse(spool, content_type=content_type)
         response.headers["Content-Disposition"] = f'attachment; filename="{file_name}"'
         return response
 
@@ -376,6 +399,56 @@ async def export(request: HttpRequest, model: str) -> JsonResponse | StreamingHt
         return JsonResponse({"detail": e.detail}, status=e.status_code)
 
 
+@csrf_exempt
+async def export_job(request: HttpRequest, id: str) -> JsonResponse:
+    """This method is used to get the progress of a background export job.
+
+    :params request: a request object.
+    :params id: an id of export job.
+    :return: An export job.
+    """
+    if request.method != "GET":
+        return JsonResponse({"detail": "Method not allowed"}, status=405)
+    try:
+        job = await api_service.export_job(request.COOKIES.get(settings.ADMIN_SESSION_ID_KEY, None), id)
+        return JsonResponse(asdict(job))
+    except AdminApiException as e:
+        return JsonResponse({"detail": e.detail}, status=e.status_code)
+
+
+@csrf_exempt
+async def download_export_job(request: HttpRequest, id: str) -> JsonResponse | StreamingHttpResponse:
+    """This method is used to download the file of a done export job (supports Range requests).
+
+    :params request: a request object.
+    :params id: an id of export job.
+    :return: A stream of export data.
+    """
+    if request.method != "GET":
+        return JsonResponse({"detail": "Method not allowed"}, status=405)
+    try:
+        job, byte_range = await api_service.download_export_job(
+            request.COOKIES.get(settings.ADMIN_SESSION_ID_KEY, None),
+            id,
+            range_header=request.headers.get("Range"),
+        )
+        status_code, headers, start, end = get_file_range_response(job.file_name, job.size, byte_range)
+        # ASGI buffers a sync iterator in full before it sends the body, WSGI does the same with an async one
+        blocks = (
+            aiter_file_range(job.path, start, end)
+            if isinstance(request, ASGIRequest)
+            else iter_file_range(job.path, start, end)
+        )
+        return StreamingHttpResponse(
+            blocks,
+            status=status_code,
+            headers=headers,
+            content_type=job.content_type,
+        )
+    except AdminApiException as e:
+        return JsonResponse({"detail": e.detail}, status=e.status_code)
+
+
 @csrf_exempt
 async def delete(
     request: HttpRequest,
@@ -12,7 +12,9 @@ from .api import (
     change_password,
     configuration,
     delete,
+    download_export_job,
     export,
+    export_job,
     get,
     list_objs,
     me,
@@ -38,6 +40,8 @@ def get_admin_urls():
             path("api/change/<str:model>/<str:id>", change),
             path("api/upload-file/<str:model>/<str:field_name>", upload_file),
             path("api/export/<str:model>", export),
+            path("api/export-jobs/<str:id>", export_job),
+            path("api/export-jobs/<str:id>/download", download_export_job),
             path("api/delete/<str:model>/<str:id>", delete),
             path("api/action/<str:model>/<str:action>", action),
             path("api/widget-action/<str:model>/<str:widget_action>", widget_action),
@@ -5,15 +5,22 @@ from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.datastructures import UploadFile
-from fastapi.responses import Response, StreamingResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 
 from fastadmin.api.exceptions import AdminApiException
-from fastadmin.api.helpers import parse_list_filters_from_query_params
+from fastadmin.api.helpers import (
+    get_file_range_response,
+    get_list_response,
+    iter_file_range,
+    parse_fields_query_param,
+    parse_list_filters_from_query_params,
+)
 from fastadmin.api.schemas import (
     ExportInputSchema,
+    ExportJobSchema,
     SignInInputSchema,
 )
-from fastadmin.api.service import ApiService, get_user_id_from_session_id
+from fastadmin.api.service import ApiService
 from fastadmin.models.schemas import (
     ActionInputSchema,
     ActionResponseSchema,
@@ -90,15 +97,8 @@ async def me(
     :return: A user object.
     """
     try:
-        user_id = await get_user_id_from_session_id(
-            request.cookies.get(settings.ADMIN_SESSION_ID_KEY, None),
-        )
-        if not user_id:
-            raise AdminApiException(401, "User is not authenticated.")
-        return await api_service.get(
+        return await api_service.me(
             request.cookies.get(settings.ADMIN_SESSION_ID_KEY, None),
-            settings.ADMIN_USER_MODEL,
-            user_id,
             request=request,
         )
     except AdminApiException as e:
@@ -113,6 +113,8 @@ async def list_objs(
     sort_by: str | None = None,
     offset: int | None = 0,
     limit: int | None = 10,
+    fields: str | None = None,
+    cursor: str | None = None,
 ):
     """This method is used to get a list of objects.
 
@@ -122,15 +124,17 @@ async def list_objs(
     :params sort_by: a sort by string.
     :params offset: an offset.
     :params limit: a limit.
+    :params fields: a comma-separated list of fields to return.
+    :params cursor: a cursor of the page to return (cursor pagination).
     :return: A list of objects.
     """
     try:
         list_filters = parse_list_filters_from_query_params(
             request.query_params.keys,
             request.query_params.getlist,
-            exclude={"search", "sort_by", "offset", "limit"},
+            exclude={"search", "sort_by", "offset", "limit", "fields", "cursor"},
         )
-        objs, total = await api_service.list(
+        result = await api_service.list(
             request.cookies.get(settings.ADMIN_SESSION_ID_KEY, None),
             model,
             search=search,
@@ -139,11 +143,10 @@ async def list_objs(
             offset=offset,
             limit=limit,
             request=request,
+            fields=parse_fields_query_param(fields),
+            cursor=cursor,
         )
-        return {
-            "total": total,
-            "results": objs,
-        }
+        return get_list_response(result)
     except AdminApiException as e:
         raise HTTPException(e.status_code, detail=e.detail) from None
 
@@ -153,11 +156,13 @@ async def get(
     request: Request,
     model: str,
     id: UUID | int | str,
+    fields: str | None = None,
 ) -> Any:
     """This method is used to get an object.
 
     :params model: a name of model.
     :params id: an id of object.
+    :params fields: a comma-separated list of fields to return.
     :return: An object.
     """
     try:
@@ -166,6 +171,7 @@ async def get(
             model,
             id,
             request=request,
+            fields=parse_fields_query_param(fields),
         )
     except AdminApiException as e:
         raise HTTPException(e.status_code, detail=e.detail) from None
@@ -302,7 +308,7 @@ async def export(
             request.query_params.getlist,
             exclude={"search", "sort_by", "offset", "limit"},
         )
-        file_name, content_type, stream = await api_service.export(
+        export = await api_service.export(
             request.cookies.get(settings.ADMIN_SESSION_ID_KEY, None),
             model,
             payload,
@@ -311,6 +317,9 @@ async def export(
             filters=list_filters,
             request=request,
         )
+        if isinstance(export, ExportJobSchema):
+            return JSONResponse(asdict(export), status_code=202)
+        file_name, content_type, stream = export
         headers = {"Content-Disposition": f'attachment; filename="{file_name}"'}
         return StreamingResponse(
             stream,  # ty: ignore[invalid-argument-type]
@@ -321,6 +330,51 @@ async def export(
         raise HTTPException(e.status_code, detail=e.detail) from None
 
 
+@router.get("/export-jobs/{id}")
+async def export_job(
+    request: Request,
+    id: str,
+) -> dict:
+    """This method is used to get the progress of a background export job.
+
+    :params request: a request object.
+    :params id: an id of export job.
+    :return: An export job.
+    """
+    try:
+        return asdict(await api_service.export_job(request.cookies.get(settings.ADMIN_SESSION_ID_KEY, None), id))
+    except AdminApiException as e:
+        raise HTTPException(e.status_code, detail=e.detail) from None
+
+
+@router.get("/export-jobs/{id}/download")
+async def download_export_job(
+    request: Request,
+    id: str,
+):
+    """This method is used to download the file of a done export job (supports Range requests).
+
+    :params request: a request object.
+    :params id: an id of export job.
+    :return: A stream of export data.
+    """
+    try:
+        job, byte_range = await api_service.download_export_job(
+            request.cookies.get(settings.ADMIN_SESSION_ID_KEY, None),
+            id,
+            range_header=request.headers.get("range"),
+        )
+        status_code, headers, start, end = get_file_range_response(job.file_name, job.size, byte_range)
+        return StreamingResponse(
+            iter_file_range(job.path, start, end),
+            status_code=status_code,
+            headers=headers,
+            media_type=job.content_type,
+        )
+    except AdminApiException as e:
+        raise HTTPException(e.status_code, detail=e.detail) from None
+
+
 @router.delete("/delete/{model}/{id}")
 async def delete(
     request: Request,
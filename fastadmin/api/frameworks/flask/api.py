@@ -1,17 +1,28 @@
 import logging
+import tempfile
+from collections.abc import AsyncIterator
 from dataclasses import asdict
+from typing import cast
 from uuid import UUID
 
 from flask import Blueprint, Response, make_response, request
 from werkzeug.exceptions import HTTPException
+from werkzeug.wsgi import wrap_file
 
 from fastadmin.api.exceptions import AdminApiException
-from fastadmin.api.helpers import is_valid_id, parse_list_filters_from_query_params
+from fastadmin.api.helpers import (
+    get_file_range_response,
+    get_list_response,
+    is_valid_id,
+    iter_file_range,
+    parse_fields_query_param,
+    parse_list_filters_from_query_params,
+)
 from fastadmin.api.schemas import (
     ExportInputSchema,
     SignInInputSchema,
 )
-from fastadmin.api.service import ApiService, get_user_id_from_session_id
+from fastadmin.api.service import ApiService
 from fastadmin.models.schemas import (
     ActionInputSchema,
     ActionResponseSchema,
@@ -24,6 +35,9 @@ logger = logging.getLogger(__name__)
 api_router = Blueprint("api_router", __name__, url_prefix="/api")
 api_service = ApiService()
 
+# Size of an export held in memory before it is spooled to a temporary file.
+_EXPORT_SPOOL_MAX_SIZE = 1024 * 1024
+
 
 @api_router.route("/sign-in", methods=["POST"])
 async def sign_in() -> Response:
@@ -84,15 +98,8 @@ async def me() -> dict:
     :return: A user object.
     """
     try:
-        user_id = await get_user_id_from_session_id(
+        return await api_service.me(
             request.cookies.get(settings.ADMIN_SESSION_ID_KEY, None),
-        )
-        if not user_id:
-            raise AdminApiException(401, "User is not authenticated.")
-        return await api_service.get(
-            request.cookies.get(settings.ADMIN_SESSION_ID_KEY, None),
-            settings.ADMIN_USER_MODEL,
-            user_id,
             request=request,
         )
     except AdminApiException as e:
@@ -111,6 +118,8 @@ async def list_objs(model: str) -> dict:
     :params sort_by: a sort by string.
     :params offset: an offset.
     :params limit: a limit.
+    :params fields: a comma-separated list of fields to return.
+    :params cursor: a cursor of the page to return (cursor pagination).
     :return: A list of objects.
     """
     try:
@@ -118,12 +127,13 @@ async def list_objs(model: str) -> dict:
         sort_by = request.args.get("sort_by") or None
         offset = int(request.args.get("offset", 0))
         limit = int(request.args.get("limit", 10))
+        fields = parse_fields_query_param(request.args.get("fields"))
         list_filters = parse_list_filters_from_query_params(
             request.args.keys,
             request.args.getlist,
-            exclude={"search", "sort_by", "offset", "limit"},
+            exclude={"search", "sort_by", "offset", "limit", "fields", "cursor"},
         )
-        objs, total = await api_service.list(
+        result = await api_service.list(
             request.cookies.get(settings.ADMIN_SESSION_ID_KEY, None),
             model,
             search=search,
@@ -132,11 +142,10 @@ async def list_objs(model: str) -> dict:
             offset=offset,
             limit=limit,
             request=request,
+            fields=fields,
+            cursor=request.args.get("cursor") or None,
         )
-        return {
-            "total": total,
-            "results": objs,
-        }
+        return get_list_response(result)
     except ValueError as e:
         http_exception = HTTPException("Invalid format of get parameters")
         http_exception.code = 422
@@ -153,6 +162,7 @@ async def get(model: str, id: UUID | int | str) -> dict:
 
     :params model: a name of model.
     :params id: an id of object.
+    :params fields: a comma-separated list of fields to return.
     :return: An object.
     """
     if not is_valid_id(id):
@@ -165,6 +175,7 @@ async def get(model: str, id: UUID | int | str) -> dict:
             model,
             id,
             request=request,
+            fields=parse_fields_query_param(request.args.get("fields")),
         )
     except AdminApiException as e:
         http_exception = HTTPException(e.detail)
@@ -310,7 +321,7 @@ async def export(model: str) -> Response:
     try:
         request_payload: dict = request.json
         payload: ExportInputSchema = ExportInputSchema(**request_payload)
-        file_name, content_type, stream = await api_service.export(
+        export = await api_service.export(
             request.cookies.get(settings.ADMIN_SESSION_ID_KEY, None),
             model,
             payload,
@@ -318,8 +329,17 @@ async def export(model: str) -> Response:
             sort_by=sort_by,
             filters=list_filters,
             request=request,
+            # the event loop of an async Flask view ends with the request
+            background_jobs=False,
         )
-        response = Response(stream, mimetype=content_type)
+        file_name, content_type, stream = cast(tuple[str, str, AsyncIterator[bytes] | None], export)
+        # Flask finishes an async view before it sends the body, so the export stream is spooled
+        # (to disk past _EXPORT_SPOOL_MAX_SIZE) and the file is streamed back.
+        spool = tempfile.SpooledTemporaryFile(max_size=_EXPORT_SPOOL_MAX_SIZE)  # noqa: SIM115
+        async for chunk in stream:
+            spool.write(chunk)
+        spool.seek(0)
+        response = Response(wrap_file(request.environ, spool), mimetype=content_type, direct_passthrough=True)
         response.headers["Content-Disposition"] = f'attachment; filename="{file_name}"'
         return response
     except AdminApiException as e:
@@ -328,6 +348,48 @@ async def export(model: str) -> Response:
         raise http_exception from e
 
 
+@api_router.route("/export-jobs/<string:id>", methods=["GET"])
+async def export_job(id: str) -> dict:
+    """This method is used to get the progress of a background export job.
+
+    :params id: an id of export job.
+    :return: An export job.
+    """
+    try:
+        return asdict(await api_service.export_job(request.cookies.get(settings.ADMIN_SESSION_ID_KEY, None), id))
+    except AdminApiException as e:
+        http_exception = HTTPException(e.detail)
+        http_exception.code = e.status_code
+        raise http_exception from e
+
+
+@api_router.route("/export-jobs/<string:id>/download", methods=["GET"])
+async def download_export_job(id: str) -> Response:
+    """This method is used to download the file of a done export job (supports Range requests).
+
+    :params id: an id of export job.
+    :return: A stream of export data.
+    """
+    try:
+        job, byte_range = await api_service.download_export_job(
+            request.cookies.get(settings.ADMIN_SESSION_ID_KEY, None),
+            id,
+            range_header=request.headers.get("Range"),
+        )
+        status_code, headers, start, end = get_file_range_response(job.file_name, job.size, byte_range)
+        return Response(
+            iter_file_range(job.path, start, end),
+            status=status_code,
+            headers=headers,
+            mimetype=job.content_type,
+            direct_passthrough=True,
+        )
+    except AdminApiException as e:
+        http_exception = HTTPException(e.detail)
+        http_exception.code = e.status_code
+        raise http_exception from e
+
+
 @api_router.route("/delete/<string:model>/<string:id>", methods=["DELETE"])  # ty: ignore[invalid-argument-type]
 async def delete(
     model: str,
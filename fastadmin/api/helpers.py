@@ -1,7 +1,10 @@
+import asyncio
+from collections.abc import AsyncIterator, Iterator
 from pathlib import Path
 from uuid import UUID
 
-from fastadmin.models.schemas import ModelFieldWidgetSchema, WidgetType
+from fastadmin.api.exceptions import AdminApiException
+from fastadmin.models.schemas import ListResult, ModelFieldWidgetSchema, WidgetType
 
 # Text-like filter widgets whose values are free-form strings. For these the
 # literals "true"/"false"/"null" are legitimate content and must NOT be coerced
@@ -81,6 +84,117 @@ def parse_list_filters_from_query_params(keys_fn, getlist_fn, exclude: set[str])
     return result
 
 
+def parse_fields_query_param(value: str | None) -> list[str] | None:
+    """Parse the ``fields`` query param (a comma-separated sparse fieldset).
+
+    :param value: A raw query param value (e.g. "id,name").
+    :return: A list of field names, or None to serialize all fields.
+    """
+    if not value:
+        return None
+    return [field.strip() for field in value.split(",") if field.strip()] or None
+
+
+def get_list_response(result: ListResult) -> dict:
+    """Build the list response body.
+
+    :param result: A list page result.
+    :return: A dict with total, its flags, has_next, cursors and results.
+    """
+    return {
+        "total": result.total,
+        "total_is_approximate": result.total_is_approximate,
+        "total_is_capped": result.total_is_capped,
+        "has_next": result.has_next,
+        "next_cursor": result.next_cursor,
+        "prev_cursor": result.prev_cursor,
+        "results": result.results,
+    }
+
+
+def parse_range_header(value: str | None, size: int) -> tuple[int, int] | None:
+    """Parse a single byte range of a Range header.
+
+    :param value: A raw Range header value (e.g. "bytes=100-", "bytes=-500").
+    :param size: A size of the content.
+    :return: A tuple of the first and last byte positions, or None to send the whole content
+        (no, several or malformed ranges).
+    """
+    if not value or not value.startswith("bytes=") or "," in value:
+        return None
+    first, separator, last = value.removeprefix("bytes=").strip().partition("-")
+    if not separator or not (first or last):
+        return None
+    try:
+        if first:
+            start, end = int(first), int(last) if last else size - 1
+        else:
+            start, end = max(size - int(last), 0), size - 1
+    except ValueError:
+        return None
+    if start >= size:
+        raise AdminApiException(416, detail="Requested range not satisfiable.")
+    if start > end:
+        return None
+    return start, min(end, size - 1)
+
+
+def get_file_range_response(
+    file_name: str, size: int, byte_range: tuple[int, int] | None
+) -> tuple[int, dict, int, int]:
+    """Build the status and headers of a file download response.
+
+    :param file_name: A name of the file.
+    :param size: A size of the file.
+    :param byte_range: A requested byte range (see parse_range_header) or None for the whole file.
+    :return: A tuple of status code, headers and the first and last byte positions to send.
+    """
+    start, end = byte_range or (0, size - 1)
+    headers = {
+        "Content-Disposition": f'attachment; filename="{file_name}"',
+        "Accept-Ranges": "bytes",
+        "Content-Length": str(end - start + 1),
+    }
+    if byte_range is None:
+        return 200, headers, start, end
+    headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    return 206, headers, start, end
+
+
+def iter_file_range(path: str, start: int, end: int, block_size: int = 64 * 1024) -> Iterator[bytes]:
+    """Read a byte range of a file in blocks.
+
+    :param path: A path of the file.
+    :param start: A first byte position.
+    :param end: A last byte position.
+    :param block_size: A size of the blocks.
+    :return: An iterator of bytes.
+    """
+    with Path(path).open("rb") as file:
+        file.seek(start)
+        remaining = end - start + 1
+        while remaining > 0 and (block := file.read(min(block_size, remaining))):
+            remaining -= len(block)
+            yield block
+
+
+async def aiter_file_range(path: str, start: int, end: int, block_size: int = 64 * 1024) -> AsyncIterator[bytes]:
+    """Read a byte range of a file in blocks on a worker thread (for ASGI responses).
+
+    :param path: A path of the file.
+    :param start: A first byte position.
+    :param end: A last byte position.
+    :param block_size: A size of the blocks.
+    :return: An async iterator of bytes.
+    """
+    blocks = iter_file_range(path, start, end, block_size)
+    try:
+        while (block := await asyncio.to_thread(next, blocks, None)) is not None:
+            yield block
+    finally:
+        blocks.close()
+
+
 def sanitize_filter_key(key: str, fields: list[ModelFieldWidgetSchema]) -> tuple[str, str]:
     """Sanitize key.
 
@@ -116,11 +230,12 @@ def build_query_filters(
     :return: sanitized filters dict.
     """
     result: dict[tuple[str, str], bool | None | str | list] = {}
+    fields_by_name = {f.name: f for f in fields}
     for key, value in filters.items():
         if key in exclude:
             continue
         field_name = key.partition("__")[0]
-        field = next((f for f in fields if f.name == field_name), None)
+        field = fields_by_name.get(field_name)
         sanitized_key = sanitize_filter_key(key, fields)
         result[sanitized_key] = sanitize_filter_value(value, field, sanitized_key[1])
     return result
@@ -7,6 +7,18 @@ class ExportFormat(str, Enum):
 
     CSV = "CSV"
     JSON = "JSON"
+    NDJSON = "NDJSON"
+    XLSX = "XLSX"
+    PARQUET = "PARQUET"
+
+
+class ExportJobStatus(str, Enum):
+    """Export job status"""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
 
 
 @dataclass
@@ -18,6 +30,8 @@ class ListQuerySchema:
     sort_by: str | None = None
     search: str | None = None
     filters: dict[str, str | list[str]] | None = None
+    fields: list[str] | None = None
+    cursor: str | None = None
 
 
 @dataclass
@@ -43,3 +57,17 @@ class ExportInputSchema:
     format: ExportFormat | None = ExportFormat.CSV
     limit: int | None = 1000
     offset: int | None = 0
+    gzip: bool = False
+
+
+@dataclass
+class ExportJobSchema:
+    """Export job schema"""
+
+    id: str
+    status: ExportJobStatus
+    file_name: str
+    rows: int
+    total: int | None
+    size: int
+    detail: str | None = None
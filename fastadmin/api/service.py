@@ -1,24 +1,30 @@
+import copy
+import hashlib
 import inspect
 import logging
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Iterable, Sequence
 from datetime import UTC, datetime, timedelta
-from io import BytesIO, StringIO
 from typing import Any, cast
 from uuid import UUID
 
 import jwt
 from asgiref.sync import sync_to_async
 
+from fastadmin.api.cache import TTLCache
 from fastadmin.api.exceptions import AdminApiException
-from fastadmin.api.helpers import build_query_filters
+from fastadmin.api.export_jobs import ExportJob, ExportJobManager
+from fastadmin.api.helpers import build_query_filters, parse_range_header
 from fastadmin.api.schemas import (
     ChangePasswordInputSchema,
     ExportFormat,
     ExportInputSchema,
+    ExportJobSchema,
+    ExportJobStatus,
     ListQuerySchema,
     SignInInputSchema,
 )
-from fastadmin.models.base import InlineModelAdmin, ModelAdmin
+from fastadmin.api.sessions import SessionStore, create_session_store
+from fastadmin.models.base import InlineModelAdmin, ModelAdmin, accepts_keyword, gzip_export_stream
 from fastadmin.models.helpers import (
     generate_models_schema,
     get_admin_model,
@@ -29,6 +35,8 @@ from fastadmin.models.schemas import (
     ActionInputSchema,
     ActionResponseSchema,
     ConfigurationSchema,
+    ListResult,
+    ModelFieldWidgetSchema,
     ModelSchema,
     WidgetActionInputSchema,
     WidgetActionResponseSchema,
@@ -46,19 +54,33 @@ def is_allowed_field_or_path(field: str, allowed_fields: set[str]) -> bool:
     return base_field in allowed_fields
 
 
-async def get_user_id_from_session_id(session_id: str | None) -> UUID | int | None:
-    """This method is used to get user id from session_id.
+def get_admin_model_fields(admin_model: Any) -> list[ModelFieldWidgetSchema]:
+    """Model fields of an admin, from its cached metadata when available."""
+    get_model_fields_metadata = getattr(admin_model, "get_model_fields_metadata", None)
+    if get_model_fields_metadata is None:
+        return admin_model.get_model_fields_with_widget_types()
+    return get_model_fields_metadata().fields
+
+
+def get_authenticated_user_cache_key(user_id: UUID | int | str, session_id: str | None) -> tuple[str, str]:
+    """This method is used to get the key of a session in authenticated_user_cache.
+
+    :param user_id: A user id.
+    :param session_id: A session id (only its hash is kept).
+    :return: A tuple of the user id and the session id hash.
+    """
+    return str(user_id), hashlib.sha256((session_id or "").encode()).hexdigest()
+
+
+def decode_session_id(session_id: str | None) -> dict | None:
+    """This method is used to verify a session id and get its payload.
 
     :param session_id: A session id.
-    :return: A user id or None.
+    :return: A payload of a valid and not expired session id or None.
     """
     if not session_id:
         return None
 
-    admin_model = get_admin_model(settings.ADMIN_USER_MODEL)
-    if not admin_model:
-        return None
-
     # An empty/unset secret makes HS256 signatures trivially forgeable, so refuse
     # to validate any token rather than accept one signed with a blank key.
     if not settings.ADMIN_SECRET_KEY:
@@ -76,29 +98,101 @@ async def get_user_id_from_session_id(session_id: str | None) -> UUID | int | No
     if datetime.fromisoformat(session_expired_at).replace(tzinfo=UTC) < datetime.now(UTC):
         return None
 
+    return token_payload
+
+
+async def get_user_id_from_session_id(session_id: str | None, check_user: bool = True) -> UUID | int | None:
+    """This method is used to get user id from session_id.
+
+    With a session store, the session is looked up in it. Otherwise the user is looked up with
+    orm_get_obj (not serialized), unless the session is in authenticated_user_cache or check_user is False.
+
+    :param session_id: A session id.
+    :param check_user: Whether the user is looked up without a session store (False for callers reading it anyway).
+    :return: A user id or None.
+    """
+    admin_model = get_admin_model(settings.ADMIN_USER_MODEL)
+    if not admin_model:
+        return None
+
+    token_payload = decode_session_id(session_id)
+    if token_payload is None:
+        return None
+
     user_id = token_payload.get("user_id")
     if user_id is None:
         return None
 
-    if not await admin_model.get_obj(user_id):
+    if session_store is not None:
+        # deleting a user through the admin revokes its sessions (see ApiService.delete)
+        session_key = token_payload.get("session_key")
+        if not session_key or not await session_store.exists(str(user_id), session_key):
+            return None
+        return user_id
+
+    if (
+        not check_user
+        or authenticated_user_cache.get(get_authenticated_user_cache_key(user_id, session_id)) is not None
+    ):
+        return user_id
+
+    if not await admin_model.orm_get_obj(user_id):
         return None
 
     return user_id
 
 
+# Serialized signed-in users keyed by (user id, session id hash), see ADMIN_USER_CACHE_TTL.
+authenticated_user_cache = TTLCache(maxsize=settings.ADMIN_USER_CACHE_SIZE, ttl=settings.ADMIN_USER_CACHE_TTL)
+
+# Server-side sessions, see ADMIN_SESSION_STORE (None for stateless sessions).
+# Assign another SessionStore (e.g. a subclass for another backend) to plug it in.
+session_store: SessionStore | None = create_session_store(
+    settings.ADMIN_SESSION_STORE,
+    settings.ADMIN_SESSION_STORE_URL,
+    ttl=settings.ADMIN_SESSION_EXPIRED_AT,
+    max_sessions_per_user=settings.ADMIN_SESSION_MAX_PER_USER,
+    maxsize=settings.ADMIN_SESSION_STORE_SIZE,
+)
+
+
+# Totals of list queries keyed by (model, user id, search, filters), see ADMIN_LIST_TOTAL_CACHE_TTL.
+# Shared by the api services of all frameworks, so a change made through any of them drops the totals of its model.
+list_total_cache = TTLCache(maxsize=settings.ADMIN_LIST_TOTAL_CACHE_SIZE, ttl=settings.ADMIN_LIST_TOTAL_CACHE_TTL)
+
+# Anchor indexes of list queries keyed by (model, user id, search, filters, sort by, limit), see list_anchor_pages.
+list_anchor_cache = TTLCache(maxsize=settings.ADMIN_LIST_ANCHOR_CACHE_SIZE, ttl=settings.ADMIN_LIST_ANCHOR_CACHE_TTL)
+
+# Background export jobs, see ADMIN_EXPORT_JOB_THRESHOLD.
+export_jobs = ExportJobManager(directory=settings.ADMIN_EXPORT_JOB_DIR, ttl=settings.ADMIN_EXPORT_JOB_TTL)
+
+
 # Filter lookups a request may use. Anything else (e.g. regex, startswith, or a
 # relation-spanning "groups__name__icontains") is rejected so it cannot become a
 # side-channel oracle over columns the admin never displays.
 ALLOWED_FILTER_CONDITIONS = frozenset({"exact", "in", "lt", "lte", "gt", "gte", "contains", "icontains"})
 
 
+# Content types of the export formats (the file extension is the lowercased format).
+EXPORT_CONTENT_TYPES = {
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.JSON: "text/plain",
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.XLSX: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ExportFormat.PARQUET: "application/vnd.apache.parquet",
+}
+# XLSX and Parquet files are compressed already
+GZIP_EXPORT_FORMATS = (ExportFormat.CSV, ExportFormat.JSON, ExportFormat.NDJSON)
+
+
 class ApiService:
     @staticmethod
-    def _clamp_query_limits(query_params: ListQuerySchema) -> None:
+    def _clamp_query_limits(query_params: ListQuerySchema, max_limit: int | None = None) -> None:
         """Bound offset/limit so a crafted request cannot dump/DoS a table."""
         if query_params.offset is None or query_params.offset < 0:
             query_params.offset = 0
-        max_limit = settings.ADMIN_QUERY_MAX_LIMIT
+        if max_limit is None:
+            max_limit = settings.ADMIN_QUERY_MAX_LIMIT
         if query_params.limit is None or query_params.limit < 0 or query_params.limit > max_limit:
             query_params.limit = max_limit
 
@@ -114,7 +208,7 @@ class ApiService:
         """
         list_filter = getattr(admin_model, "list_filter", ())
         allowlist = set(list_filter) if list_filter else fields
-        m2m_fields = {f.name for f in admin_model.get_model_fields_with_widget_types() if f.is_m2m}
+        m2m_fields = {f.name for f in get_admin_model_fields(admin_model) if f.is_m2m}
         for k in filters:
             if k in exclude_filter_fields:
                 continue
@@ -126,6 +220,13 @@ class ApiService:
             if field in m2m_fields and condition and condition not in ("exact", "in"):
                 raise AdminApiException(422, detail=f"Filter by {k} is not allowed")
 
+    @staticmethod
+    def _validate_fields(requested_fields: Sequence[str], fields: set) -> None:
+        """Validate a sparse fieldset against the serialized field set."""
+        for field in requested_fields:
+            if field not in fields:
+                raise AdminApiException(422, detail=f"Field {field} is not allowed")
+
     @staticmethod
     def _bind_admin_context(
         admin_model: ModelAdmin | InlineModelAdmin | Any, request: Any | None, user: Any | None
@@ -134,18 +235,40 @@ class ApiService:
             admin_model.set_context(request=request, user=user)
 
     async def _get_authenticated_user(self, session_id: str | None) -> tuple[UUID | int, Any | None]:
-        current_user_id = await get_user_id_from_session_id(session_id)
+        # on a cache miss the user is read below, which also checks that it exists
+        current_user_id = await get_user_id_from_session_id(session_id, check_user=False)
         if not current_user_id:
             raise AdminApiException(401, detail="User is not authenticated.")
 
+        cache_key = get_authenticated_user_cache_key(current_user_id, session_id)
+        current_user = authenticated_user_cache.get(cache_key)
+        if current_user is not None:
+            # every request gets its own copy, so a request changing the user does not change the cache
+            return current_user_id, copy.deepcopy(current_user)
+
         admin_user_model = get_admin_model(settings.ADMIN_USER_MODEL)
-        current_user = (
-            await admin_user_model.get_obj(current_user_id)
-            if admin_user_model and hasattr(admin_user_model, "get_obj")
-            else None
-        )
+        if not admin_user_model or not hasattr(admin_user_model, "get_obj"):
+            return current_user_id, None
+        current_user = await admin_user_model.get_obj(current_user_id)
+        if current_user is None:
+            raise AdminApiException(401, detail="User is not authenticated.")
+        authenticated_user_cache.set(cache_key, copy.deepcopy(current_user))
         return current_user_id, current_user
 
+    @staticmethod
+    def _invalidate_authenticated_users(model: str, ids: Iterable[UUID | int | str]) -> None:
+        """Drop the cached sessions of users after they were (possibly) changed or deleted."""
+        if model != settings.ADMIN_USER_MODEL:
+            return
+        user_ids = {str(user_id) for user_id in ids}
+        authenticated_user_cache.delete_matching(lambda key: key[0] in user_ids)
+
+    @staticmethod
+    def _invalidate_list_caches(model: str) -> None:
+        """Drop the cached list totals and anchors of a model after its objects were (possibly) changed."""
+        list_total_cache.delete_matching(lambda key: key[0] == model)
+        list_anchor_cache.delete_matching(lambda key: key[0] == model)
+
     @staticmethod
     async def _require_permission(admin_model: Any, permission: str, user_id: UUID | int | None) -> None:
         """Enforce a model-admin permission hook server-side.
@@ -189,24 +312,34 @@ class ApiService:
         session_expired_at = now + timedelta(seconds=settings.ADMIN_SESSION_EXPIRED_AT)
         if isinstance(user_id, UUID):
             user_id = str(user_id)
-        return jwt.encode(
-            {
-                "user_id": user_id,
-                "session_expired_at": session_expired_at.isoformat(),
-            },
-            settings.ADMIN_SECRET_KEY,
-            algorithm="HS256",
-        )
+        token_payload = {
+            "user_id": user_id,
+            "session_expired_at": session_expired_at.isoformat(),
+        }
+        if session_store is not None:
+            token_payload["session_key"] = await session_store.create(str(user_id))
+        return jwt.encode(token_payload, settings.ADMIN_SECRET_KEY, algorithm="HS256")
 
     async def sign_out(
         self,
         session_id: str | None,
         request: Any | None = None,
     ) -> bool:
-        _current_user_id, _current_user = await self._get_authenticated_user(session_id)
+        current_user_id, _current_user = await self._get_authenticated_user(session_id)
 
+        authenticated_user_cache.delete(get_authenticated_user_cache_key(current_user_id, session_id))
+        if session_store is not None:
+            # the session was found in the store, so its (valid) payload holds a session key
+            token_payload = cast(dict, decode_session_id(session_id))
+            await session_store.delete(str(current_user_id), token_payload["session_key"])
         return True
 
+    async def me(self, session_id: str | None, request: Any | None = None) -> dict:
+        _current_user_id, current_user = await self._get_authenticated_user(session_id)
+        if current_user is None:
+            raise AdminApiException(404, detail=f"{settings.ADMIN_USER_MODEL} not found.")
+        return current_user
+
     async def list(
         self,
         session_id: str | None,
@@ -217,8 +350,10 @@ class ApiService:
         offset: int | None = 0,
         limit: int | None = 10,
         request: Any | None = None,
-    ) -> tuple[list[dict], int]:
-        _current_user_id, current_user = await self._get_authenticated_user(session_id)
+        fields: Sequence[str] | None = None,
+        cursor: str | None = None,
+    ) -> ListResult:
+        current_user_id, current_user = await self._get_authenticated_user(session_id)
 
         query_params = ListQuerySchema(
             search=search,
@@ -226,6 +361,8 @@ class ApiService:
             filters=filters or {},
             offset=offset,
             limit=limit,
+            fields=list(fields) if fields is not None else None,
+            cursor=cursor,
         )
         self._clamp_query_limits(query_params)
 
@@ -242,16 +379,25 @@ class ApiService:
                 if not is_allowed_field_or_path(field, fields):
                     raise AdminApiException(422, detail=f"Search by {field} is not allowed")
 
-        exclude_filter_fields = ("search", "sort_by", "offset", "limit")
+        exclude_filter_fields = ("search", "sort_by", "offset", "limit", "fields", "cursor")
         query_filters: dict[tuple[str, str], bool | str | None | list] | None = None
         if query_params.filters:
             self._validate_filters(admin_model, query_params.filters, exclude_filter_fields, fields)
             query_filters = build_query_filters(
                 query_params.filters,
-                admin_model.get_model_fields_with_widget_types(),
+                get_admin_model_fields(admin_model),
                 exclude_filter_fields,
             )
 
+        # sparse fieldset and cursor: only passed on when requested, so get_list
+        # overrides without the arguments keep working
+        list_kwargs: dict[str, Any] = {}
+        if query_params.fields is not None:
+            self._validate_fields(query_params.fields, fields)
+            list_kwargs["fields"] = query_params.fields
+        if query_params.cursor:
+            list_kwargs["cursor"] = query_params.cursor
+
         if query_params.sort_by:
             if query_params.sort_by.strip("-") not in fields:
                 raise AdminApiException(422, detail=f"Sort by {query_params.sort_by} is not allowed")
@@ -265,13 +411,52 @@ class ApiService:
                 if field not in fields:
                     raise AdminApiException(422, detail=f"Select related by {field} is not allowed")
 
-        return await admin_model.get_list(
+        # paging through the same search/filters reuses the total counted for the first page
+        # (and the anchors of the pages read before); both are only passed on to get_list
+        # overrides accepting them
+        total_cache_key = (
+            model,
+            str(current_user_id),
+            query_params.search,
+            tuple(sorted((key, repr(value)) for key, value in (query_filters or {}).items())),
+        )
+        cached_total = list_total_cache.get(total_cache_key)
+        if cached_total is not None and accepts_keyword(admin_model.get_list, "known_total"):
+            list_kwargs["known_total"] = cached_total
+        if (
+            getattr(admin_model, "list_anchor_pages", None)
+            and not query_params.cursor
+            and accepts_keyword(admin_model.get_list, "anchors")
+        ):
+            anchor_cache_key = (*total_cache_key, query_params.sort_by, query_params.limit)
+            anchors = list_anchor_cache.get(anchor_cache_key)
+            if anchors is None:
+                anchors = {}
+                list_anchor_cache.set(anchor_cache_key, anchors)
+            list_kwargs["anchors"] = anchors
+
+        result = await admin_model.get_list(
             offset=query_params.offset,
             limit=query_params.limit,
             search=query_params.search,
             sort_by=query_params.sort_by,
             filters=query_filters,
+            **list_kwargs,
         )
+        if not isinstance(result, ListResult):
+            # get_list overrides written for earlier versions return an (objects, total) tuple
+            objs, total = result
+            result = ListResult(results=objs, total=total)
+        # only exact counts are cached (estimates are cheap to read again and capped counts
+        # stop after list_count_limit objects)
+        if (
+            cached_total is None
+            and result.total is not None
+            and not result.total_is_approximate
+            and not result.total_is_capped
+        ):
+            list_total_cache.set(total_cache_key, result.total)
+        return result
 
     async def get(
         self,
@@ -279,6 +464,7 @@ class ApiService:
         model: str,
         id: UUID | int | str,
         request: Any | None = None,
+        fields: Sequence[str] | None = None,
     ) -> dict:
         _current_user_id, current_user = await self._get_authenticated_user(session_id)
 
@@ -287,8 +473,13 @@ class ApiService:
             raise AdminApiException(404, detail=f"{model} model is not registered.")
         self._bind_admin_context(admin_model, request=request, user=current_user)
 
+        sparse_fields = {}
+        if fields is not None:
+            self._validate_fields(fields, set(admin_model.get_fields_for_serialize()))
+            sparse_fields["fields"] = list(fields)
+
         try:
-            obj = await admin_model.get_obj(id)
+            obj = await admin_model.get_obj(id, **sparse_fields)
         except Exception as e:
             logger.error("Error getting %s %s: %s", model, id, e)
             raise AdminApiException(500, detail=f"Error getting {model}.") from e
@@ -317,6 +508,8 @@ class ApiService:
         except Exception as e:
             logger.error("Error adding %s: %s", model, e)
             raise AdminApiException(500, detail=f"Error adding {model}.") from e
+        finally:
+            self._invalidate_list_caches(model)
 
     async def change_password(
         self,
@@ -363,6 +556,8 @@ class ApiService:
             await change_password_fn(id, payload.password)
         except (ValueError, TypeError):
             raise AdminApiException(404, detail=f"{settings.ADMIN_USER_MODEL} not found.") from None
+        finally:
+            self._invalidate_authenticated_users(settings.ADMIN_USER_MODEL, [id])
 
     async def change(
         self,
@@ -387,6 +582,9 @@ class ApiService:
         except Exception as e:
             logger.error("Error changing %s %s: %s", model, id, e)
             raise AdminApiException(500, detail=f"Error changing {model}.") from e
+        finally:
+            self._invalidate_list_caches(model)
+            self._invalidate_authenticated_users(model, [id])
         if not obj:
             raise AdminApiException(404, detail=f"{model} not found.")
         return obj
@@ -439,7 +637,8 @@ class ApiService:
         sort_by: str | None = None,
         filters: dict | None = None,
         request: Any | None = None,
-    ) -> tuple[str, str, StringIO | BytesIO | None]:
+        background_jobs: bool = True,
+    ) -> tuple[str, str, AsyncIterator[bytes] | None] | ExportJobSchema:
         current_user_id, current_user = await self._get_authenticated_user(session_id)
 
         query_params = ListQuerySchema(
@@ -449,7 +648,8 @@ class ApiService:
             offset=payload.offset,
             limit=payload.limit,
         )
-        self._clamp_query_limits(query_params)
+        # exports are streamed in chunks, so they are bounded by their own (higher) limit
+        self._clamp_query_limits(query_params, max_limit=settings.ADMIN_EXPORT_MAX_LIMIT)
 
         admin_model = get_admin_or_admin_inline_model(model)
         if not admin_model:
@@ -459,8 +659,10 @@ class ApiService:
 
         # Reject an unsupported/null format up front: otherwise get_export returns
         # None and the framework layer wraps None in a StreamingResponse and 500s.
-        if payload.format not in (ExportFormat.CSV, ExportFormat.JSON):
+        if payload.format not in EXPORT_CONTENT_TYPES:
             raise AdminApiException(422, detail="Unsupported export format.")
+        if payload.gzip and payload.format not in GZIP_EXPORT_FORMATS:
+            raise AdminApiException(422, detail="Only CSV, JSON and NDJSON exports can be compressed.")
 
         # validations
         fields = set(admin_model.get_fields_for_serialize())
@@ -476,7 +678,7 @@ class ApiService:
             self._validate_filters(admin_model, query_params.filters, exclude_filter_fields, fields)
             query_filters = build_query_filters(
                 query_params.filters,
-                admin_model.get_model_fields_with_widget_types(),
+                get_admin_model_fields(admin_model),
                 exclude_filter_fields,
             )
 
@@ -488,26 +690,77 @@ class ApiService:
                 if not is_allowed_field_or_path(ordering_field.strip("-"), fields):
                     raise AdminApiException(422, detail=f"Sort by {ordering_field} is not allowed")
 
-        # payload.format is guaranteed to be CSV or JSON by the guard above.
-        if payload.format == ExportFormat.CSV:
-            content_type = "text/csv"
-            file_name = f"{model}.csv"
-        else:
-            content_type = "text/plain"
-            file_name = f"{model}.json"
-        return (
-            file_name,
-            content_type,
-            await admin_model.get_export(
-                payload.format,
+        # payload.format is guaranteed to be supported by the guard above.
+        export_format = ExportFormat(payload.format)
+        file_name = f"{model}.{export_format.value.lower()}"
+        content_type = EXPORT_CONTENT_TYPES[export_format]
+        if payload.gzip:
+            file_name, content_type = f"{file_name}.gz", "application/gzip"
+        export_kwargs = {
+            "offset": query_params.offset,
+            "limit": query_params.limit,
+            "search": query_params.search,
+            "sort_by": query_params.sort_by,
+            "filters": query_filters,
+        }
+        threshold = settings.ADMIN_EXPORT_JOB_THRESHOLD
+        # background_jobs is False where the event loop ends with the request (Flask, Django WSGI).
+        # The limit defaults to ADMIN_EXPORT_MAX_LIMIT, so only an export which may exceed the threshold
+        # is counted, and an export which is not counted (see get_export_total) runs as a job.
+        if background_jobs and threshold and cast(int, query_params.limit) > threshold:
+            total = await admin_model.get_export_total(
                 offset=query_params.offset,
                 limit=query_params.limit,
                 search=query_params.search,
-                sort_by=query_params.sort_by,
                 filters=query_filters,
-            ),
+            )
+            if total is None or total > threshold:
+                job = export_jobs.create(str(current_user_id), model, file_name, content_type)
+                stream = await admin_model.get_export(export_format, **export_kwargs, progress=job.add_rows)
+                if payload.gzip:
+                    stream = gzip_export_stream(cast(AsyncIterator[bytes], stream))
+                export_jobs.run(job, cast(AsyncIterator[bytes], stream), total=total)
+                return self._get_export_job_schema(job)
+        stream = await admin_model.get_export(export_format, **export_kwargs)
+        if payload.gzip:
+            stream = gzip_export_stream(cast(AsyncIterator[bytes], stream))
+        return file_name, content_type, stream
+
+    @staticmethod
+    def _get_export_job_schema(job: ExportJob) -> ExportJobSchema:
+        return ExportJobSchema(
+            id=job.id,
+            status=job.status,
+            file_name=job.file_name,
+            rows=job.rows,
+            total=job.total,
+            size=job.size,
+            detail=job.detail,
         )
 
+    @staticmethod
+    async def _get_user_export_job(session_id: str | None, job_id: str) -> ExportJob:
+        current_user_id = await get_user_id_from_session_id(session_id)
+        if not current_user_id:
+            raise AdminApiException(401, detail="User is not authenticated.")
+        job = export_jobs.get(job_id)
+        # a job of another user is reported as missing, so job ids cannot be probed
+        if not job or job.user_id != str(current_user_id):
+            raise AdminApiException(404, detail="Export job not found.")
+        return job
+
+    async def export_job(self, session_id: str | None, job_id: str) -> ExportJobSchema:
+        job = await self._get_user_export_job(session_id, job_id)
+        return self._get_export_job_schema(job)
+
+    async def download_export_job(
+        self, session_id: str | None, job_id: str, range_header: str | None = None
+    ) -> tuple[ExportJob, tuple[int, int] | None]:
+        job = await self._get_user_export_job(session_id, job_id)
+        if job.status != ExportJobStatus.DONE:
+            raise AdminApiException(409, detail="Export job is not done.")
+        return job, parse_range_header(range_header, job.size)
+
     async def delete(
         self,
         session_id: str | None,
@@ -527,9 +780,14 @@ class ApiService:
             raise AdminApiException(403, detail="You cannot delete yourself.")
         try:
             await admin_model.delete_model(id)
+            if session_store is not None and model == settings.ADMIN_USER_MODEL:
+                await session_store.delete_user(str(id))
         except Exception as e:
             logger.error("Error deleting %s %s: %s", model, id, e)
             raise AdminApiException(500, detail=f"Error deleting {model}.") from e
+        finally:
+            self._invalidate_list_caches(model)
+            self._invalidate_authenticated_users(model, [id])
         return id
 
     async def action(
@@ -563,7 +821,11 @@ class ApiService:
         else:
             action_function_fn = sync_to_async(action_function)
 
-        return await action_function_fn(payload.ids)
+        try:
+            return await action_function_fn(payload.ids)
+        finally:
+            self._invalidate_list_caches(model)
+            self._invalidate_authenticated_users(model, payload.ids)
 
     async def widget_action(
         self,
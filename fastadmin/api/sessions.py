@@ -0,0 +1,304 @@
+"""Server-side session stores of the admin API.
+
+With ``ADMIN_SESSION_STORE`` set, signing in creates a session in a :class:`SessionStore` and the
+session JWT carries its key: a request is authenticated by looking the session up (instead of
+reading the user table), signing out removes it and a user keeps at most
+``ADMIN_SESSION_MAX_PER_USER`` sessions (the oldest are removed first).
+
+- :class:`MemorySessionStore` keeps the sessions in process (a worker does not see the sessions
+  of the other workers).
+- :class:`SQLiteSessionStore` keeps them in a SQLite file shared by the workers of one host.
+- :class:`RedisSessionStore` keeps them in a Redis (or Redis-protocol) server; it needs the
+  ``redis`` extra.
+"""
+
+import asyncio
+import importlib.util
+import sqlite3
+import time
+from contextlib import closing
+from secrets import token_urlsafe
+
+from fastadmin.api.cache import TTLCache
+
+
+class SessionStore:
+    """Base class of the server-side session stores"""
+
+    def __init__(self, ttl: float, max_sessions_per_user: int = 0):
+        """This method is used to initialize the store.
+
+        :params ttl: a number of seconds sessions live for.
+        :params max_sessions_per_user: a maximum number of sessions of a user (0 for no limit).
+        """
+        self.ttl = ttl
+        self.max_sessions_per_user = max_sessions_per_user
+
+    @staticmethod
+    def generate_session_key() -> str:
+        """This method is used to generate a random session key.
+
+        :return: A session key.
+        """
+        return token_urlsafe(32)
+
+    async def create(self, user_id: str) -> str:
+        """This method is used to create a session (removing the extra sessions of the user).
+
+        :params user_id: an id of the user.
+        :return: A session key.
+        """
+        raise NotImplementedError
+
+    async def exists(self, user_id: str, session_key: str) -> bool:
+        """This method is used to check that a session of a user is active.
+
+        :params user_id: an id of the user.
+        :params session_key: a session key.
+        :return: True if the session is active.
+        """
+        raise NotImplementedError
+
+    async def delete(self, user_id: str, session_key: str) -> None:
+        """This method is used to remove a session (no-op if absent).
+
+        :params user_id: an id of the user.
+        :params session_key: a session key.
+        :return: None.
+        """
+        raise NotImplementedError
+
+    async def delete_user(self, user_id: str) -> None:
+        """This method is used to remove all sessions of a user.
+
+        :params user_id: an id of the user.
+        :return: None.
+        """
+        raise NotImplementedError
+
+
+class MemorySessionStore(SessionStore):
+    """In-process LRU session store (the least recently used sessions of a user are removed first)"""
+
+    def __init__(self, ttl: float, max_sessions_per_user: int = 0, maxsize: int = 10000):
+        """This method is used to initialize the store.
+
+        :params ttl: a number of seconds sessions live for.
+        :params max_sessions_per_user: a maximum number of sessions of a user (0 for no limit).
+        :params maxsize: a maximum number of sessions (the least recently used are removed beyond it).
+        """
+        super().__init__(ttl, max_sessions_per_user)
+        self._sessions = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def create(self, user_id: str) -> str:
+        session_key = self.generate_session_key()
+        self._sessions.set((user_id, session_key), True)
+        if self.max_sessions_per_user:
+            # keys are ordered from the least to the most recently used
+            user_keys = [key for key in self._sessions if key[0] == user_id]
+            for key in user_keys[: -self.max_sessions_per_user]:
+                self._sessions.delete(key)
+        return session_key
+
+    async def exists(self, user_id: str, session_key: str) -> bool:
+        return self._sessions.get((user_id, session_key)) is not None
+
+    async def delete(self, user_id: str, session_key: str) -> None:
+        self._sessions.delete((user_id, session_key))
+
+    async def delete_user(self, user_id: str) -> None:
+        self._sessions.delete_matching(lambda key: key[0] == user_id)
+
+
+class SQLiteSessionStore(SessionStore):
+    """Session store in a SQLite file shared by the workers of one host"""
+
+    def __init__(self, path: str, ttl: float, max_sessions_per_user: int = 0):
+        """This method is used to initialize the store.
+
+        :params path: a path of the SQLite file (created if missing).
+        :params ttl: a number of seconds sessions live for.
+        :params max_sessions_per_user: a maximum number of sessions of a user (0 for no limit).
+        """
+        super().__init__(ttl, max_sessions_per_user)
+        self.path = path
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=10)
+        if not self._initialized:
+            # WAL lets the workers read the sessions while one of them writes
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS fastadmin_sessions ("
+                "session_key TEXT PRIMARY KEY, user_id TEXT NOT NULL, "
+                "created_at REAL NOT NULL, expires_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS fastadmin_sessions_user_id ON fastadmin_sessions (user_id, created_at)"
+            )
+            self._initialized = True
+        return connection
+
+    def _create(self, user_id: str, session_key: str) -> None:
+        now = time.time()
+        with closing(self._connect()) as connection, connection:
+            connection.execute("DELETE FROM fastadmin_sessions WHERE expires_at <= ?", (now,))
+            connection.execute(
+                "INSERT INTO fastadmin_sessions (session_key, user_id, created_at, expires_at) VALUES (?, ?, ?, ?)",
+                (session_key, user_id, now, now + self.ttl),
+            )
+            if self.max_sessions_per_user:
+                connection.execute(
+                    "DELETE FROM fastadmin_sessions WHERE user_id = ? AND session_key NOT IN ("
+                    "SELECT session_key FROM fastadmin_sessions WHERE user_id = ? "
+                    "ORDER BY created_at DESC, rowid DESC LIMIT ?)",
+                    (user_id, user_id, self.max_sessions_per_user),
+                )
+
+    def _exists(self, user_id: str, session_key: str) -> bool:
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT 1 FROM fastadmin_sessions WHERE session_key = ? AND user_id = ? AND expires_at > ?",
+                (session_key, user_id, time.time()),
+            ).fetchone()
+            return row is not None
+
+    def _execute(self, query: str, params: tuple) -> None:
+        with closing(self._connect()) as connection, connection:
+            connection.execute(query, params)
+
+    async def create(self, user_id: str) -> str:
+        session_key = self.generate_session_key()
+        await asyncio.to_thread(self._create, user_id, session_key)
+        return session_key
+
+    async def exists(self, user_id: str, session_key: str) -> bool:
+        return await asyncio.to_thread(self._exists, user_id, session_key)
+
+    async def delete(self, user_id: str, session_key: str) -> None:
+        await asyncio.to_thread(
+            self._execute,
+            "DELETE FROM fastadmin_sessions WHERE session_key = ? AND user_id = ?",
+            (session_key, user_id),
+        )
+
+    async def delete_user(self, user_id: str) -> None:
+        await asyncio.to_thread(self._execute, "DELETE FROM fastadmin_sessions WHERE user_id = ?", (user_id,))
+
+
+class RedisSessionStore(SessionStore):
+    """Session store in a Redis (or Redis-protocol) server
+
+    A session is a ``<prefix>session:<user id>:<session key>`` key expiring with the session and the
+    sessions of a user are the members of the ``<prefix>user:<user id>`` sorted set (scored by
+    their creation time).
+    """
+
+    def __init__(self, url: str, ttl: float, max_sessions_per_user: int = 0, prefix: str = "fastadmin:"):
+        """This method is used to initialize the store.
+
+        :params url: a Redis URL (e.g. redis://localhost:6379/0).
+        :params ttl: a number of seconds sessions live for.
+        :params max_sessions_per_user: a maximum number of sessions of a user (0 for no limit).
+        :params prefix: a prefix of the keys.
+        """
+        if importlib.util.find_spec("redis") is None:
+            raise RuntimeError("The redis session store requires the redis package (the redis extra).")
+        import redis
+
+        super().__init__(ttl, max_sessions_per_user)
+        self.url = url
+        self.prefix = prefix
+        # a sync client used from worker threads (like the SQLite store): redis.asyncio connections belong
+        # to the event loop which opened them, while Flask runs every async view on its own loop
+        # (RESP2, which every Redis-protocol server speaks)
+        self._client = redis.Redis.from_url(url, decode_responses=True, protocol=2)
+
+    def _session_name(self, user_id: str, session_key: str) -> str:
+        return f"{self.prefix}session:{user_id}:{session_key}"
+
+    def _user_name(self, user_id: str) -> str:
+        return f"{self.prefix}user:{user_id}"
+
+    def _create(self, user_id: str, session_key: str) -> None:
+        ttl_ms = int(self.ttl * 1000)
+        user_name = self._user_name(user_id)
+        with self._client.pipeline(transaction=False) as pipeline:
+            pipeline.set(self._session_name(user_id, session_key), 1, px=ttl_ms)
+            pipeline.zadd(user_name, {session_key: time.time()})
+            pipeline.pexpire(user_name, ttl_ms)
+            pipeline.execute()
+        self._trim(user_id)
+
+    def _trim(self, user_id: str) -> None:
+        """Remove the extra sessions of a user and the members of its expired sessions."""
+        user_name = self._user_name(user_id)
+        # members are ordered from the oldest to the newest session
+        session_keys = self._client.zrange(user_name, 0, -1)
+        values = self._client.mget([self._session_name(user_id, key) for key in session_keys])
+        active_keys = [key for key, value in zip(session_keys, values, strict=True) if value is not None]
+        extra_keys = active_keys[: -self.max_sessions_per_user] if self.max_sessions_per_user else []
+        removed_keys = [key for key in session_keys if key not in active_keys] + extra_keys
+        if not removed_keys:
+            return
+        with self._client.pipeline(transaction=False) as pipeline:
+            pipeline.zrem(user_name, *removed_keys)
+            if extra_keys:
+                pipeline.delete(*[self._session_name(user_id, key) for key in extra_keys])
+            pipeline.execute()
+
+    def _delete(self, user_id: str, session_key: str) -> None:
+        with self._client.pipeline(transaction=False) as pipeline:
+            pipeline.delete(self._session_name(user_id, session_key))
+            pipeline.zrem(self._user_name(user_id), session_key)
+            pipeline.execute()
+
+    def _delete_user(self, user_id: str) -> None:
+        user_name = self._user_name(user_id)
+        session_keys = self._client.zrange(user_name, 0, -1)
+        self._client.delete(user_name, *[self._session_name(user_id, key) for key in session_keys])
+
+    async def create(self, user_id: str) -> str:
+        session_key = self.generate_session_key()
+        await asyncio.to_thread(self._create, user_id, session_key)
+        return session_key
+
+    async def exists(self, user_id: str, session_key: str) -> bool:
+        return bool(await asyncio.to_thread(self._client.exists, self._session_name(user_id, session_key)))
+
+    async def delete(self, user_id: str, session_key: str) -> None:
+        await asyncio.to_thread(self._delete, user_id, session_key)
+
+    async def delete_user(self, user_id: str) -> None:
+        await asyncio.to_thread(self._delete_user, user_id)
+
+
+def create_session_store(
+    backend: str, url: str | None, ttl: float, max_sessions_per_user: int = 0, maxsize: int = 10000
+) -> SessionStore | None:
+    """This method is used to create the session store of the settings.
+
+    :params backend: a backend ("memory", "sqlite", "redis" or "" for stateless sessions).
+    :params url: a path of the SQLite file (required) or a Redis URL (None for the local server).
+    :params ttl: a number of seconds sessions live for.
+    :params max_sessions_per_user: a maximum number of sessions of a user (0 for no limit).
+    :params maxsize: a maximum number of sessions of the memory backend.
+    :return: A session store or None.
+    """
+    match backend:
+        case "":
+            return None
+        case "memory":
+            return MemorySessionStore(ttl, max_sessions_per_user, maxsize=maxsize)
+        case "sqlite":
+            # no default file: a shared temporary directory would let other local users read or plant sessions
+            if not url:
+                raise ValueError(
+                    "The sqlite session store requires a path of the SQLite file (ADMIN_SESSION_STORE_URL)."
+                )
+            return SQLiteSessionStore(url, ttl, max_sessions_per_user)
+        case "redis":
+            return RedisSessionStore(url or "redis://localhost:6379/0", ttl, max_sessions_per_user)
+        case _:
+            raise ValueError(f"Unknown session store {backend!r} (expected memory, sqlite or redis).")
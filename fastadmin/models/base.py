@@ -1,10 +1,19 @@
+import asyncio
+import base64
 import csv
 import datetime
+import functools
+import importlib.util
 import inspect
 import json
-from collections.abc import Sequence
+import tempfile
+import zlib
+from collections.abc import AsyncIterator, Awaitable, Callable, Collection, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from contextvars import ContextVar
-from decimal import Decimal
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from enum import Enum
 from io import BytesIO, StringIO
 from typing import Any
 from uuid import UUID
@@ -14,14 +23,163 @@ from asgiref.sync import sync_to_async
 from fastadmin.api.encoders import apply_custom_encoders
 from fastadmin.api.exceptions import AdminApiException
 from fastadmin.api.schemas import ExportFormat
-from fastadmin.models.schemas import ModelFieldWidgetSchema, WidgetType
+from fastadmin.models.schemas import (
+    ListCountStrategy,
+    ListPagination,
+    ListResult,
+    ModelFieldsMetadataSchema,
+    ModelFieldWidgetSchema,
+    NumberType,
+    WidgetType,
+)
+from fastadmin.settings import settings
 
 Model = Any
 
+# Widget types of columns that can hold large values (long text, JSON), see list_defer_heavy_fields.
+_HEAVY_WIDGET_TYPES = (WidgetType.TextArea, WidgetType.RichTextArea, WidgetType.JsonTextArea)
+
+# Queries reading the planner's row count estimate of a table (bound to one table name parameter).
+_ESTIMATED_COUNT_QUERIES = {
+    "postgresql": "SELECT reltuples FROM pg_class WHERE oid = to_regclass({placeholder})",
+    "mysql": (
+        "SELECT TABLE_ROWS FROM information_schema.TABLES "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = {placeholder}"
+    ),
+    # sqlite_stat1 only exists after ANALYZE, the adapters fall back to an exact count otherwise.
+    "sqlite": "SELECT stat FROM sqlite_stat1 WHERE tbl = {placeholder}",
+}
+_DIALECT_ALIASES = {"postgres": "postgresql", "mariadb": "mysql"}
+
+# Types of sort values kept in list cursors with a tag (JSON has no type for them), see encode_list_cursor.
+_CURSOR_VALUE_TYPES: dict[str, Callable[[str], Any]] = {
+    "datetime": datetime.datetime.fromisoformat,
+    "date": datetime.date.fromisoformat,
+    "time": datetime.time.fromisoformat,
+    "decimal": Decimal,
+    "uuid": UUID,
+}
+
+# Maximum number of anchors kept per list query, see list_anchor_pages.
+_MAX_LIST_ANCHORS = 1000
+
+# Optional orm_get_list arguments with their defaults. They are only passed on when they are set and
+# accepted, so orm_get_list overrides with the (offset, limit, search, sort_by, filters) signature keep working.
+_ORM_GET_LIST_OPTIONAL_KWARGS: dict[str, Any] = {
+    "defer_fields": None,
+    "with_count": True,
+    "count_limit": None,
+    "keyset_ordering": None,
+    "keyset_values": None,
+}
+
+# Size of the blocks an export file is streamed in.
+_EXPORT_BLOCK_SIZE = 64 * 1024
+
+# Packages of the export formats which are optional dependencies.
+_EXPORT_FORMAT_PACKAGES = {ExportFormat.XLSX: "openpyxl", ExportFormat.PARQUET: "pyarrow"}
+
 # Leading characters a spreadsheet interprets as the start of a formula.
 _CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
 
 
+def get_estimated_count_query(dialect: str, placeholder: str) -> str | None:
+    """Return the query reading the estimated row count of a table from database statistics.
+
+    :params dialect: a database dialect/vendor name (e.g. postgresql, postgres, mysql, sqlite).
+    :params placeholder: a bound parameter placeholder of the driver (e.g. %s, $1, ?).
+    :return: A query with one table name parameter, or None if the dialect is not supported.
+    """
+    dialect = dialect.lower()
+    query = _ESTIMATED_COUNT_QUERIES.get(_DIALECT_ALIASES.get(dialect, dialect))
+    return query.format(placeholder=placeholder) if query else None
+
+
+def parse_estimated_count(value: Any) -> int | None:
+    """Parse a row count estimate read with get_estimated_count_query.
+
+    :params value: a reltuples/TABLE_ROWS number or a sqlite_stat1 stat string (e.g. "1000 10").
+    :return: A positive row count, or None if there is no usable estimate (e.g. never analyzed).
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.split(" ", 1)[0]
+    count = int(float(value))
+    return count if count > 0 else None
+
+
+def get_keyset_lookups(ordering: Sequence[str], values: Sequence[Any]) -> list[dict[str, Any]]:
+    """Return the lookups of a keyset (seek) condition selecting the objects after an object in an ordering.
+
+    :params ordering: a list of field names (prefixed with - for descending order) ending with the primary key.
+    :params values: a list of values of the ordering fields of the object.
+    :return: A list of lookup dicts to OR together (e.g. [{"name__gt": "a"}, {"name": "a", "id__gt": 1}]).
+    """
+    lookups = []
+    for index, ordering_field in enumerate(ordering):
+        lookup = {field.lstrip("-"): value for field, value in zip(ordering[:index], values[:index], strict=True)}
+        condition = "lt" if ordering_field.startswith("-") else "gt"
+        lookup[f"{ordering_field.lstrip('-')}__{condition}"] = values[index]
+        lookups.append(lookup)
+    return lookups
+
+
+def _encode_cursor_value(value: Any) -> Any:
+    if isinstance(value, Enum):
+        value = value.value
+    match value:
+        case datetime.datetime():
+            return ["datetime", value.isoformat()]
+        case datetime.date():
+            return ["date", value.isoformat()]
+        case datetime.time():
+            return ["time", value.isoformat()]
+        case Decimal():
+            return ["decimal", str(value)]
+        case UUID():
+            return ["uuid", str(value)]
+        case None | bool() | int() | float() | str():
+            return value
+        case _:
+            return str(value)
+
+
+def _decode_cursor_value(value: Any) -> Any:
+    if isinstance(value, list):
+        type_name, raw_value = value
+        return _CURSOR_VALUE_TYPES[type_name](raw_value)
+    return value
+
+
+def encode_list_cursor(ordering: Sequence[str], values: Sequence[Any], backward: bool = False) -> str:
+    """Encode an opaque list cursor pointing next to an object.
+
+    :params ordering: a keyset ordering of the list (see get_list_keyset_ordering).
+    :params values: a list of values of the ordering fields of the object.
+    :params backward: a flag to point to the objects before the object (the objects after it otherwise).
+    :return: A url-safe cursor string.
+    """
+    payload = {"o": list(ordering), "v": [_encode_cursor_value(value) for value in values], "b": backward}
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_list_cursor(cursor: str, ordering: Sequence[str]) -> tuple[list[Any], bool]:
+    """Decode a list cursor made by encode_list_cursor.
+
+    :params cursor: a cursor string.
+    :params ordering: a keyset ordering of the list the cursor has to be made for.
+    :return: A tuple of list of values of the ordering fields and backward flag.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if payload["o"] != list(ordering) or len(payload["v"]) != len(ordering):
+            raise ValueError("Cursor ordering mismatch")
+        return [_decode_cursor_value(value) for value in payload["v"]], bool(payload["b"])
+    except (ValueError, TypeError, KeyError) as e:
+        raise AdminApiException(422, detail="Invalid cursor.") from e
+
+
 def _neutralize_csv_value(value: Any) -> Any:
     """Prevent CSV formula injection in exported data.
 
@@ -34,11 +192,274 @@ def _neutralize_csv_value(value: Any) -> Any:
     return value
 
 
+class _ExportJSONEncoder(json.JSONEncoder):
+    """JSON encoder of exports which falls back to str() for values JSON has no type for."""
+
+    def default(self, o):
+        try:
+            return super().default(o)
+        except TypeError:
+            return str(o)
+
+
+def _get_export_cell_value(value: Any) -> Any:
+    """Return a value of a typed export cell (XLSX, Parquet): scalars pass through, other values become strings."""
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+    return str(value)
+
+
+def _to_bool(value: Any) -> bool | None:
+    """Return a boolean export value (None for other values)."""
+    return value if isinstance(value, bool) else None
+
+
+def _to_int64(value: Any) -> int:
+    """Return a 64-bit integer export value."""
+    value = int(value)
+    if not -(2**63) <= value < 2**63:
+        raise OverflowError(value)
+    return value
+
+
+def _to_decimal(value: Any, precision: int, scale: int) -> Decimal:
+    """Return a decimal export value rounded to the scale of its column."""
+    try:
+        value = Decimal(str(value)).quantize(Decimal(1).scaleb(-scale))
+    except InvalidOperation as e:
+        raise ValueError(value) from e
+    if not value.is_finite() or len(value.as_tuple().digits) > precision:
+        raise ValueError(value)
+    return value
+
+
+def _convert_export_value(value: Any, converter: Callable[[Any], Any]) -> Any:
+    """Convert a value of a typed export column (None if it does not convert)."""
+    if value is None:
+        return None
+    try:
+        return converter(_get_export_cell_value(value))
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+class _ExportBuffer:
+    """Write-only file of an export encoder which is drained after every write, so it never holds the whole file."""
+
+    closed = False
+
+    def __init__(self):
+        self._output = BytesIO()
+
+    def write(self, data: bytes) -> int:
+        return self._output.write(data)
+
+    def drain(self) -> bytes:
+        """Return the bytes written since the last drain."""
+        data = self._output.getvalue()
+        self._output.seek(0)
+        self._output.truncate()
+        return data
+
+
+# Export encoder pools by (kind, workers), see ADMIN_EXPORT_ENCODER_POOL. Created on first use.
+_export_executors: dict[tuple[str, int], Executor] = {}
+
+
+def _get_export_executor() -> Executor | None:
+    """Return the pool of the export encoders (None to encode on the event loop)."""
+    kind, workers = settings.ADMIN_EXPORT_ENCODER_POOL, settings.ADMIN_EXPORT_ENCODER_WORKERS
+    if kind not in ("thread", "process"):
+        return None
+    executor = _export_executors.get((kind, workers))
+    if executor is None:
+        if kind == "process":
+            executor = ProcessPoolExecutor(max_workers=workers or None)
+        else:
+            executor = ThreadPoolExecutor(max_workers=workers or None, thread_name_prefix="fastadmin-export")
+        _export_executors[(kind, workers)] = executor
+    return executor
+
+
+async def _run_export_encoder(function: Callable[..., Any], *args: Any, stateful: bool = False) -> Any:
+    """Run an export encoder on the export encoder pool.
+
+    A stateful encoder (writing to a workbook or file kept across chunks) runs on a thread of the event
+    loop when the pool is a process pool, as its state cannot be sent to another process.
+    """
+    executor = _get_export_executor()
+    if executor is None:
+        return function(*args)
+    if stateful and isinstance(executor, ProcessPoolExecutor):
+        executor = None
+    return await asyncio.get_running_loop().run_in_executor(executor, function, *args)
+
+
+def _encode_csv_rows(rows: list[tuple], header: Sequence[str] | None = None) -> bytes:
+    """Encode export rows to CSV (after a header row if given), neutralizing formulas."""
+    output = StringIO()
+    writer = csv.writer(output)
+    if header is not None:
+        writer.writerow(header)
+    writer.writerows([_neutralize_csv_value(value) for value in row] for row in rows)
+    return output.getvalue().encode()
+
+
+def _encode_json_rows(rows: list[tuple], fields: Sequence[str], first: bool) -> bytes:
+    """Encode export rows (at least one) to objects of a JSON array (opening the array for the first rows)."""
+    encoder = _ExportJSONEncoder()
+    objs = ", ".join(encoder.encode(dict(zip(fields, row, strict=True))) for row in rows)
+    return (("[" if first else ", ") + objs).encode()
+
+
+def _encode_ndjson_rows(rows: list[tuple], fields: Sequence[str]) -> bytes:
+    """Encode export rows to newline delimited JSON (a line per row)."""
+    encoder = _ExportJSONEncoder()
+    return "".join(encoder.encode(dict(zip(fields, row, strict=True))) + "\n" for row in rows).encode()
+
+
+def _append_xlsx_rows(worksheet: Any, rows: list[tuple]) -> None:
+    """Append export rows to a write-only XLSX worksheet, neutralizing formulas."""
+    for row in rows:
+        worksheet.append([_neutralize_csv_value(_get_export_cell_value(value)) for value in row])
+
+
+def _write_parquet_rows(
+    writer: Any, output: _ExportBuffer, rows: list[tuple], converters: Sequence[Callable[[Any], Any]]
+) -> bytes:
+    """Write export rows to a Parquet file as a row group and return the bytes written."""
+    import pyarrow as pa
+
+    columns = [
+        [_convert_export_value(row[index], converter) for row in rows] for index, converter in enumerate(converters)
+    ]
+    writer.write_table(pa.Table.from_pydict(dict(zip(writer.schema.names, columns, strict=True)), schema=writer.schema))
+    return output.drain()
+
+
+def _save_xlsx_workbook(workbook: Any, output: Any) -> None:
+    """Save a workbook to a file and rewind the file."""
+    workbook.save(output)
+    output.seek(0)
+
+
+async def gzip_export_stream(stream: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Compress an export stream to gzip as its chunks are produced (on the export encoder pool).
+
+    :params stream: an async iterator of encoded export bytes.
+    :return: An async iterator of gzip bytes.
+    """
+    # wbits 16 + MAX_WBITS writes the gzip header and trailer
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    async for chunk in stream:
+        data = await _run_export_encoder(compressor.compress, chunk, stateful=True)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+@functools.lru_cache(maxsize=256)
+def _get_keyword_params(function: Callable) -> frozenset[str] | None:
+    """Return the names of the keyword arguments a function accepts (None if it accepts ``**kwargs``)."""
+    params = inspect.signature(function).parameters.values()
+    if any(param.kind == param.VAR_KEYWORD for param in params):
+        return None
+    return frozenset(param.name for param in params if param.kind != param.VAR_POSITIONAL)
+
+
+def accepts_keyword(function: Callable, name: str) -> bool:
+    """Return True if a function (e.g. an overridden admin method) accepts a keyword argument."""
+    params = _get_keyword_params(getattr(function, "__func__", function))
+    return params is None or name in params
+
+
+@functools.lru_cache(maxsize=256)
+def _get_str_function(obj_cls: type) -> Callable[[Any], Awaitable[str]]:
+    """Return an awaitable ``__str__`` for a class, resolved (and wrapped) once per class."""
+    if inspect.iscoroutinefunction(obj_cls.__str__):
+        return obj_cls.__str__
+    return sync_to_async(obj_cls.__str__)
+
+
+@functools.lru_cache(maxsize=256)
+def _has_async_str(obj_cls: type) -> bool:
+    """Return True if a class defines a coroutine ``__str__``."""
+    return inspect.iscoroutinefunction(obj_cls.__str__)
+
+
+def _call_str(objs: Sequence[Any]) -> list[str | None]:
+    """Call sync ``__str__`` for a list of objects (None for missing objects and async ``__str__``)."""
+    return [None if obj is None or _has_async_str(type(obj)) else str(obj) for obj in objs]
+
+
+async def _get_str_labels(objs: Sequence[Any]) -> list[str | None]:
+    """Return ``__str__`` of a list of objects, calling the sync ones in one executor hop."""
+    labels = await sync_to_async(_call_str)(objs)
+    for index, obj in enumerate(objs):
+        if obj is not None and _has_async_str(type(obj)):
+            labels[index] = await type(obj).__str__(obj)
+    return labels
+
+
+def _batch_display_function_for_obj(
+    function: Callable[[Sequence[Any]], Any], pk_name: str
+) -> Callable[[Any], Awaitable[Any]]:
+    """Adapt a ``@display(batch=True)`` function to a single object display function."""
+    if not inspect.iscoroutinefunction(function):
+        function = sync_to_async(function)
+
+    async def display_obj(obj: Any) -> Any:
+        return (await function([obj])).get(getattr(obj, pk_name))
+
+    return display_obj
+
+
+def _call_sync_functions(objs: Sequence[Any], plan: "SerializationPlan", with_str: bool = True) -> list[dict[str, Any]]:
+    """Call sync ``__str__``, sync display and sync batch display functions for a page of objects
+    (in one executor hop)."""
+    batch_values = {field_name: function(objs) for field_name, function in plan.sync_batch_display_functions}
+    rows = []
+    for obj in objs:
+        values = {"__str__": str(obj)} if with_str and not _has_async_str(type(obj)) else {}
+        for field_name, function in plan.sync_display_functions:
+            values[field_name] = function(obj)
+        if batch_values:
+            pk = getattr(obj, plan.pk_name)
+            for field_name, values_by_pk in batch_values.items():
+                values[field_name] = values_by_pk.get(pk)
+        rows.append(values)
+    return rows
+
+
+@dataclass
+class SerializationPlan:
+    """Serialization steps of an admin, resolved once per ``list_view`` value.
+
+    Built by :meth:`BaseModelAdmin.get_serialization_plan` so serializing a row
+    does not re-derive the field set, m2m membership or display functions (and
+    their ``sync_to_async`` wrappers) for every object.
+    """
+
+    m2m_fields: list[ModelFieldWidgetSchema]
+    attribute_fields: list[ModelFieldWidgetSchema]
+    display_functions: list[tuple[str, Callable[[Any], Awaitable[Any]]]]
+    # Raw display functions grouped by how :meth:`BaseModelAdmin.serialize_objs` runs them.
+    async_display_functions: list[tuple[str, Callable[[Any], Awaitable[Any]]]]
+    sync_display_functions: list[tuple[str, Callable[[Any], Any]]]
+    inline_display_functions: list[tuple[str, Callable[[Any], Any]]]
+    # ``@display(batch=True)`` functions, called once per page and keyed by ``pk_name``.
+    async_batch_display_functions: list[tuple[str, Callable[[Sequence[Any]], Awaitable[dict]]]]
+    sync_batch_display_functions: list[tuple[str, Callable[[Sequence[Any]], dict]]]
+    pk_name: str | None = None
+
+
 class BaseModelAdmin:
     """Base class for model admin"""
 
     _request_context: ContextVar[Any | None]
     _user_context: ContextVar[Any | None]
+    _model_fields_cache: dict[bool | None, ModelFieldsMetadataSchema]
+    _serialization_plans: dict[tuple[bool, bool], SerializationPlan]
 
     # Use it only if you use several orms in your project.
     model_name_prefix: str | None = None
@@ -164,11 +585,62 @@ class BaseModelAdmin:
     # Example of usage: list_select_related = ("user",)
     list_select_related: Sequence[str] = ()
 
+    # Set list_defer_heavy_fields to leave heavy columns (text, rich text and JSON fields) that are not
+    # in list_display out of the list page query and response, and exports the heavy fields which are not
+    # in export_fields. Only enable it if neither __str__ nor a display function of the list reads such a column:
+    # a deferred column is loaded with one query per object on Django and Tortoise and cannot be loaded at all
+    # on SQLAlchemy once the session is closed. Pony ignores it (its LongStr attributes are loaded lazily already).
+    # Example of usage: list_defer_heavy_fields = True
+    list_defer_heavy_fields: bool = False
+
+    # Set list_display_fk_labels to add a "<field>__str__" label of every foreign key column in list_display
+    # to the list response. Labels are resolved with one query per relation per page through the related model admin,
+    # or read from the related objects already loaded when the relation is in list_select_related.
+    # Example of usage: list_display_fk_labels = True
+    list_display_fk_labels: bool = False
+
     # Set ordering to specify how lists of objects should be ordered in the admin views.
     # This should be a list or tuple in the same format as a model's ordering parameter.
     # Example of usage: ordering = ("-created_at",)
     ordering: Sequence[str] = ()
 
+    # Set list_anchor_pages to let deep pages of the list seek from an anchor instead of skipping offset rows.
+    # The sort values of the last object of every list_anchor_pages-th page are kept per list query
+    # (model, user, ordering, search, filters and page size, see ADMIN_LIST_ANCHOR_CACHE_TTL),
+    # so a jump to any page reads at most list_anchor_pages pages of rows once the anchors before it are known.
+    # Anchors are dropped when the model is added to, changed, deleted or an action runs on it.
+    # Only the primary key and list_anchor_fields orderings are anchored (other orderings are read by offset).
+    # Example of usage: list_anchor_pages = 10
+    list_anchor_pages: int | None = None
+
+    # Set list_anchor_fields to the columns which are unique and not nullable (besides the primary key),
+    # so list_anchor_pages anchors the list when it is sorted by them too. Seeking from the sort value
+    # of a nullable or non-unique column would skip or repeat objects.
+    # Example of usage: list_anchor_fields = ("email",)
+    list_anchor_fields: Sequence[str] = ()
+
+    # Set list_pagination to control how the list page is paginated.
+    # ListPagination.OFFSET pages with offset and limit (the database reads and skips every row before the page).
+    # ListPagination.CURSOR pages with opaque next/prev cursors (keyset pagination): the page query seeks past
+    # the sort values and primary key of the last shown object, so deep pages are as cheap as the first one.
+    # In this mode the list can only be sorted by model columns (the primary key is added as a tiebreaker),
+    # which should not be nullable.
+    # Example of usage: list_pagination = ListPagination.CURSOR
+    list_pagination: ListPagination = ListPagination.OFFSET
+
+    # Set export_chunk_size to control how many objects an export reads, serializes and sends at a time.
+    # Exports are streamed chunk by chunk, so memory use depends on the chunk size and not on the number of rows.
+    # Chunks of exports ordered by the primary key seek past the last exported object instead of skipping offset rows.
+    # Example of usage: export_chunk_size = 2000
+    export_chunk_size: int = 500
+
+    # Set export_fields to choose the columns of exports (in this order): model fields, display functions
+    # (e.g. computed columns of list_display) and "__str__" for the object label. Only these columns are
+    # serialized and encoded, heavy fields (see list_defer_heavy_fields) not among them are not loaded,
+    # and __str__ only runs when it is exported. The model fields (without m2m) are exported at default.
+    # Example of usage: export_fields = ("id", "name", "__str__", "participants_count")
+    export_fields: Sequence[str] = ()
+
     # Not supported setting
     # paginator
 
@@ -214,6 +686,35 @@ class BaseModelAdmin:
     # Example of usage: show_full_result_count = True
     show_full_result_count: bool = False
 
+    # Set list_count_strategy to control how the total of the list page is counted.
+    # ListCountStrategy.EXACT counts the objects on every request.
+    # ListCountStrategy.ESTIMATED reads the row count estimate from database statistics
+    # (pg_class on PostgreSQL, information_schema on MySQL, sqlite_stat1 on SQLite) when the list is not
+    # narrowed by a search or filters (and counts exactly otherwise or when no estimate is available).
+    # ListCountStrategy.AUTO does the same for tables estimated at list_count_estimate_threshold rows or more.
+    # Estimated totals are flagged with total_is_approximate in the list response.
+    # ListCountStrategy.NONE never counts (e.g. for log tables): the list page query reads one more object
+    # to tell whether there is a next page, and the list response has a null total and a has_next flag.
+    # Example of usage: list_count_strategy = ListCountStrategy.AUTO
+    list_count_strategy: ListCountStrategy = ListCountStrategy.EXACT
+
+    # Set list_count_estimate_threshold to the estimated row count from which ListCountStrategy.AUTO
+    # uses the estimate instead of an exact count.
+    # Example of usage: list_count_estimate_threshold = 1_000_000
+    list_count_estimate_threshold: int = 100_000
+
+    # Set list_count_limit to stop counting the objects of the list page at a number of objects.
+    # Larger totals are reported as list_count_limit and flagged with total_is_capped in the list response
+    # (e.g. "10000+"), so a search or filter matching millions of rows does not scan all of them.
+    # Example of usage: list_count_limit = 10_000
+    list_count_limit: int | None = None
+
+    # Set list_count_concurrently to run the count query of the list page concurrently with the page query
+    # (on a second pooled connection), so the list latency is the slower of the two queries instead of their sum.
+    # It is used by the SQLAlchemy, Tortoise and Yara adapters (the Django and Pony adapters query on one thread).
+    # Example of usage: list_count_concurrently = True
+    list_count_concurrently: bool = False
+
     # By default (an empty collection), the list page allows sorting by all model fields.
     # If you want to disable sorting for some columns, set sortable_by to a collection (e.g. list, tuple, or set)
     # of the subset of list_display that you want to be sortable; columns not listed become non-sortable.
@@ -234,6 +735,8 @@ class BaseModelAdmin:
 
         :params model_cls: an orm/db model class.
         """
+        self._model_fields_cache = {}
+        self._serialization_plans = {}
         self.model_cls = model_cls
         self._request_context = ContextVar(f"fastadmin_admin_request_context_{id(self)}", default=None)
         self._user_context = ContextVar(f"fastadmin_admin_user_context_{id(self)}", default=None)
@@ -261,6 +764,14 @@ class BaseModelAdmin:
         """
         raise NotImplementedError
 
+    def get_related_model_cls(self, field_name: str) -> Any | None:
+        """This method is used to get the related orm/db model class of a relation field.
+
+        :params field_name: a name of field.
+        :return: A related model class or None if the field is not a relation.
+        """
+        raise NotImplementedError
+
     def get_model_fields_with_widget_types(
         self,
         with_m2m: bool | None = None,
@@ -272,6 +783,38 @@ class BaseModelAdmin:
         """
         raise NotImplementedError
 
+    def get_model_fields_metadata(self, with_m2m: bool | None = None) -> ModelFieldsMetadataSchema:
+        """This method is used to get cached model fields metadata.
+
+        The result of :meth:`get_model_fields_with_widget_types` is computed once
+        per ``with_m2m`` value and reused until :meth:`clear_model_fields_cache`
+        is called (on register/unregister or after changing the admin configuration).
+
+        :params with_m2m: a flag to include m2m fields.
+        :return: A ModelFieldsMetadataSchema.
+        """
+        metadata = self._model_fields_cache.get(with_m2m)
+        if metadata is None:
+            if with_m2m is None:
+                fields = self.get_model_fields_with_widget_types()
+            else:
+                fields = self.get_model_fields_with_widget_types(with_m2m=with_m2m)
+            metadata = ModelFieldsMetadataSchema(
+                fields=fields,
+                by_name={field.name: field for field in fields},
+            )
+            self._model_fields_cache[with_m2m] = metadata
+        return metadata
+
+    def clear_model_fields_cache(self) -> None:
+        """This method is used to drop cached model fields metadata and serialization plans.
+
+        :return: None.
+        """
+        # Rebind instead of clear(): shallow copies of the admin share the dicts.
+        self._model_fields_cache = {}
+        self._serialization_plans = {}
+
     async def pre_generate_models_schema(self) -> None:
         """This method is used to pre-generate models schema.
 
@@ -285,7 +828,12 @@ class BaseModelAdmin:
         search: str | None = None,
         sort_by: str | None = None,
         filters: dict | None = None,
-    ) -> tuple[list[Any], int]:
+        defer_fields: Sequence[str] | None = None,
+        with_count: bool = True,
+        count_limit: int | None = None,
+        keyset_ordering: Sequence[str] | None = None,
+        keyset_values: Sequence[Any] | None = None,
+    ) -> tuple[list[Any], int | None]:
         """This method is used to get list of orm/db model objects.
 
         :params offset: an offset for pagination.
@@ -293,10 +841,40 @@ class BaseModelAdmin:
         :params search: a search query.
         :params sort_by: a sort by field name.
         :params filters: a dict of filters.
+        :params defer_fields: a list of column names not to load.
+        :params with_count: a flag to count the objects (the total is None otherwise).
+        :params count_limit: a number of objects to stop counting at (the total is at most count_limit + 1).
+        :params keyset_ordering: a list of field names ending with the primary key to order by (instead of sort_by).
+        :params keyset_values: a list of values of keyset_ordering fields to get the objects after (not counted).
         :return: A tuple of list of objects and total count.
         """
         raise NotImplementedError
 
+    def _get_orm_get_list_kwargs(self, **kwargs: Any) -> dict[str, Any]:
+        """This method is used to drop the optional orm_get_list arguments which are not set or not accepted.
+
+        Keyset arguments are kept when they are set: an orm_get_list override without them cannot serve
+        cursor pagination (see list_pagination).
+
+        :params kwargs: orm_get_list arguments.
+        :return: A dict of orm_get_list arguments.
+        """
+        for name, default in _ORM_GET_LIST_OPTIONAL_KWARGS.items():
+            if name not in kwargs:
+                continue
+            value = kwargs[name]
+            is_default = not value if default is None else value == default
+            if is_default or (not name.startswith("keyset_") and not accepts_keyword(self.orm_get_list, name)):
+                del kwargs[name]
+        return kwargs
+
+    async def orm_get_estimated_count(self) -> int | None:
+        """This method is used to get the estimated count of orm/db model objects from database statistics.
+
+        :return: An estimated count, or None if no estimate is available.
+        """
+        return None
+
     async def orm_get_obj(self, id: UUID | int | str) -> Any | None:
         """This method is used to get orm/db model object.
 
@@ -342,6 +920,19 @@ class BaseModelAdmin:
         """
         raise NotImplementedError
 
+    async def orm_get_m2m_ids_bulk(self, objs: Sequence[Any], field: str) -> list[list[int | UUID]]:
+        """This method is used to get m2m ids of several objects (e.g. a list page).
+
+        The default calls :meth:`orm_get_m2m_ids` per object; ORM adapters override it
+        to load the ids of all objects with a single query.
+
+        :params objs: a list of objects.
+        :params field: a m2m field name.
+
+        :return: A list of lists of ids, in the order of objs.
+        """
+        return [await self.orm_get_m2m_ids(obj, field) for obj in objs]
+
     async def orm_save_m2m_ids(self, obj: Any, field: str, ids: list[int | str | UUID]) -> None:
         """This method is used to get m2m ids.
 
@@ -375,7 +966,7 @@ class BaseModelAdmin:
 
         :return: A set of fields.
         """
-        fields = self.get_model_fields_with_widget_types()
+        fields = self.get_model_fields_metadata().fields
         fields_for_serialize = {field.name for field in fields}
         if self.fields:
             fields_for_serialize &= set(self.fields)
@@ -398,7 +989,7 @@ class BaseModelAdmin:
 
         :return: A set of writable model field names.
         """
-        writable = {field.name for field in self.get_model_fields_with_widget_types()}
+        writable = set(self.get_model_fields_metadata().by_name)
         if self.fields:
             writable &= set(self.fields)
         if self.exclude:
@@ -422,13 +1013,245 @@ class BaseModelAdmin:
                 return f"{prefix}{sorter}"
         return sort_by
 
+    def get_list_deferred_fields(self, fields: Collection[str] | None = None) -> list[ModelFieldWidgetSchema]:
+        """This method is used to get fields which are not loaded on the list page.
+
+        :params fields: a sparse fieldset of the request (None for the list_display columns).
+        :return: A list of heavy fields (see list_defer_heavy_fields) not shown in list_display (or not requested).
+        """
+        if not self.list_defer_heavy_fields:
+            return []
+        shown_fields = self.list_display if fields is None else fields
+        return [
+            field
+            for field in self.get_model_fields_metadata(with_m2m=False).fields
+            if field.form_widget_type in _HEAVY_WIDGET_TYPES and not field.is_pk and field.name not in shown_fields
+        ]
+
+    def get_list_fk_label_fields(self) -> list[ModelFieldWidgetSchema]:
+        """This method is used to get foreign key fields which get a label on the list page.
+
+        :return: A list of foreign key fields of list_display (empty unless list_display_fk_labels is set).
+        """
+        if not self.list_display_fk_labels:
+            return []
+        return [
+            field
+            for field in self.get_model_fields_metadata(with_m2m=False).fields
+            if field.name in self.list_display and self.get_related_model_cls(field.name) is not None
+        ]
+
+    async def get_list_fk_labels(
+        self, field: ModelFieldWidgetSchema, objs: Sequence[Any], obj_dicts: Sequence[dict]
+    ) -> list[str | None]:
+        """This method is used to get ``__str__`` labels of a foreign key field for a page of objects.
+
+        :params field: a foreign key field.
+        :params objs: a list of objects.
+        :params obj_dicts: a list of serialized objects (holding the foreign key ids).
+        :return: A list of labels (None if the related object is missing), in the order of objs.
+        """
+        if field.name in self.list_select_related:
+            return await _get_str_labels([getattr(obj, field.name) for obj in objs])
+
+        from fastadmin.models.helpers import get_admin_model
+
+        rel_admin_model = get_admin_model(self.get_related_model_cls(field.name))
+        ids = [obj_dict.get(field.name) for obj_dict in obj_dicts]
+        unique_ids = list({rel_id for rel_id in ids if rel_id is not None})
+        if rel_admin_model is None or not unique_ids:
+            return [None] * len(ids)
+
+        rel_pk_name = rel_admin_model.get_model_pk_name(rel_admin_model.model_cls)
+        rel_objs, _ = await rel_admin_model.orm_get_list(
+            **rel_admin_model._get_orm_get_list_kwargs(filters={(rel_pk_name, "in"): unique_ids}, with_count=False)
+        )
+        labels = await _get_str_labels(rel_objs)
+        labels_by_id = {getattr(rel_obj, rel_pk_name): label for rel_obj, label in zip(rel_objs, labels, strict=True)}
+        return [labels_by_id.get(rel_id) for rel_id in ids]
+
+    async def get_list_total_estimate(self, search: str | None = None, filters: dict | None = None) -> int | None:
+        """This method is used to get the estimated total of the list page (see list_count_strategy).
+
+        :params search: a search query.
+        :params filters: a dict of filters.
+        :return: An estimated total, or None if the objects have to be counted.
+        """
+        if self.list_count_strategy in (ListCountStrategy.EXACT, ListCountStrategy.NONE) or search or filters:
+            return None
+        estimated_count = await self.orm_get_estimated_count()
+        if estimated_count is None:
+            return None
+        if self.list_count_strategy == ListCountStrategy.AUTO and estimated_count < self.list_count_estimate_threshold:
+            return None
+        return estimated_count
+
+    def get_list_keyset_ordering(self, sort_by: str | None = None) -> list[str]:
+        """This method is used to get the ordering of the list page in cursor pagination (see list_pagination).
+
+        :params sort_by: a resolved sort by field name (None for the ordering attribute).
+        :return: A list of field names (prefixed with - for descending order) ending with the primary key.
+        """
+        pk_name = self.get_model_pk_name(self.model_cls)
+        fields_by_name = self.get_model_fields_metadata(with_m2m=False).by_name
+        keyset_ordering = []
+        for ordering_field in [sort_by] if sort_by else self.ordering:
+            field_name = ordering_field.lstrip("-")
+            if field_name not in fields_by_name or self.get_related_model_cls(field_name) is not None:
+                raise AdminApiException(422, detail=f"Sorting by {field_name} is not supported with cursor pagination.")
+            keyset_ordering.append(ordering_field)
+            if field_name == pk_name:
+                return keyset_ordering
+        keyset_ordering.append(pk_name)
+        return keyset_ordering
+
+    def get_list_anchor_ordering(self, sort_by: str | None = None) -> list[str] | None:
+        """This method is used to get the ordering the offset anchors of the list page are recorded in.
+
+        :params sort_by: a resolved sort by field name (None for the ordering attribute).
+        :return: A keyset ordering, or None if the list is not sorted by the primary key and list_anchor_fields only.
+        """
+        try:
+            ordering = self.get_list_keyset_ordering(sort_by)
+        except AdminApiException:
+            return None  # sorted by a relation or a display column
+        anchor_fields = {self.get_model_pk_name(self.model_cls), *self.list_anchor_fields}
+        if any(field.lstrip("-") not in anchor_fields for field in ordering):
+            return None
+        return ordering
+
+    def _record_list_anchors(
+        self, anchors: dict[int, list[Any]], ordering: Sequence[str], objs: Sequence[Any], offset: int, limit: int
+    ) -> None:
+        """This method is used to record the anchors of a list page (see list_anchor_pages).
+
+        :params anchors: an index of the list query from object positions to their sort values.
+        :params ordering: a keyset ordering of the list.
+        :params objs: a list of objects of the page.
+        :params offset: a position of the first object of the page.
+        :params limit: a page size.
+        :return: None.
+        """
+        step = self.list_anchor_pages * limit
+        for position, obj in enumerate(objs, start=offset):
+            if (position + 1) % step == 0 and len(anchors) < _MAX_LIST_ANCHORS:
+                values = [getattr(obj, f.lstrip("-")) for f in ordering]
+                # a NULL sort value cannot be seeked from
+                if None not in values:
+                    anchors[position] = values
+
+    def get_serialization_plan(
+        self, list_view: bool = False, with_deferred_fields: bool = True, fields: Collection[str] | None = None
+    ) -> SerializationPlan:
+        """This method is used to get the cached serialization plan.
+
+        :params list_view: a flag to get the plan for the list view (no m2m, no file urls).
+        :params with_deferred_fields: a flag to serialize the fields of get_list_deferred_fields (list view only).
+        :params fields: a sparse fieldset to serialize (the primary key is always serialized).
+            Plans of sparse fieldsets are built per call and not cached.
+        :return: A SerializationPlan.
+        """
+        with_deferred_fields = with_deferred_fields or not list_view
+        if fields is not None:
+            return self._build_serialization_plan(list_view, with_deferred_fields, fields)
+        plan = self._serialization_plans.get((list_view, with_deferred_fields))
+        if plan is None:
+            plan = self._build_serialization_plan(list_view, with_deferred_fields)
+            self._serialization_plans[(list_view, with_deferred_fields)] = plan
+        return plan
+
+    def get_export_serialization_plan(self, export_fields: Sequence[str]) -> SerializationPlan:
+        """This method is used to get the serialization plan of exports (see export_fields).
+
+        :params export_fields: a list of exported field names.
+        :return: A SerializationPlan of the exported fields (and the primary key).
+        """
+        # display functions declared in export_fields are exported even if they are not in list_display
+        fields_for_serialize = self.get_fields_for_serialize() | set(self.export_fields)
+        return self._build_serialization_plan(True, False, export_fields, fields_for_serialize=fields_for_serialize)
+
+    def _build_serialization_plan(
+        self,
+        list_view: bool,
+        with_deferred_fields: bool,
+        fields: Collection[str] | None = None,
+        fields_for_serialize: set[str] | None = None,
+    ) -> SerializationPlan:
+        """Build a serialization plan (see :meth:`get_serialization_plan`)."""
+        deferred_fields = set() if with_deferred_fields else {f.name for f in self.get_list_deferred_fields(fields)}
+        if fields_for_serialize is None:
+            fields_for_serialize = self.get_fields_for_serialize()
+        if fields is not None:
+            fields_for_serialize = {
+                field.name
+                for field in self.get_model_fields_metadata().fields
+                if field.is_pk and field.name in fields_for_serialize
+            } | (fields_for_serialize & set(fields))
+        m2m_fields = []
+        attribute_fields = []
+        for model_field in self.get_model_fields_metadata().fields:
+            if model_field.name not in fields_for_serialize or model_field.name in deferred_fields:
+                continue
+            if model_field.is_m2m:
+                if not list_view:
+                    m2m_fields.append(model_field)
+            else:
+                attribute_fields.append(model_field)
+
+        display_functions = []
+        async_display_functions = []
+        sync_display_functions = []
+        inline_display_functions = []
+        async_batch_display_functions = []
+        sync_batch_display_functions = []
+        pk_name = None
+        for field_name in fields_for_serialize:
+            display_field_function = getattr(self, field_name, None)
+            if not display_field_function or not hasattr(display_field_function, "is_display"):
+                continue
+            if getattr(display_field_function, "batch", False):
+                if pk_name is None:
+                    pk_name = self.get_model_pk_name(self.model_cls)
+                if inspect.iscoroutinefunction(display_field_function):
+                    async_batch_display_functions.append((field_name, display_field_function))
+                else:
+                    sync_batch_display_functions.append((field_name, display_field_function))
+                display_functions.append((field_name, _batch_display_function_for_obj(display_field_function, pk_name)))
+                continue
+            if inspect.iscoroutinefunction(display_field_function):
+                async_display_functions.append((field_name, display_field_function))
+                display_functions.append((field_name, display_field_function))
+                continue
+            if getattr(display_field_function, "inline", False):
+                inline_display_functions.append((field_name, display_field_function))
+            else:
+                sync_display_functions.append((field_name, display_field_function))
+            display_functions.append((field_name, sync_to_async(display_field_function)))
+
+        return SerializationPlan(
+            m2m_fields=m2m_fields,
+            attribute_fields=attribute_fields,
+            display_functions=display_functions,
+            async_display_functions=async_display_functions,
+            sync_display_functions=sync_display_functions,
+            inline_display_functions=inline_display_functions,
+            async_batch_display_functions=async_batch_display_functions,
+            sync_batch_display_functions=sync_batch_display_functions,
+            pk_name=pk_name,
+        )
+
     async def serialize_obj_attributes(
-        self, obj: Any, attributes_to_serizalize: list[ModelFieldWidgetSchema], list_view: bool = False
+        self,
+        obj: Any,
+        attributes_to_serizalize: list[ModelFieldWidgetSchema],
+        list_view: bool = False,
+        with_str: bool = True,
     ) -> dict[str, Any]:
         """Serialize orm model obj attribute to dict.
 
         :params obj: an object.
         :params attributes_to_serizalize: a list of attributes to serialize.
+        :params with_str: a flag to add the ``__str__`` representation of the object.
         :return: A dict of serialized attributes.
         """
         serialized_dict: dict[str, Any] = {}
@@ -447,11 +1270,8 @@ class BaseModelAdmin:
             serialized_dict[field.name] = value
             if not list_view and field.form_widget_type in (WidgetType.UploadFile, WidgetType.UploadImage) and value:
                 serialized_dict[f"{field.name}__url"] = await self.get_file_url(field.name, value, obj)
-        if inspect.iscoroutinefunction(obj.__str__):
-            str_fn = obj.__str__
-        else:
-            str_fn = sync_to_async(obj.__str__)
-        serialized_dict["__str__"] = await str_fn()
+        if with_str:
+            serialized_dict["__str__"] = await _get_str_function(type(obj))(obj)
         return serialized_dict
 
     async def _serialize_obj_after_save(self, obj: Any) -> dict:
@@ -471,43 +1291,90 @@ class BaseModelAdmin:
                 raise
             return result
 
-    async def serialize_obj(self, obj: Any, list_view: bool = False) -> dict:
+    async def serialize_obj(self, obj: Any, list_view: bool = False, fields: Collection[str] | None = None) -> dict:
         """Serialize orm model obj to dict.
 
         :params obj: an object.
-        :params exclude_fields: a list of fields to exclude.
+        :params list_view: a flag to serialize for the list view.
+        :params fields: a sparse fieldset to serialize (None for all fields).
         :return: A dict.
         """
-        fields = self.get_model_fields_with_widget_types()
-        fields_for_serialize = self.get_fields_for_serialize()
+        plan = self.get_serialization_plan(list_view=list_view, fields=fields)
 
         obj_dict = {}
-        attributes_to_serizalize = []
-        for field in fields:
-            if field.name not in fields_for_serialize:
-                continue
-            if field.is_m2m and list_view:
-                continue
-            if field.is_m2m:
-                obj_dict[field.name] = await self.orm_get_m2m_ids(obj, field.column_name)
-            else:
-                attributes_to_serizalize.append(field)
+        for field in plan.m2m_fields:
+            obj_dict[field.name] = (await self.orm_get_m2m_ids_bulk([obj], field.column_name))[0]
 
-        obj_dict.update(await self.serialize_obj_attributes(obj, attributes_to_serizalize, list_view=list_view))
+        obj_dict.update(await self.serialize_obj_attributes(obj, plan.attribute_fields, list_view=list_view))
 
-        for field_name in fields_for_serialize:
-            display_field_function = getattr(self, field_name, None)
-            if not display_field_function or not hasattr(display_field_function, "is_display"):
-                continue
+        for field_name, display_field_function in plan.display_functions:
+            obj_dict[field_name] = await display_field_function(obj)
 
-            if inspect.iscoroutinefunction(display_field_function):
-                display_field_function_fn = display_field_function
-            else:
-                display_field_function_fn = sync_to_async(display_field_function)
+        return obj_dict
 
-            obj_dict[field_name] = await display_field_function_fn(obj)
+    async def serialize_objs(
+        self,
+        objs: Sequence[Any],
+        list_view: bool = False,
+        with_deferred_fields: bool = True,
+        fields: Collection[str] | None = None,
+        plan: SerializationPlan | None = None,
+        with_str: bool = True,
+    ) -> list[dict]:
+        """Serialize a page of orm model objs to dicts.
+
+        Unlike calling :meth:`serialize_obj` per object, the sync ``__str__`` and sync
+        display functions of the whole page run in a single executor hop, m2m ids are
+        loaded with one :meth:`orm_get_m2m_ids_bulk` call per m2m field,
+        ``@display(inline=True)`` functions are called directly on the event loop and
+        ``@display(batch=True)`` functions are called once with all objects.
+
+        :params objs: a list of objects.
+        :params list_view: a flag to serialize for the list view.
+        :params with_deferred_fields: a flag to serialize the fields of get_list_deferred_fields (list view only).
+        :params fields: a sparse fieldset to serialize (None for all fields).
+        :params plan: a serialization plan to execute (instead of the plan of with_deferred_fields and fields).
+        :params with_str: a flag to serialize __str__.
+        :return: A list of dicts.
+        """
+        if plan is None:
+            plan = self.get_serialization_plan(
+                list_view=list_view, with_deferred_fields=with_deferred_fields, fields=fields
+            )
+
+        sync_rows = await sync_to_async(_call_sync_functions)(objs, plan, with_str)
+        async_batch_values = {
+            field_name: await display_field_function(objs)
+            for field_name, display_field_function in plan.async_batch_display_functions
+        }
 
-        return obj_dict
+        m2m_ids = {field.name: await self.orm_get_m2m_ids_bulk(objs, field.column_name) for field in plan.m2m_fields}
+
+        obj_dicts = []
+        for index, (obj, sync_values) in enumerate(zip(objs, sync_rows, strict=True)):
+            obj_dict = {}
+            for field_name, ids in m2m_ids.items():
+                obj_dict[field_name] = ids[index]
+
+            obj_dict.update(
+                await self.serialize_obj_attributes(obj, plan.attribute_fields, list_view=list_view, with_str=False)
+            )
+            if "__str__" in sync_values:
+                obj_dict["__str__"] = sync_values["__str__"]
+            elif with_str:
+                obj_dict["__str__"] = await type(obj).__str__(obj)
+
+            for field_name, display_field_function in plan.inline_display_functions:
+                sync_values[field_name] = display_field_function(obj)
+            for field_name, display_field_function in plan.async_display_functions:
+                sync_values[field_name] = await display_field_function(obj)
+            for field_name, values_by_pk in async_batch_values.items():
+                sync_values[field_name] = values_by_pk.get(getattr(obj, plan.pk_name))
+            for field_name, _ in plan.display_functions:
+                obj_dict[field_name] = sync_values[field_name]
+
+            obj_dicts.append(obj_dict)
+        return obj_dicts
 
     def deserialize_value(self, field: ModelFieldWidgetSchema, value: Any) -> Any:
         if not value:
@@ -539,7 +1406,11 @@ class BaseModelAdmin:
         search: str | None = None,
         sort_by: str | None = None,
         filters: dict | None = None,
-    ) -> tuple[list[dict], int]:
+        fields: Collection[str] | None = None,
+        cursor: str | None = None,
+        known_total: int | None = None,
+        anchors: dict[int, list[Any]] | None = None,
+    ) -> ListResult:
         """This method is used to get list of seriaized objects.
 
         :params offset: an offset for pagination.
@@ -547,31 +1418,123 @@ class BaseModelAdmin:
         :params search: a search query.
         :params sort_by: a sort by field name.
         :params filters: a dict of filters.
-        :return: A tuple of list of dict and total count.
+        :params fields: a sparse fieldset to serialize (None for all fields).
+        :params cursor: a cursor of the page to get in cursor pagination (instead of offset).
+        :params known_total: an exact total of the list counted before (the objects are not counted again).
+        :params anchors: an index of the list query from object positions to their sort values (see list_anchor_pages),
+            used to seek to a deep page and updated with the anchors of the page.
+        :return: A ListResult.
         """
         resolved_sort_by = self.resolve_sort_by(sort_by) if sort_by else None
+        keyset_ordering = keyset_values = None
+        backward = False
+        if self.list_pagination == ListPagination.CURSOR:
+            keyset_ordering = self.get_list_keyset_ordering(resolved_sort_by)
+            if cursor:
+                keyset_values, backward = decode_list_cursor(cursor, keyset_ordering)
+                offset = 0
+        elif cursor:
+            raise AdminApiException(422, detail="Cursor pagination is not enabled.")
+        anchor_ordering = None
+        query_offset = offset
+        if (
+            anchors is not None
+            and self.list_anchor_pages
+            and limit
+            and not cursor
+            and accepts_keyword(self.orm_get_list, "keyset_values")
+        ):
+            # other orderings (relations, display columns, nullable or non-unique columns) are read by offset
+            anchor_ordering = self.get_list_anchor_ordering(resolved_sort_by)
+            # a deep page seeks past the nearest anchor before it and skips the rest of the way
+            anchor_position = max((position for position in anchors if position < (offset or 0)), default=None)
+            if anchor_ordering and anchor_position is not None:
+                keyset_values = anchors[anchor_position]
+                query_offset = offset - anchor_position - 1
+        with_count = self.list_count_strategy != ListCountStrategy.NONE
+        estimated_total = (
+            await self.get_list_total_estimate(search=search, filters=filters) if known_total is None else None
+        )
+        # one more object tells whether there is a page after this one (when it is not counted)
+        read_next = limit is not None and (keyset_ordering is not None or not with_count)
         objs, total = await self.orm_get_list(
-            offset=offset,
-            limit=limit,
-            search=search,
-            sort_by=resolved_sort_by,
-            filters=filters,
+            **self._get_orm_get_list_kwargs(
+                offset=query_offset,
+                limit=limit + 1 if read_next else limit,
+                search=search,
+                sort_by=resolved_sort_by,
+                filters=filters,
+                defer_fields=[field.column_name for field in self.get_list_deferred_fields(fields)],
+                with_count=with_count and estimated_total is None and known_total is None,
+                count_limit=self.list_count_limit,
+                keyset_ordering=(
+                    [f[1:] if f.startswith("-") else f"-{f}" for f in keyset_ordering]
+                    if backward
+                    else keyset_ordering or anchor_ordering
+                ),
+                keyset_values=keyset_values,
+            )
+        )
+        has_next = None
+        has_more = False
+        if read_next:
+            has_more = len(objs) > limit
+            objs = objs[:limit]
+            # paging backward, the page the cursor was made on follows (and more objects mean a previous page)
+            has_next = backward or has_more
+        if anchor_ordering:
+            self._record_list_anchors(anchors, anchor_ordering, objs, offset or 0, limit)
+        next_cursor = prev_cursor = None
+        if keyset_ordering is not None:
+            if backward:
+                objs.reverse()
+            has_prev = has_more if backward else bool(cursor or offset)
+            if objs:
+                if has_next:
+                    last_values = [getattr(objs[-1], f.lstrip("-")) for f in keyset_ordering]
+                    next_cursor = encode_list_cursor(keyset_ordering, last_values)
+                if has_prev:
+                    first_values = [getattr(objs[0], f.lstrip("-")) for f in keyset_ordering]
+                    prev_cursor = encode_list_cursor(keyset_ordering, first_values, backward=True)
+        # never report fewer objects than the page reached (statistics may lag behind, counts may be capped)
+        page_end = (offset or 0) + len(objs)
+        is_approximate = is_capped = False
+        if not with_count:
+            total = None
+        elif known_total is not None:
+            total = max(known_total, page_end)
+        elif estimated_total is not None:
+            total, is_approximate = max(estimated_total, page_end), True
+        elif self.list_count_limit is not None and total > self.list_count_limit:
+            total, is_capped = max(self.list_count_limit, page_end), True
+        serialized_objs = await self.serialize_objs(objs, list_view=True, with_deferred_fields=False, fields=fields)
+        for field in self.get_list_fk_label_fields():
+            if fields is not None and field.name not in fields:
+                continue
+            labels = await self.get_list_fk_labels(field, objs, serialized_objs)
+            for obj_dict, label in zip(serialized_objs, labels, strict=True):
+                obj_dict[f"{field.name}__str__"] = label
+        return ListResult(
+            results=serialized_objs,
+            total=total,
+            total_is_approximate=is_approximate,
+            total_is_capped=is_capped,
+            has_next=has_next,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
         )
-        serialized_objs = []
-        for obj in objs:
-            serialized_objs.append(await self.serialize_obj(obj, list_view=True))
-        return serialized_objs, total
 
-    async def get_obj(self, id: UUID | int | str) -> dict | None:
+    async def get_obj(self, id: UUID | int | str, fields: Collection[str] | None = None) -> dict | None:
         """This method is used to get serialized object by id.
 
         :params id: an id of object.
+        :params fields: a sparse fieldset to serialize (None for all fields).
         :return: A dict or None.
         """
         obj = await self.orm_get_obj(id)
         if not obj:
             return None
-        return await self.serialize_obj(obj)
+        return await self.serialize_obj(obj, fields=fields)
 
     async def save_model(self, id: UUID | int | str | None, payload: dict) -> dict | None:
         """This method is used to save orm/db model object.
@@ -580,8 +1543,8 @@ class BaseModelAdmin:
         :params payload: a payload from request.
         :return: A saved object or None.
         """
-        fields = self.get_model_fields_with_widget_types(with_m2m=False)
-        m2m_fields = self.get_model_fields_with_widget_types(with_m2m=True)
+        fields = self.get_model_fields_metadata(with_m2m=False).fields
+        m2m_fields = self.get_model_fields_metadata(with_m2m=True).fields
         writable = self.get_writable_field_names()
 
         fields_payload = {
@@ -656,6 +1619,219 @@ class BaseModelAdmin:
         """
         raise NotImplementedError
 
+    async def iter_export_objs(
+        self,
+        offset: int | None = None,
+        limit: int | None = None,
+        search: str | None = None,
+        sort_by: str | None = None,
+        filters: dict | None = None,
+        progress: Callable[[int], None] | None = None,
+        fields: Collection[str] | None = None,
+    ) -> AsyncIterator[list[Any]]:
+        """This method is used to read the orm/db model objects of an export in chunks (see export_chunk_size).
+
+        :params offset: an offset for pagination.
+        :params limit: a limit for pagination (None for all objects).
+        :params search: a search query.
+        :params sort_by: a sort by field name.
+        :params filters: a dict of filters.
+        :params progress: a function called with the number of objects of every chunk once it is exported.
+        :params fields: a list of exported fields (heavy fields not among them are not loaded, None to load all).
+        :return: An async iterator of lists of objects.
+        """
+        defer_fields = (
+            [field.column_name for field in self.get_list_deferred_fields(fields)] if fields is not None else None
+        )
+        resolved_sort_by = self.resolve_sort_by(sort_by) if sort_by else None
+        try:
+            keyset_ordering = self.get_list_keyset_ordering(resolved_sort_by)
+        except AdminApiException:
+            keyset_ordering = None
+        # only the primary key is known to be unique and not null, other orderings are read by offset
+        # (as is everything when an orm_get_list override cannot seek)
+        if keyset_ordering is not None and (
+            len(keyset_ordering) > 1 or not accepts_keyword(self.orm_get_list, "keyset_values")
+        ):
+            keyset_ordering = None
+        keyset_values = None
+        remaining = limit
+        while remaining is None or remaining > 0:
+            chunk_size = self.export_chunk_size if remaining is None else min(self.export_chunk_size, remaining)
+            objs, _ = await self.orm_get_list(
+                **self._get_orm_get_list_kwargs(
+                    offset=offset,
+                    limit=chunk_size,
+                    search=search,
+                    sort_by=resolved_sort_by,
+                    filters=filters,
+                    defer_fields=defer_fields,
+                    with_count=False,
+                    keyset_ordering=keyset_ordering,
+                    keyset_values=keyset_values,
+                )
+            )
+            if objs:
+                yield objs
+                if progress is not None:
+                    progress(len(objs))
+            if len(objs) < chunk_size:
+                return
+            if remaining is not None:
+                remaining -= len(objs)
+            if keyset_ordering is None:
+                offset = (offset or 0) + len(objs)
+            else:
+                offset = 0
+                keyset_values = [getattr(objs[-1], f.lstrip("-")) for f in keyset_ordering]
+
+    def get_export_fields(self) -> list[str]:
+        """This method is used to get the exported fields (see export_fields).
+
+        :return: A list of field names.
+        """
+        if self.export_fields:
+            return list(self.export_fields)
+        return [field.name for field in self.get_model_fields_metadata(with_m2m=False).fields]
+
+    async def _iter_export_rows(
+        self, chunks: AsyncIterator[list[Any]], export_fields: list[str]
+    ) -> AsyncIterator[list[tuple]]:
+        """This method is used to turn the chunks of an export into rows of the exported values.
+
+        Only the exported fields are serialized, and __str__ only if it is exported.
+
+        :params chunks: an async iterator of lists of objects.
+        :params export_fields: a list of field names to export.
+        :return: An async iterator of lists of tuples (a value per export field).
+        """
+        plan = self.get_export_serialization_plan(export_fields)
+        with_str = "__str__" in export_fields
+        async for objs in chunks:
+            obj_dicts = await self.serialize_objs(objs, list_view=True, plan=plan, with_str=with_str)
+            yield [tuple(obj_dict.get(f) for f in export_fields) for obj_dict in obj_dicts]
+
+    async def _iter_export_csv(
+        self, rows: AsyncIterator[list[tuple]], export_fields: list[str]
+    ) -> AsyncIterator[bytes]:
+        """This method is used to encode the rows of an export to CSV.
+
+        :params rows: an async iterator of lists of rows.
+        :params export_fields: a list of field names to export.
+        :return: An async iterator of CSV bytes.
+        """
+        header: list[str] | None = export_fields
+        async for chunk in rows:
+            yield await _run_export_encoder(_encode_csv_rows, chunk, header)
+            header = None
+        if header is not None:
+            yield _encode_csv_rows([], header)
+
+    async def _iter_export_json(
+        self, rows: AsyncIterator[list[tuple]], export_fields: list[str]
+    ) -> AsyncIterator[bytes]:
+        """This method is used to encode the rows of an export to a JSON array.
+
+        :params rows: an async iterator of lists of rows.
+        :params export_fields: a list of field names to export.
+        :return: An async iterator of JSON bytes.
+        """
+        first = True
+        async for chunk in rows:
+            if chunk:
+                yield await _run_export_encoder(_encode_json_rows, chunk, export_fields, first)
+                first = False
+        yield b"[]" if first else b"]"
+
+    async def _iter_export_ndjson(
+        self, rows: AsyncIterator[list[tuple]], export_fields: list[str]
+    ) -> AsyncIterator[bytes]:
+        """This method is used to encode the rows of an export to newline delimited JSON (a line per object).
+
+        :params rows: an async iterator of lists of rows.
+        :params export_fields: a list of field names to export.
+        :return: An async iterator of NDJSON bytes.
+        """
+        async for chunk in rows:
+            yield await _run_export_encoder(_encode_ndjson_rows, chunk, export_fields)
+
+    async def _iter_export_xlsx(
+        self, rows: AsyncIterator[list[tuple]], export_fields: list[str]
+    ) -> AsyncIterator[bytes]:
+        """This method is used to encode the rows of an export to an XLSX workbook.
+
+        The rows are written by a write-only workbook (kept in a temporary file, not in memory)
+        and the workbook is streamed once the last chunk is written.
+
+        :params rows: an async iterator of lists of rows.
+        :params export_fields: a list of field names to export.
+        :return: An async iterator of XLSX bytes.
+        """
+        from openpyxl import Workbook
+
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet(title=self.model_cls.__name__[:31])
+        worksheet.append(export_fields)
+        async for chunk in rows:
+            await _run_export_encoder(_append_xlsx_rows, worksheet, chunk, stateful=True)
+        with tempfile.TemporaryFile() as output:
+            await _run_export_encoder(_save_xlsx_workbook, workbook, output, stateful=True)
+            while block := output.read(_EXPORT_BLOCK_SIZE):
+                yield block
+
+    async def _iter_export_parquet(
+        self, rows: AsyncIterator[list[tuple]], export_fields: list[str]
+    ) -> AsyncIterator[bytes]:
+        """This method is used to encode the rows of an export to a Parquet file (a row group per chunk).
+
+        Column types are derived from the fields, so every chunk fits the schema of the file: switches and
+        checkboxes are booleans, number columns are integers, doubles or decimals (see number_type of
+        ModelFieldWidgetSchema) and other fields are strings. Values which do not convert to the type of their
+        column are nulls.
+
+        :params rows: an async iterator of lists of rows.
+        :params export_fields: a list of field names to export.
+        :return: An async iterator of Parquet bytes.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        fields_by_name = self.get_model_fields_metadata(with_m2m=False).by_name
+        converters: list[Callable[[Any], Any]] = []
+        schema_fields = []
+        for name in export_fields:
+            field = fields_by_name.get(name)
+            widget_type = field.form_widget_type if field else None
+            number_type = field.number_type if field else None
+            precision = field.number_precision if field else None
+            scale = field.number_scale if field else None
+            if widget_type in (WidgetType.Switch, WidgetType.Checkbox):
+                value_type, converter = pa.bool_(), _to_bool
+            elif number_type == NumberType.Integer or (
+                # a number primary key of an orm which does not tell the number types
+                number_type is None and widget_type == WidgetType.InputNumber and field and field.is_pk
+            ):
+                value_type, converter = pa.int64(), _to_int64
+            elif number_type == NumberType.Float:
+                value_type, converter = pa.float64(), float
+            elif (
+                number_type == NumberType.Decimal and precision and scale is not None and 0 <= scale <= precision <= 38
+            ):
+                value_type = pa.decimal128(precision, scale)
+                converter = functools.partial(_to_decimal, precision=precision, scale=scale)
+            else:
+                # numbers of unknown type are kept as they are written rather than rounded to doubles
+                value_type, converter = pa.string(), str
+            converters.append(converter)
+            schema_fields.append(pa.field(name, value_type))
+
+        output = _ExportBuffer()
+        writer = pq.ParquetWriter(output, pa.schema(schema_fields))
+        async for chunk in rows:
+            yield await _run_export_encoder(_write_parquet_rows, writer, output, chunk, converters, stateful=True)
+        writer.close()
+        yield output.drain()
+
     async def get_export(
         self,
         export_format: ExportFormat | None,
@@ -664,8 +1840,11 @@ class BaseModelAdmin:
         search: str | None = None,
         sort_by: str | None = None,
         filters: dict | None = None,
-    ) -> StringIO | BytesIO | None:
-        """This method is used to get export data (str or bytes stream).
+        progress: Callable[[int], None] | None = None,
+    ) -> AsyncIterator[bytes] | None:
+        """This method is used to get export data (a stream of bytes read and encoded chunk by chunk).
+
+        XLSX exports need the openpyxl package and Parquet exports need the pyarrow package.
 
         :params export_format: a n export format (CSV at default).
         :params offset: an offset for pagination.
@@ -673,47 +1852,73 @@ class BaseModelAdmin:
         :params search: a search query.
         :params sort_by: a sort by field name.
         :params filters: a dict of filters.
-        :return: A StringIO or BytesIO object.
+        :params progress: a function called with the number of objects of every chunk once it is exported.
+        :return: An async iterator of bytes or None for an unsupported format.
         """
-        resolved_sort_by = self.resolve_sort_by(sort_by) if sort_by else None
-        objs, _ = await self.orm_get_list(
-            offset=offset, limit=limit, search=search, sort_by=resolved_sort_by, filters=filters
-        )
-        fields = self.get_model_fields_with_widget_types(with_m2m=False)
-
-        export_fields = [f.name for f in fields]
-
         match export_format:
             case ExportFormat.CSV:
-                output = StringIO()
-                writer = csv.DictWriter(output, fieldnames=export_fields)
-                writer.writeheader()
-                for obj in objs:
-                    obj_dict = await self.serialize_obj(obj, list_view=True)
-                    obj_dict = {k: _neutralize_csv_value(v) for k, v in obj_dict.items() if k in export_fields}
-                    writer.writerow(obj_dict)
-                output.seek(0)
-                return output
+                encode = self._iter_export_csv
             case ExportFormat.JSON:
-
-                class JSONEncoder(json.JSONEncoder):
-                    def default(self, o):
-                        try:
-                            return super().default(o)
-                        except TypeError:
-                            return str(o)
-
-                # Emit the same column set as CSV so the two formats are consistent.
-                rows = []
-                for obj in objs:
-                    obj_dict = await self.serialize_obj(obj, list_view=True)
-                    rows.append({k: v for k, v in obj_dict.items() if k in export_fields})
-                output = StringIO()
-                json.dump(rows, output, cls=JSONEncoder)
-                output.seek(0)
-                return output
+                encode = self._iter_export_json
+            case ExportFormat.NDJSON:
+                encode = self._iter_export_ndjson
+            case ExportFormat.XLSX:
+                encode = self._iter_export_xlsx
+            case ExportFormat.PARQUET:
+                encode = self._iter_export_parquet
             case _:
                 return None
+        package = _EXPORT_FORMAT_PACKAGES.get(export_format)
+        if package and importlib.util.find_spec(package) is None:
+            raise AdminApiException(
+                422, detail=f"{ExportFormat(export_format).value} export requires the {package} package."
+            )
+        export_fields = self.get_export_fields()
+        chunks = self.iter_export_objs(
+            offset=offset,
+            limit=limit,
+            search=search,
+            sort_by=sort_by,
+            filters=filters,
+            progress=progress,
+            fields=export_fields,
+        )
+        return encode(self._iter_export_rows(chunks, export_fields), export_fields)
+
+    async def get_export_total(
+        self,
+        offset: int | None = None,
+        limit: int | None = None,
+        search: str | None = None,
+        filters: dict | None = None,
+    ) -> int | None:
+        """This method is used to count the objects of an export (the progress of background export jobs).
+
+        The objects are counted like the list page (see list_count_strategy and list_count_limit).
+
+        :params offset: an offset for pagination.
+        :params limit: a limit for pagination (None for all objects).
+        :params search: a search query.
+        :params filters: a dict of filters.
+        :return: A number of objects, or None if they are not counted or there are more than list_count_limit.
+        """
+        if self.list_count_strategy == ListCountStrategy.NONE:
+            return None
+        total = await self.get_list_total_estimate(search=search, filters=filters)
+        if total is None:
+            _, total = await self.orm_get_list(
+                **self._get_orm_get_list_kwargs(
+                    offset=0,
+                    limit=1,
+                    search=search,
+                    filters=filters,
+                    count_limit=self.list_count_limit,
+                )
+            )
+            if self.list_count_limit is not None and total > self.list_count_limit:
+                return None
+        total = max((total or 0) - (offset or 0), 0)
+        return total if limit is None else min(total, limit)
 
     async def has_add_permission(self, user_id: UUID | int | None = None) -> bool:
         """This method is used to check if user has permission to add new model instance.
@@ -835,7 +2040,7 @@ class ModelAdmin(BaseModelAdmin):
         :params payload: a payload from request.
         :return: A saved object or None.
         """
-        fields = self.get_model_fields_with_widget_types(with_m2m=False)
+        fields = self.get_model_fields_metadata(with_m2m=False).fields
         password_fields = [field.name for field in fields if field.form_widget_type == WidgetType.PasswordInput]
         if id is not None and password_fields:
             # The change form renders password fields read-only (real changes go
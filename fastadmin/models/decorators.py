@@ -149,7 +149,7 @@ def widget_action(
     return decorator(function)
 
 
-def display(function=None, *, sorter: bool | str = False):
+def display(function=None, *, sorter: bool | str = False, inline: bool = False, batch: bool = False):
     """Conveniently add attributes to a display function:
 
     Example of usage:
@@ -161,9 +161,21 @@ def display(function=None, *, sorter: bool | str = False):
     async def author(self, obj):
         return obj.user.username
 
+    @display(inline=True)
+    def full_name(self, obj):
+        return f"{obj.first_name} {obj.last_name}"
+
+    @display(batch=True)
+    async def orders_count(self, objs):
+        return await count_orders_by_user_id([obj.id for obj in objs])
+
     :param function: A function to decorate.
     :param sorter: Enable sorting (True), use function name as sort key; or a string to specify
         the sort expression (e.g. "user__username"). **WARNING**: supported only for Django and Tortoise.
+    :param inline: Mark a cheap sync function (no I/O, no lazy ORM loads) to be called directly on the
+        event loop instead of in the executor thread used for list pages.
+    :param batch: The function receives the whole page (or export chunk) of objects at once and
+        returns a dict mapping object pk to value, turning one query per row into one per page.
     """
 
     def decorator(func):
@@ -171,6 +183,8 @@ def display(function=None, *, sorter: bool | str = False):
 
         wrapped.is_display = True
         wrapped.sorter = sorter
+        wrapped.inline = inline
+        wrapped.batch = batch
         return wrapped
 
     if function is None:
@@ -8,6 +8,7 @@ from fastadmin.models.schemas import (
     ChangeConfigurationFieldSchema,
     InlineModelSchema,
     ListConfigurationFieldSchema,
+    ListPagination,
     ModelAction,
     ModelFieldSchema,
     ModelPermission,
@@ -42,6 +43,8 @@ def register_admin_model_class(admin_model_class: type[ModelAdmin], orm_model_cl
         sqlalchemy_sessionmaker = kwargs.get("sqlalchemy_sessionmaker")
         if sqlalchemy_sessionmaker:
             admin_model_class.set_sessionmaker(sqlalchemy_sessionmaker)
+        if orm_model_class in admin_models:
+            admin_models[orm_model_class].clear_model_fields_cache()
         admin_models[orm_model_class] = admin_model_class(orm_model_class)
 
 
@@ -53,6 +56,7 @@ def unregister_admin_model_class(orm_model_classes: list[Any]) -> None:
     """
     for orm_model_class in orm_model_classes:
         if orm_model_class in admin_models:
+            admin_models[orm_model_class].clear_model_fields_cache()
             del admin_models[orm_model_class]
 
 
@@ -282,6 +286,7 @@ async def generate_models_schema(
                     preserve_filters=admin_model_obj.preserve_filters,
                     list_max_show_all=admin_model_obj.list_max_show_all,
                     show_full_result_count=admin_model_obj.show_full_result_count,
+                    list_pagination=getattr(admin_model_obj, "list_pagination", ListPagination.OFFSET),
                     verbose_name=admin_model_obj.verbose_name,
                     verbose_name_plural=admin_model_obj.verbose_name_plural,
                     menu_section=getattr(admin_model_obj, "menu_section", None),
@@ -328,6 +333,7 @@ async def generate_models_schema(
                     preserve_filters=admin_model_obj.preserve_filters,
                     list_max_show_all=admin_model_obj.list_max_show_all,
                     show_full_result_count=admin_model_obj.show_full_result_count,
+                    list_pagination=getattr(admin_model_obj, "list_pagination", ListPagination.OFFSET),
                     verbose_name=admin_model_obj.verbose_name,
                     verbose_name_plural=admin_model_obj.verbose_name_plural,
                     # specific inline model fields
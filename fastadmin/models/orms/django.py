@@ -2,10 +2,17 @@ from typing import Any
 from uuid import UUID
 
 from asgiref.sync import sync_to_async
+from django.db import DatabaseError, connections, router
 from django.db.models import Q
 
-from fastadmin.models.base import InlineModelAdmin, ModelAdmin
-from fastadmin.models.schemas import ModelFieldWidgetSchema, WidgetType
+from fastadmin.models.base import (
+    InlineModelAdmin,
+    ModelAdmin,
+    get_estimated_count_query,
+    get_keyset_lookups,
+    parse_estimated_count,
+)
+from fastadmin.models.schemas import ModelFieldWidgetSchema, NumberType, WidgetType
 from fastadmin.settings import settings
 
 
@@ -18,6 +25,14 @@ class DjangoORMMixin:
         """
         return orm_model_cls._meta.pk.name
 
+    def get_related_model_cls(self, field_name: str) -> Any | None:
+        """This method is used to get the related orm/db model class of a relation field.
+
+        :params field_name: a name of field.
+        :return: A related model class or None if the field is not a relation.
+        """
+        return next((f.related_model for f in self.model_cls._meta.get_fields() if f.name == field_name), None)
+
     def get_model_fields_with_widget_types(
         self,
         with_m2m: bool | None = None,
@@ -65,6 +80,9 @@ class DjangoORMMixin:
                 else None
             )
 
+            number_type: NumberType | None = None
+            number_precision: int | None = None
+            number_scale: int | None = None
             form_widget_type = WidgetType.Input
             form_widget_props = {
                 "required": required,
@@ -124,6 +142,15 @@ class DjangoORMMixin:
                 ):
                     form_widget_type = WidgetType.InputNumber
                     filter_widget_type = WidgetType.InputNumber
+                    match field_type:
+                        case "FloatField":
+                            number_type = NumberType.Float
+                        case "DecimalField":
+                            number_type = NumberType.Decimal
+                            number_precision = orm_model_field.max_digits
+                            number_scale = orm_model_field.decimal_places
+                        case _:
+                            number_type = NumberType.Integer
                 case "DateField":
                     form_widget_type = WidgetType.DatePicker
                     form_widget_props["format"] = settings.ADMIN_DATE_FORMAT
@@ -230,6 +257,9 @@ class DjangoORMMixin:
                     form_widget_props=form_widget_props,
                     filter_widget_type=filter_widget_type,
                     filter_widget_props=filter_widget_props,
+                    number_type=number_type,
+                    number_precision=number_precision,
+                    number_scale=number_scale,
                 )
             )
         return fields
@@ -242,7 +272,12 @@ class DjangoORMMixin:
         search: str | None = None,
         sort_by: str | None = None,
         filters: dict | None = None,
-    ) -> tuple[list[Any], int]:
+        defer_fields: list[str] | None = None,
+        with_count: bool = True,
+        count_limit: int | None = None,
+        keyset_ordering: list[str] | None = None,
+        keyset_values: list[Any] | None = None,
+    ) -> tuple[list[Any], int | None]:
         """This method is used to get list of orm/db model objects.
 
         :params offset: an offset for pagination.
@@ -250,6 +285,11 @@ class DjangoORMMixin:
         :params search: a search query.
         :params sort_by: a sort by field name.
         :params filters: a dict of filters.
+        :params defer_fields: a list of column names not to load.
+        :params with_count: a flag to count the objects (the total is None otherwise).
+        :params count_limit: a number of objects to stop counting at (the total is at most count_limit + 1).
+        :params keyset_ordering: a list of field names ending with the primary key to order by (instead of sort_by).
+        :params keyset_values: a list of values of keyset_ordering fields to get the objects after (not counted).
         :return: A tuple of list of objects and total count.
         """
         qs = self.model_cls.objects.all()
@@ -268,21 +308,52 @@ class DjangoORMMixin:
                 search_q |= condition
             qs = qs.filter(search_q)
 
-        if sort_by:
+        if keyset_ordering:
+            qs = qs.order_by(*keyset_ordering)
+        elif sort_by:
             qs = qs.order_by(sort_by)
         elif self.ordering:
             qs = qs.order_by(*self.ordering)
 
-        total = qs.count()
+        count_qs = qs if count_limit is None else qs[: count_limit + 1]
+        total = count_qs.count() if with_count else None
+
+        if keyset_ordering and keyset_values is not None:
+            keyset_conditions = [Q(**lookups) for lookups in get_keyset_lookups(keyset_ordering, keyset_values)]
+            keyset_q = keyset_conditions[0]
+            for condition in keyset_conditions[1:]:
+                keyset_q |= condition
+            qs = qs.filter(keyset_q)
 
         if self.list_select_related:
             qs = qs.select_related(*self.list_select_related)
 
+        if defer_fields:
+            qs = qs.defer(*defer_fields)
+
         if offset is not None and limit is not None:
             qs = qs[offset : offset + limit]
 
         return list(qs), total
 
+    @sync_to_async
+    def orm_get_estimated_count(self) -> int | None:
+        """This method is used to get the estimated count of orm/db model objects from database statistics.
+
+        :return: An estimated count, or None if no estimate is available.
+        """
+        connection = connections[router.db_for_read(self.model_cls)]
+        query = get_estimated_count_query(connection.vendor, "%s")
+        if query is None:
+            return None
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(query, [self.model_cls._meta.db_table])
+                row = cursor.fetchone()
+        except DatabaseError:
+            return None
+        return parse_estimated_count(row[0] if row else None)
+
     @sync_to_async
     def orm_get_obj(self, id: UUID | int | str) -> Any | None:
         """This method is used to get orm/db model object.
@@ -335,6 +406,26 @@ class DjangoORMMixin:
         remote_model = m2m_rel.model
         return list(m2m_rel.all().values_list(self.get_model_pk_name(remote_model), flat=True))
 
+    @sync_to_async
+    def orm_get_m2m_ids_bulk(self, objs: list[Any], field: str) -> list[list[int | UUID]]:
+        """This method is used to get m2m ids of several objects with one query.
+
+        :params objs: a list of objects.
+        :params field: a m2m field name.
+
+        :return: A list of lists of ids, in the order of objs.
+        """
+        if not objs:
+            return []
+        pk_name = self.get_model_pk_name(self.model_cls)
+        remote_model = self.model_cls._meta.get_field(field).related_model
+        pks = [getattr(obj, pk_name) for obj in objs]
+        ids_by_pk: dict[Any, list[int | UUID]] = {pk: [] for pk in pks}
+        qs = self.model_cls.objects.filter(**{f"{pk_name}__in": pks, f"{field}__isnull": False})
+        for pk, rel_id in qs.values_list(pk_name, f"{field}__{self.get_model_pk_name(remote_model)}"):
+            ids_by_pk[pk].append(rel_id)
+        return [ids_by_pk[pk] for pk in pks]
+
     @sync_to_async
     def orm_save_m2m_ids(self, obj: Any, field: str, ids: list[int | str | UUID]) -> None:
         """This method is used to get m2m ids.
@@ -1,14 +1,21 @@
 import inspect
+from collections.abc import Collection
 from enum import EnumMeta
 from types import SimpleNamespace
 from typing import Any
 from uuid import UUID
 
 from asgiref.sync import sync_to_async
-from pony.orm import commit, db_session, desc, flush
-
-from fastadmin.models.base import InlineModelAdmin, ModelAdmin
-from fastadmin.models.schemas import ModelFieldWidgetSchema, WidgetType
+from pony.orm import DatabaseError, commit, db_session, desc, flush, select
+
+from fastadmin.models.base import (
+    InlineModelAdmin,
+    ModelAdmin,
+    SerializationPlan,
+    get_estimated_count_query,
+    parse_estimated_count,
+)
+from fastadmin.models.schemas import ModelFieldWidgetSchema, NumberType, WidgetType
 from fastadmin.settings import settings
 
 
@@ -47,6 +54,15 @@ class PonyORMMixin:
         """
         return orm_model_cls._pk_.name
 
+    def get_related_model_cls(self, field_name: str) -> Any | None:
+        """This method is used to get the related orm/db model class of a relation field.
+
+        :params field_name: a name of field.
+        :return: A related model class or None if the field is not a relation.
+        """
+        attr = getattr(self.model_cls, field_name, None)
+        return attr.py_type if getattr(attr, "is_relation", False) else None
+
     def get_model_fields_with_widget_types(
         self,
         with_m2m: bool | None = None,
@@ -88,6 +104,9 @@ class PonyORMMixin:
                 field_type = "enum"
                 choices = {item.name: item.value for item in orm_model_field.py_type}
 
+            number_type: NumberType | None = None
+            number_precision: int | None = None
+            number_scale: int | None = None
             form_widget_type = WidgetType.Input
             form_widget_props = {
                 "required": required,
@@ -123,6 +142,16 @@ class PonyORMMixin:
                 case "int" | "float" | "Decimal":
                     form_widget_type = WidgetType.InputNumber
                     filter_widget_type = WidgetType.InputNumber
+                    match field_type:
+                        case "int":
+                            number_type = NumberType.Integer
+                        case "float":
+                            number_type = NumberType.Float
+                        case _:
+                            # the defaults of the Decimal attributes of PonyORM
+                            number_type = NumberType.Decimal
+                            number_precision = orm_model_field.kwargs.get("precision", 12)
+                            number_scale = orm_model_field.kwargs.get("scale", 2)
                 case "date":
                     form_widget_type = WidgetType.DatePicker
                     form_widget_props["format"] = settings.ADMIN_DATE_FORMAT
@@ -229,6 +258,9 @@ class PonyORMMixin:
                     form_widget_props=form_widget_props,
                     filter_widget_type=filter_widget_type,
                     filter_widget_props=filter_widget_props,
+                    number_type=number_type,
+                    number_precision=number_precision,
+                    number_scale=number_scale,
                 )
             )
         return fields
@@ -242,7 +274,12 @@ class PonyORMMixin:
         search: str | None = None,
         sort_by: str | None = None,
         filters: dict | None = None,
-    ) -> tuple[list[Any], int]:
+        defer_fields: list[str] | None = None,
+        with_count: bool = True,
+        count_limit: int | None = None,
+        keyset_ordering: list[str] | None = None,
+        keyset_values: list[Any] | None = None,
+    ) -> tuple[list[Any], int | None]:
         """This method is used to get list of orm/db model objects.
 
         :params offset: an offset for pagination.
@@ -250,6 +287,12 @@ class PonyORMMixin:
         :params search: a search query.
         :params sort_by: a sort by field name.
         :params filters: a dict of filters.
+        :params defer_fields: a list of column names not to load (unused, Pony has no per-query defer
+            and loads LongStr attributes lazily already).
+        :params with_count: a flag to count the objects (the total is None otherwise).
+        :params count_limit: a number of objects to stop counting at (the total is at most count_limit + 1).
+        :params keyset_ordering: a list of field names ending with the primary key to order by (instead of sort_by).
+        :params keyset_values: a list of values of keyset_ordering fields to get the objects after (not counted).
         :return: A tuple of list of objects and total count.
         """
 
@@ -291,7 +334,7 @@ class PonyORMMixin:
             )
             qs = qs.filter(search_expr)
 
-        ordering = [sort_by] if sort_by else self.ordering
+        ordering = keyset_ordering or ([sort_by] if sort_by else self.ordering)
         if ordering:
             # Build a single order_by() call that preserves the declared field
             # order. Pony prepends the fields of each separate order_by() call,
@@ -304,7 +347,25 @@ class PonyORMMixin:
             ]
             qs = qs.order_by(*order_exprs)
 
-        total = qs.count()
+        total = None
+        if with_count and count_limit is None:
+            total = qs.count()
+        elif with_count:
+            # Pony has no count over a limited query, so a capped count reads the
+            # primary keys of at most count_limit + 1 rows instead
+            key_id = self.get_model_pk_name(self.model_cls)
+            total = len(select(getattr(o, key_id) for o in qs).limit(count_limit + 1))
+
+        if keyset_ordering and keyset_values is not None:
+            # The seek values are referenced through the `keyset_values` local (bound as query
+            # parameters), only the field names of the admin's validated ordering are interpolated.
+            seek_exprs = []
+            for index, ordering_field in enumerate(keyset_ordering):
+                seek_expr = [f"m.{f.lstrip('-')} == keyset_values[{i}]" for i, f in enumerate(keyset_ordering[:index])]
+                seek_operator = "<" if ordering_field.startswith("-") else ">"
+                seek_expr.append(f"m.{ordering_field.lstrip('-')} {seek_operator} keyset_values[{index}]")
+                seek_exprs.append(f"({' and '.join(seek_expr)})")
+            qs = qs.filter(" or ".join(seek_exprs))
 
         if self.list_select_related:
             qs = qs.prefetch(*[getattr(self.model_cls, field) for field in self.list_select_related])
@@ -315,6 +376,23 @@ class PonyORMMixin:
         objs = list(qs)
         return objs, total
 
+    @sync_to_async
+    @db_session
+    def orm_get_estimated_count(self) -> int | None:
+        """This method is used to get the estimated count of orm/db model objects from database statistics.
+
+        :return: An estimated count, or None if no estimate is available.
+        """
+        db = self.model_cls._database_
+        query = get_estimated_count_query(db.provider.dialect, "$table_name")
+        if query is None:
+            return None
+        try:
+            values = db.select(query, globals={}, locals={"table_name": self.model_cls._table_})
+        except DatabaseError:
+            return None
+        return parse_estimated_count(values[0] if values else None)
+
     @sync_to_async
     @db_session
     def orm_get_obj(self, id: UUID | int | str) -> Any | None:
@@ -333,7 +411,7 @@ class PonyORMMixin:
         if not obj:
             return None
 
-        fields = self.get_model_fields_with_widget_types()
+        fields = self.get_model_fields_metadata().fields
         fields_for_serialize = self.get_fields_for_serialize()
         obj_dict: dict[str, Any] = {}
 
@@ -373,6 +451,118 @@ class PonyORMMixin:
 
         return obj_dict
 
+    @sync_to_async
+    @db_session
+    def _serialize_objs_in_session(
+        self, objs: list[Any], plan: SerializationPlan, with_str: bool = True
+    ) -> list[tuple[dict, dict]]:
+        """Serialize the session-bound part of a page in one db_session (and one thread hop).
+
+        Entities returned by ``orm_get_list`` belong to a finished db_session, so the page is
+        re-selected by pk with one query (m2m relations prefetched). Attributes, m2m ids,
+        ``__str__``, sync display and sync batch display functions are read from the live
+        entities.
+
+        :params objs: a list of objects.
+        :params plan: a serialization plan.
+        :params with_str: a flag to serialize __str__.
+        :return: A list of (serialized fields, display values) tuples, in the order of objs.
+        """
+        key_id = self.get_model_pk_name(self.model_cls)
+        pks = [getattr(obj, key_id) for obj in objs]
+        qs = self.model_cls.select(lambda o: getattr(o, key_id) in pks)
+        if plan.m2m_fields:
+            qs = qs.prefetch(*[getattr(self.model_cls, field.column_name) for field in plan.m2m_fields])
+        live_objs_by_pk = {getattr(live_obj, key_id): live_obj for live_obj in qs}
+        # An object deleted since it was listed keeps its detached entity (and no attributes).
+        live_objs = [live_objs_by_pk.get(pk, obj) for pk, obj in zip(pks, objs, strict=True)]
+
+        batch_values = {
+            field_name: display_field_function(live_objs)
+            for field_name, display_field_function in plan.sync_batch_display_functions
+        }
+        rows = []
+        for pk, live_obj in zip(pks, live_objs, strict=True):
+            obj_dict: dict[str, Any] = {}
+            if pk in live_objs_by_pk:
+                for field in plan.m2m_fields:
+                    rel_key_id = self.get_model_pk_name(getattr(self.model_cls, field.column_name).py_type)
+                    obj_dict[field.name] = [getattr(o, rel_key_id) for o in getattr(live_obj, field.column_name)]
+                if plan.attribute_fields:
+                    obj_dict.update(live_obj.to_dict(only=[f.column_name for f in plan.attribute_fields]))
+            else:
+                obj_dict.update({field.name: [] for field in plan.m2m_fields})
+            if with_str and not inspect.iscoroutinefunction(type(live_obj).__str__):
+                obj_dict["__str__"] = str(live_obj)
+
+            values = {}
+            for field_name, display_field_function in (
+                *plan.sync_display_functions,
+                *plan.inline_display_functions,
+            ):
+                values[field_name] = display_field_function(live_obj)
+            for field_name, values_by_pk in batch_values.items():
+                values[field_name] = values_by_pk.get(pk)
+            rows.append((obj_dict, values))
+        return rows
+
+    async def serialize_objs(
+        self,
+        objs: list[Any],
+        list_view: bool = False,
+        with_deferred_fields: bool = True,
+        fields: Collection[str] | None = None,
+        plan: SerializationPlan | None = None,
+        with_str: bool = True,
+    ) -> list[dict]:
+        """Serialize a page of orm model objs to dicts in one db_session.
+
+        Async display functions (and an async ``__str__``) still run on the event loop
+        against the objects as passed in.
+
+        :params objs: a list of objects.
+        :params list_view: a flag to serialize for the list view.
+        :params with_deferred_fields: a flag to serialize the fields of get_list_deferred_fields (list view only).
+        :params fields: a sparse fieldset to serialize (None for all fields).
+        :params plan: a serialization plan to execute (instead of the plan of with_deferred_fields and fields).
+        :params with_str: a flag to serialize __str__.
+        :return: A list of dicts.
+        """
+        if not objs:
+            return []
+        if plan is None:
+            plan = self.get_serialization_plan(
+                list_view=list_view, with_deferred_fields=with_deferred_fields, fields=fields
+            )
+        rows = await self._serialize_objs_in_session(objs, plan, with_str)
+        async_batch_values = {
+            field_name: await display_field_function(objs)
+            for field_name, display_field_function in plan.async_batch_display_functions
+        }
+
+        obj_dicts = []
+        for obj, (obj_dict, values) in zip(objs, rows, strict=True):
+            if with_str and "__str__" not in obj_dict:
+                obj_dict["__str__"] = await type(obj).__str__(obj)
+            for field_name, display_field_function in plan.async_display_functions:
+                values[field_name] = await display_field_function(obj)
+            for field_name, values_by_pk in async_batch_values.items():
+                values[field_name] = values_by_pk.get(getattr(obj, plan.pk_name))
+            for field_name, _ in plan.display_functions:
+                obj_dict[field_name] = values[field_name]
+            obj_dicts.append(obj_dict)
+        return obj_dicts
+
+    async def serialize_obj(self, obj: Any, list_view: bool = False, fields: Collection[str] | None = None) -> dict:
+        """Serialize orm model obj to dict (in one db_session, see :meth:`serialize_objs`).
+
+        :params obj: an object.
+        :params list_view: a flag to serialize for the list view.
+        :params fields: a sparse fieldset to serialize (None for all fields).
+        :return: A dict.
+        """
+        return (await self.serialize_objs([obj], list_view=list_view, fields=fields))[0]
+
     @sync_to_async
     @db_session
     def orm_save_obj(self, id: UUID | Any | None, payload: dict) -> Any:
@@ -426,6 +616,26 @@ class PonyORMMixin:
         rel_key_id = self.get_model_pk_name(rel_model_cls)
         return [getattr(o, rel_key_id) for o in getattr(obj, field)]
 
+    @sync_to_async
+    @db_session
+    def orm_get_m2m_ids_bulk(self, objs: list[Any], field: str) -> list[list[int | UUID]]:
+        """This method is used to get m2m ids of several objects with one query.
+
+        :params objs: a list of objects.
+        :params field: a m2m field name.
+
+        :return: A list of lists of ids, in the order of objs.
+        """
+        if not objs:
+            return []
+        key_id = self.get_model_pk_name(self.model_cls)
+        rel_attr = getattr(self.model_cls, field)
+        rel_key_id = self.get_model_pk_name(rel_attr.py_type)
+        pks = [getattr(obj, key_id) for obj in objs]
+        loaded = self.model_cls.select(lambda o: getattr(o, key_id) in pks).prefetch(rel_attr)
+        ids_by_pk = {getattr(o, key_id): [getattr(r, rel_key_id) for r in getattr(o, field)] for o in loaded}
+        return [ids_by_pk.get(pk, []) for pk in pks]
+
     @sync_to_async
     @db_session
     def orm_save_m2m_ids(self, obj: Any, field: str, ids: list[int | str | UUID]) -> None:
@@ -463,12 +673,17 @@ class PonyORMMixin:
     @sync_to_async
     @db_session
     def serialize_obj_attributes(
-        self, obj: Any, attributes_to_serizalize: list[ModelFieldWidgetSchema], list_view: bool = False
+        self,
+        obj: Any,
+        attributes_to_serizalize: list[ModelFieldWidgetSchema],
+        list_view: bool = False,
+        with_str: bool = True,
     ) -> dict[str, Any]:
         """Serialize orm model obj attribute to dict.
 
         :params obj: an object.
         :params attributes_to_serizalize: a list of attributes to serialize.
+        :params with_str: a flag to add the ``__str__`` representation of the object.
         :return: A dict of serialized attributes.
         """
         data = {}
@@ -477,7 +692,10 @@ class PonyORMMixin:
         if not obj:
             return data
 
-        return obj.to_dict(only=(f.column_name for f in attributes_to_serizalize))
+        data = obj.to_dict(only=(f.column_name for f in attributes_to_serizalize))
+        if with_str:
+            data["__str__"] = str(obj)
+        return data
 
 
 class PonyORMModelAdmin(PonyORMMixin, ModelAdmin):
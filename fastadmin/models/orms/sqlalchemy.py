@@ -1,13 +1,21 @@
+import asyncio
 import contextlib
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import BIGINT, Integer, String, and_, cast, func, inspect, or_, select
-from sqlalchemy.orm import selectinload
-
-from fastadmin.models.base import InlineModelAdmin, ModelAdmin
+from sqlalchemy import BIGINT, Integer, String, and_, cast, func, inspect, or_, select, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import aliased, defer, selectinload
+
+from fastadmin.models.base import (
+    InlineModelAdmin,
+    ModelAdmin,
+    get_estimated_count_query,
+    get_keyset_lookups,
+    parse_estimated_count,
+)
 from fastadmin.models.helpers import getattrs
-from fastadmin.models.schemas import ModelFieldWidgetSchema, WidgetType
+from fastadmin.models.schemas import ModelFieldWidgetSchema, NumberType, WidgetType
 from fastadmin.settings import settings
 
 
@@ -98,6 +106,15 @@ class SqlAlchemyMixin:
             return pk_columns[0].name
         return "id"
 
+    def get_related_model_cls(self, field_name: str) -> Any | None:
+        """This method is used to get the related orm/db model class of a relation field.
+
+        :params field_name: a name of field.
+        :return: A related model class or None if the field is not a relation.
+        """
+        mapper = getattr(getattr(getattr(self.model_cls, field_name, None), "property", None), "mapper", None)
+        return mapper.class_ if mapper is not None else None
+
     def get_model_fields_with_widget_types(
         self,
         with_m2m: bool | None = None,
@@ -154,6 +171,9 @@ class SqlAlchemyMixin:
                 else {}
             )
 
+            number_type: NumberType | None = None
+            number_precision: int | None = None
+            number_scale: int | None = None
             form_widget_type = WidgetType.Input
             form_widget_props = {
                 "required": required,
@@ -189,6 +209,15 @@ class SqlAlchemyMixin:
                 case "Integer" | "Float" | "Decimal":
                     form_widget_type = WidgetType.InputNumber
                     filter_widget_type = WidgetType.InputNumber
+                    match field_type:
+                        case "Integer":
+                            number_type = NumberType.Integer
+                        case "Float":
+                            number_type = NumberType.Float
+                        case _:
+                            number_type = NumberType.Decimal
+                            number_precision = orm_model_field.type.precision
+                            number_scale = orm_model_field.type.scale
                 case "Date":
                     form_widget_type = WidgetType.DatePicker
                     form_widget_props["format"] = settings.ADMIN_DATE_FORMAT
@@ -299,6 +328,9 @@ class SqlAlchemyMixin:
                     form_widget_props=form_widget_props,
                     filter_widget_type=filter_widget_type,
                     filter_widget_props=filter_widget_props,
+                    number_type=number_type,
+                    number_precision=number_precision,
+                    number_scale=number_scale,
                 )
             )
         return fields
@@ -310,7 +342,12 @@ class SqlAlchemyMixin:
         search: str | None = None,
         sort_by: str | None = None,
         filters: dict | None = None,
-    ) -> tuple[list[Any], int]:
+        defer_fields: list[str] | None = None,
+        with_count: bool = True,
+        count_limit: int | None = None,
+        keyset_ordering: list[str] | None = None,
+        keyset_values: list[Any] | None = None,
+    ) -> tuple[list[Any], int | None]:
         """This method is used to get list of orm/db model objects.
 
         :params offset: an offset for pagination.
@@ -318,6 +355,11 @@ class SqlAlchemyMixin:
         :params search: a search query.
         :params sort_by: a sort by field name.
         :params filters: a dict of filters.
+        :params defer_fields: a list of column names not to load.
+        :params with_count: a flag to count the objects (the total is None otherwise).
+        :params count_limit: a number of objects to stop counting at (the total is at most count_limit + 1).
+        :params keyset_ordering: a list of field names ending with the primary key to order by (instead of sort_by).
+        :params keyset_values: a list of values of keyset_ordering fields to get the objects after (not counted).
         :return: A tuple of list of objects and total count.
         """
 
@@ -407,7 +449,9 @@ class SqlAlchemyMixin:
                 qs = qs.where(or_(*q))
 
             order_columns = []
-            if sort_by:
+            if keyset_ordering:
+                order_columns = [order_column(f) for f in keyset_ordering]
+            elif sort_by:
                 column = order_column(sort_by)
                 if column is not None:
                     order_columns.append(column)
@@ -416,20 +460,69 @@ class SqlAlchemyMixin:
             if order_columns:
                 qs = qs.order_by(*order_columns)
 
-            count_stmt = select(func.count()).select_from(qs.subquery())
-            total = (await session.execute(count_stmt)).scalar_one()
+            total = count_stmt = None
+            if with_count:
+                count_qs = qs if count_limit is None else qs.limit(count_limit + 1)
+                count_stmt = select(func.count()).select_from(count_qs.subquery())
+                if not self.list_count_concurrently:
+                    total = (await session.execute(count_stmt)).scalar_one()
+
+            if keyset_ordering and keyset_values is not None:
+                q = []
+                for lookups in get_keyset_lookups(keyset_ordering, keyset_values):
+                    seek = []
+                    for lookup, value in lookups.items():
+                        field, _, condition = lookup.partition("__")
+                        model_field = getattr(self.model_cls, field)
+                        match condition:
+                            case "gt":
+                                seek.append(model_field > value)
+                            case "lt":
+                                seek.append(model_field < value)
+                            case _:
+                                seek.append(model_field == value)
+                    q.append(and_(*seek))
+                qs = qs.where(or_(*q))
 
             if self.list_select_related:
                 for field in self.list_select_related:
                     qs = qs.options(selectinload(getattr(self.model_cls, field)))
 
+            if defer_fields:
+                qs = qs.options(*(defer(getattr(self.model_cls, field)) for field in defer_fields))
+
             if offset is not None and limit is not None:
                 qs = qs.offset(offset)
                 qs = qs.limit(limit)
 
-            result = await session.scalars(qs)
+            if count_stmt is not None and self.list_count_concurrently:
+
+                async def count() -> int:
+                    # a second session checks out its own pooled connection
+                    async with sessionmaker() as count_session:
+                        return (await count_session.execute(count_stmt)).scalar_one()
+
+                total, result = await asyncio.gather(count(), session.scalars(qs))
+            else:
+                result = await session.scalars(qs)
             return list(result), total
 
+    async def orm_get_estimated_count(self) -> int | None:
+        """This method is used to get the estimated count of orm/db model objects from database statistics.
+
+        :return: An estimated count, or None if no estimate is available.
+        """
+        sessionmaker = self.get_sessionmaker()
+        async with sessionmaker() as session:
+            query = get_estimated_count_query(session.bind.dialect.name, ":table_name")
+            if query is None:
+                return None
+            try:
+                value = (await session.execute(text(query), {"table_name": self.model_cls.__table__.fullname})).scalar()
+            except SQLAlchemyError:
+                return None
+        return parse_estimated_count(value)
+
     async def orm_get_obj(self, id: UUID | int | str) -> Any | None:
         """This method is used to get orm/db model object.
 
@@ -530,6 +623,31 @@ class SqlAlchemyMixin:
             rel_pk_name = self.get_model_pk_name(related_class)
             return [getattr(related_obj, rel_pk_name) for related_obj in getattr(loaded, field, [])]
 
+    async def orm_get_m2m_ids_bulk(self, objs: list[Any], field: str) -> list[list[int | UUID]]:
+        """This method is used to get m2m ids of several objects with one query.
+
+        :params objs: a list of objects.
+        :params field: a m2m field name.
+
+        :return: A list of lists of ids, in the order of objs.
+        """
+        if not objs:
+            return []
+        id_key = self.get_model_pk_name(self.model_cls)
+        pk_column = getattr(self.model_cls, id_key)
+        rel_attr = getattr(self.model_cls, field)
+        # aliased so that self-referential m2m relationships join unambiguously
+        related_class = aliased(rel_attr.property.mapper.class_)
+        rel_pk_column = getattr(related_class, self.get_model_pk_name(rel_attr.property.mapper.class_))
+        pks = [getattr(obj, id_key) for obj in objs]
+        ids_by_pk: dict[Any, list[int | UUID]] = {pk: [] for pk in pks}
+        qs = select(pk_column, rel_pk_column).join(rel_attr.of_type(related_class)).where(pk_column.in_(pks))
+        sessionmaker = self.get_sessionmaker()
+        async with sessionmaker() as session:
+            for pk, rel_id in await session.execute(qs):
+                ids_by_pk[pk].append(rel_id)
+        return [ids_by_pk[pk] for pk in pks]
+
     async def orm_save_m2m_ids(self, obj: Any, field: str, ids: list[int | str | UUID]) -> None:
         """This method is used to get m2m ids.
 
@@ -1,14 +1,25 @@
+import asyncio
 import functools
 import operator
 from typing import Any
 from uuid import UUID
 
+from tortoise.exceptions import BaseORMException
 from tortoise.expressions import Q
 
-from fastadmin.models.base import InlineModelAdmin, ModelAdmin
-from fastadmin.models.schemas import ModelFieldWidgetSchema, WidgetType
+from fastadmin.models.base import (
+    InlineModelAdmin,
+    ModelAdmin,
+    get_estimated_count_query,
+    get_keyset_lookups,
+    parse_estimated_count,
+)
+from fastadmin.models.schemas import ModelFieldWidgetSchema, NumberType, WidgetType
 from fastadmin.settings import settings
 
+# Bound parameter placeholders of the Tortoise database clients.
+_PLACEHOLDERS = {"postgres": "$1", "mysql": "%s", "sqlite": "?"}
+
 
 class TortoiseMixin:
     def _resolve_ordering_field(self, ordering_field: str) -> str:
@@ -44,6 +55,14 @@ class TortoiseMixin:
         """
         return orm_model_cls._meta.pk_attr
 
+    def get_related_model_cls(self, field_name: str) -> Any | None:
+        """This method is used to get the related orm/db model class of a relation field.
+
+        :params field_name: a name of field.
+        :return: A related model class or None if the field is not a relation.
+        """
+        return getattr(self.model_cls._meta.fields_map.get(field_name), "related_model", None)
+
     def get_model_fields_with_widget_types(
         self,
         with_m2m: bool | None = None,
@@ -97,6 +116,9 @@ class TortoiseMixin:
                 else {}
             )
 
+            number_type: NumberType | None = None
+            number_precision: int | None = None
+            number_scale: int | None = None
             form_widget_type = WidgetType.Input
             form_widget_props = {
                 "required": required,
@@ -132,6 +154,15 @@ class TortoiseMixin:
                 case "IntField" | "SmallIntField" | "BigIntField" | "FloatField" | "DecimalField":
                     form_widget_type = WidgetType.InputNumber
                     filter_widget_type = WidgetType.InputNumber
+                    match field_type:
+                        case "FloatField":
+                            number_type = NumberType.Float
+                        case "DecimalField":
+                            number_type = NumberType.Decimal
+                            number_precision = orm_model_field.max_digits
+                            number_scale = orm_model_field.decimal_places
+                        case _:
+                            number_type = NumberType.Integer
                 case "DateField":
                     form_widget_type = WidgetType.DatePicker
                     form_widget_props["format"] = settings.ADMIN_DATE_FORMAT
@@ -241,6 +272,9 @@ class TortoiseMixin:
                     form_widget_props=form_widget_props,
                     filter_widget_type=filter_widget_type,
                     filter_widget_props=filter_widget_props,
+                    number_type=number_type,
+                    number_precision=number_precision,
+                    number_scale=number_scale,
                 )
             )
         return fields
@@ -252,7 +286,12 @@ class TortoiseMixin:
         search: str | None = None,
         sort_by: str | None = None,
         filters: dict | None = None,
-    ) -> tuple[list[Any], int]:
+        defer_fields: list[str] | None = None,
+        with_count: bool = True,
+        count_limit: int | None = None,
+        keyset_ordering: list[str] | None = None,
+        keyset_values: list[Any] | None = None,
+    ) -> tuple[list[Any], int | None]:
         """This method is used to get list of orm/db model objects.
 
         :params offset: an offset for pagination.
@@ -260,6 +299,11 @@ class TortoiseMixin:
         :params search: a search query.
         :params sort_by: a sort by field name.
         :params filters: a dict of filters.
+        :params defer_fields: a list of column names not to load.
+        :params with_count: a flag to count the objects (the total is None otherwise).
+        :params count_limit: a number of objects to stop counting at (the total is at most count_limit + 1).
+        :params keyset_ordering: a list of field names ending with the primary key to order by (instead of sort_by).
+        :params keyset_values: a list of values of keyset_ordering fields to get the objects after (not counted).
         :return: A tuple of list of objects and total count.
         """
         qs = self.model_cls.all()
@@ -280,12 +324,42 @@ class TortoiseMixin:
                 )
             )
 
-        if sort_by:
+        if keyset_ordering:
+            qs = qs.order_by(*keyset_ordering)
+        elif sort_by:
             qs = qs.order_by(self._resolve_ordering_field(sort_by))
         elif self.ordering:
             qs = qs.order_by(*(self._resolve_ordering_field(field) for field in self.ordering))
 
-        total = await qs.count()
+        async def count(count_qs: Any) -> int:
+            if count_limit is None:
+                return await count_qs.count()
+            # Tortoise applies a limit to the counted total after counting every row,
+            # so a capped count reads the primary keys of at most count_limit + 1 rows instead
+            pk_name = self.get_model_pk_name(self.model_cls)
+            return len(await count_qs.limit(count_limit + 1).values_list(pk_name, flat=True))
+
+        count_qs = qs
+        total = await count(count_qs) if with_count and not self.list_count_concurrently else None
+
+        if keyset_ordering and keyset_values is not None:
+            qs = qs.filter(
+                functools.reduce(
+                    operator.or_,
+                    (Q(**lookups) for lookups in get_keyset_lookups(keyset_ordering, keyset_values)),
+                )
+            )
+
+        if defer_fields and not self.list_select_related:
+            # Tortoise has no defer(): load every other column with only() (which drops select_related(),
+            # so related objects win over the projection).
+            qs = qs.only(
+                *(
+                    field.column_name
+                    for field in self.get_model_fields_metadata(with_m2m=False).fields
+                    if field.column_name not in defer_fields
+                )
+            )
 
         if self.list_select_related:
             qs = qs.select_related(*self.list_select_related)
@@ -294,8 +368,33 @@ class TortoiseMixin:
             qs = qs.offset(offset)
             qs = qs.limit(limit)
 
+        if with_count and self.list_count_concurrently:
+
+            async def get_objs() -> list[Any]:
+                return await qs
+
+            # the count query runs on another pooled connection while the page is loaded
+            total, objs = await asyncio.gather(count(count_qs), get_objs())
+            return objs, total
+
         return await qs, total
 
+    async def orm_get_estimated_count(self) -> int | None:
+        """This method is used to get the estimated count of orm/db model objects from database statistics.
+
+        :return: An estimated count, or None if no estimate is available.
+        """
+        connection = self.model_cls._meta.db
+        dialect = connection.capabilities.dialect
+        query = get_estimated_count_query(dialect, _PLACEHOLDERS.get(dialect, "?"))
+        if query is None:
+            return None
+        try:
+            rows = await connection.execute_query_dict(query, [self.model_cls._meta.db_table])
+        except BaseORMException:
+            return None
+        return parse_estimated_count(next(iter(rows[0].values())) if rows else None)
+
     async def orm_get_obj(self, id: UUID | int | str) -> Any | None:
         """This method is used to get orm/db model object.
 
@@ -344,6 +443,28 @@ class TortoiseMixin:
         remote_model = m2m_rel.remote_model
         return await m2m_rel.all().values_list(self.get_model_pk_name(remote_model), flat=True)
 
+    async def orm_get_m2m_ids_bulk(self, objs: list[Any], field: str) -> list[list[int | UUID]]:
+        """This method is used to get m2m ids of several objects with one query.
+
+        :params objs: a list of objects.
+        :params field: a m2m field name.
+
+        :return: A list of lists of ids, in the order of objs.
+        """
+        if not objs:
+            return []
+        pk_name = self.get_model_pk_name(self.model_cls)
+        remote_model = self.model_cls._meta.fields_map[field].related_model
+        pks = [getattr(obj, pk_name) for obj in objs]
+        ids_by_pk: dict[Any, list[int | UUID]] = {pk: [] for pk in pks}
+        rows = await self.model_cls.filter(**{f"{pk_name}__in": pks}).values_list(
+            pk_name, f"{field}__{self.get_model_pk_name(remote_model)}"
+        )
+        for pk, rel_id in rows:
+            if rel_id is not None:
+                ids_by_pk[pk].append(rel_id)
+        return [ids_by_pk[pk] for pk in pks]
+
     async def orm_save_m2m_ids(self, obj: Any, field: str, ids: list[int | str | UUID]) -> None:
         """This method is used to get m2m ids.
 
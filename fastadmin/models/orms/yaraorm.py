@@ -1,12 +1,21 @@
+import asyncio
 import functools
 import operator
 from typing import Any
 from uuid import UUID
 
 from yara_orm import Q
-
-from fastadmin.models.base import InlineModelAdmin, ModelAdmin
-from fastadmin.models.schemas import ModelFieldWidgetSchema, WidgetType
+from yara_orm.connection import get_dialect, get_executor
+from yara_orm.exceptions import ORMError
+
+from fastadmin.models.base import (
+    InlineModelAdmin,
+    ModelAdmin,
+    get_estimated_count_query,
+    get_keyset_lookups,
+    parse_estimated_count,
+)
+from fastadmin.models.schemas import ModelFieldWidgetSchema, NumberType, WidgetType
 from fastadmin.settings import settings
 
 
@@ -79,6 +88,14 @@ class YaraOrmMixin:
         filter_widget_props["mode"] = "multiple"
         return WidgetType.AsyncSelect, WidgetType.AsyncSelect
 
+    def get_related_model_cls(self, field_name: str) -> Any | None:
+        """This method is used to get the related orm/db model class of a relation field.
+
+        :params field_name: a name of field.
+        :return: A related model class or None if the field is not a relation.
+        """
+        return self._get_relation_target(field_name)
+
     def get_model_fields_with_widget_types(
         self,
         with_m2m: bool | None = None,
@@ -130,6 +147,9 @@ class YaraOrmMixin:
                 else {}
             )
 
+            number_type: NumberType | None = None
+            number_precision: int | None = None
+            number_scale: int | None = None
             form_widget_type = WidgetType.Input
             form_widget_props = {
                 "required": required,
@@ -157,6 +177,15 @@ class YaraOrmMixin:
                 case "IntField" | "SmallIntField" | "BigIntField" | "FloatField" | "DecimalField":
                     form_widget_type = WidgetType.InputNumber
                     filter_widget_type = WidgetType.InputNumber
+                    match field_type:
+                        case "FloatField":
+                            number_type = NumberType.Float
+                        case "DecimalField":
+                            number_type = NumberType.Decimal
+                            number_precision = orm_model_field.type_params["max_digits"]
+                            number_scale = orm_model_field.type_params["decimal_places"]
+                        case _:
+                            number_type = NumberType.Integer
                 case "UUIDField":
                     form_widget_type = WidgetType.Input
                     filter_widget_type = WidgetType.Input
@@ -219,6 +248,9 @@ class YaraOrmMixin:
                     form_widget_props=form_widget_props,
                     filter_widget_type=filter_widget_type,
                     filter_widget_props=filter_widget_props,
+                    number_type=number_type,
+                    number_precision=number_precision,
+                    number_scale=number_scale,
                 )
             )
         return fields
@@ -230,7 +262,12 @@ class YaraOrmMixin:
         search: str | None = None,
         sort_by: str | None = None,
         filters: dict | None = None,
-    ) -> tuple[list[Any], int]:
+        defer_fields: list[str] | None = None,
+        with_count: bool = True,
+        count_limit: int | None = None,
+        keyset_ordering: list[str] | None = None,
+        keyset_values: list[Any] | None = None,
+    ) -> tuple[list[Any], int | None]:
         """This method is used to get list of orm/db model objects.
 
         :params offset: an offset for pagination.
@@ -238,6 +275,11 @@ class YaraOrmMixin:
         :params search: a search query.
         :params sort_by: a sort by field name.
         :params filters: a dict of filters.
+        :params defer_fields: a list of column names not to load.
+        :params with_count: a flag to count the objects (the total is None otherwise).
+        :params count_limit: a number of objects to stop counting at (the total is at most count_limit + 1).
+        :params keyset_ordering: a list of field names ending with the primary key to order by (instead of sort_by).
+        :params keyset_values: a list of values of keyset_ordering fields to get the objects after (not counted).
         :return: A tuple of list of objects and total count.
         """
         qs = self.model_cls.all()
@@ -258,22 +300,60 @@ class YaraOrmMixin:
                 )
             )
 
-        if sort_by:
+        if keyset_ordering:
+            qs = qs.order_by(*keyset_ordering)
+        elif sort_by:
             qs = qs.order_by(self._resolve_ordering_field(sort_by))
         elif self.ordering:
             qs = qs.order_by(*(self._resolve_ordering_field(field) for field in self.ordering))
 
-        total = await qs.count()
+        count_qs = qs if count_limit is None else qs.limit(count_limit + 1)
+        total = await count_qs.count() if with_count and not self.list_count_concurrently else None
+
+        if keyset_ordering and keyset_values is not None:
+            qs = qs.filter(
+                functools.reduce(
+                    operator.or_,
+                    (Q(**lookups) for lookups in get_keyset_lookups(keyset_ordering, keyset_values)),  # ty: ignore[invalid-argument-type]
+                )
+            )
 
         if self.list_select_related:
             qs = qs.select_related(*self.list_select_related)
 
+        if defer_fields:
+            qs = qs.defer(*defer_fields)
+
         if offset is not None and limit is not None:
             qs = qs.offset(offset)
             qs = qs.limit(limit)
 
+        if with_count and self.list_count_concurrently:
+
+            async def get_objs() -> list[Any]:
+                return await qs
+
+            # the count query runs on another pooled connection while the page is loaded
+            total, objs = await asyncio.gather(count_qs.count(), get_objs())
+            return objs, total
+
         return await qs, total
 
+    async def orm_get_estimated_count(self) -> int | None:
+        """This method is used to get the estimated count of orm/db model objects from database statistics.
+
+        :return: An estimated count, or None if no estimate is available.
+        """
+        dialect = get_dialect(self.model_cls)
+        query = get_estimated_count_query(dialect.name, dialect.placeholder(1))
+        if query is None:
+            return None
+        try:
+            row = await get_executor(self.model_cls).fetch_row(query, [self.model_cls._meta.db_table])
+        except ORMError:
+            return None
+        return parse_estimated_count(row[0] if row else None)
+
     async def orm_get_obj(self, id: UUID | int | str) -> Any | None:
         """This method is used to get orm/db model object.
 
@@ -321,6 +401,27 @@ class YaraOrmMixin:
         target_model = m2m_rel.target
         return await m2m_rel.all().values_list(self.get_model_pk_name(target_model), flat=True)
 
+    async def orm_get_m2m_ids_bulk(self, objs: list[Any], field: str) -> list[list[int | UUID]]:
+        """This method is used to get m2m ids of several objects with one query.
+
+        :params objs: a list of objects.
+        :params field: a m2m field name.
+        :return: A list of lists of ids, in the order of objs.
+        """
+        if not objs:
+            return []
+        pk_name = self.get_model_pk_name(self.model_cls)
+        target_model = self.model_cls._meta.m2m[field].resolve_target()
+        pks = [getattr(obj, pk_name) for obj in objs]
+        ids_by_pk: dict[Any, list[int | UUID]] = {pk: [] for pk in pks}
+        rows = await self.model_cls.filter(**{f"{pk_name}__in": pks}).values_list(
+            pk_name, f"{field}__{self.get_model_pk_name(target_model)}"
+        )
+        for pk, rel_id in rows:
+            if rel_id is not None:
+                ids_by_pk[pk].append(rel_id)
+        return [ids_by_pk[pk] for pk in pks]
+
     async def orm_save_m2m_ids(self, obj: Any, field: str, ids: list[int | str | UUID]) -> None:
         """This method is used to save m2m ids.
 
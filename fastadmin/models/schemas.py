@@ -33,6 +33,14 @@ class WidgetType(str, Enum):
     UploadImage = "UploadImage"
 
 
+class NumberType(str, Enum):
+    """Number type (of the values of a number field)"""
+
+    Integer = "Integer"
+    Float = "Float"
+    Decimal = "Decimal"
+
+
 class WidgetActionType(str, Enum):
     """Widget action type"""
 
@@ -53,6 +61,36 @@ class ModelPermission(str, Enum):
     Export = "Export"
 
 
+class ListCountStrategy(str, Enum):
+    """List count strategy"""
+
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    AUTO = "auto"
+    NONE = "none"
+
+
+class ListPagination(str, Enum):
+    """List pagination"""
+
+    OFFSET = "offset"
+    CURSOR = "cursor"
+
+
+@dataclass
+class ListResult:
+    """List page result: the serialized objects of the page with the list total and the pagination metadata"""
+
+    results: list[dict]
+    # None when the objects are not counted (see ListCountStrategy.NONE)
+    total: int | None
+    total_is_approximate: bool = False
+    total_is_capped: bool = False
+    has_next: bool | None = None
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+
+
 class ActionResponseType(str, Enum):
     """Action response type"""
 
@@ -196,6 +234,7 @@ class BaseModelSchema:
     preserve_filters: bool | None
     list_max_show_all: int | None
     show_full_result_count: bool | None
+    list_pagination: ListPagination
     verbose_name: str | None
     verbose_name_plural: str | None
 
@@ -253,6 +292,19 @@ class ModelFieldWidgetSchema:
     form_widget_props: dict
     filter_widget_type: WidgetType
     filter_widget_props: dict
+    # the type of the values of a number column (the column types of Parquet exports)
+    number_type: NumberType | None = None
+    # the digits and the decimal places of a NumberType.Decimal column
+    number_precision: int | None = None
+    number_scale: int | None = None
+
+
+@dataclass
+class ModelFieldsMetadataSchema:
+    """Orm model fields metadata schema (fields with a name index)"""
+
+    fields: list[ModelFieldWidgetSchema]
+    by_name: dict[str, ModelFieldWidgetSchema]
 
 
 @dataclass
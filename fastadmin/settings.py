@@ -58,10 +58,78 @@ class Settings:
     # "lax" blocks the cross-site POST/PATCH/DELETE requests behind CSRF.
     ADMIN_SESSION_COOKIE_SAMESITE: str = os.getenv("ADMIN_SESSION_COOKIE_SAMESITE", "lax")
 
-    # Hard upper bound on the number of rows a single list/export request may
+    # Hard upper bound on the number of rows a single list request may
     # return. Caps memory/CPU use from a crafted limit=100000000 request.
     ADMIN_QUERY_MAX_LIMIT: int = _env_int("ADMIN_QUERY_MAX_LIMIT", 1000)
 
+    # Hard upper bound on the number of rows a single export request may return.
+    # Exports are streamed chunk by chunk (see ModelAdmin.export_chunk_size), so it can be far above
+    # ADMIN_QUERY_MAX_LIMIT without the export being held in memory.
+    ADMIN_EXPORT_MAX_LIMIT: int = _env_int("ADMIN_EXPORT_MAX_LIMIT", 100000)
+
+    # Pool the CPU-bound encoding of export chunks (CSV and JSON writing, formula neutralizing, XLSX and
+    # Parquet conversion) runs on, so a large export does not stall the other requests of the worker:
+    # "thread", "process" (more cores for CSV/JSON/NDJSON; XLSX and Parquet writers keep their state
+    # across chunks, so they run on threads) or "none" (on the event loop).
+    ADMIN_EXPORT_ENCODER_POOL: str = os.getenv("ADMIN_EXPORT_ENCODER_POOL", "thread")
+
+    # Number of workers of the export encoder pool (0 for the executor default).
+    ADMIN_EXPORT_ENCODER_WORKERS: int = _env_int("ADMIN_EXPORT_ENCODER_WORKERS", 0)
+
+    # Exports of more rows than this (the requested limit) run as background jobs: the export request
+    # returns a job (202) which is polled at /api/export-jobs/<id> and downloaded from
+    # /api/export-jobs/<id>/download. Jobs run on the application event loop, so they are only used
+    # under an ASGI server (FastAPI, Django ASGI); Flask always streams. The bundled frontend does
+    # not poll jobs, so they are meant for API clients. 0 (default) disables them.
+    ADMIN_EXPORT_JOB_THRESHOLD: int = _env_int("ADMIN_EXPORT_JOB_THRESHOLD", 0)
+
+    # Number of seconds a finished export job and its file are kept for.
+    ADMIN_EXPORT_JOB_TTL: int = _env_int("ADMIN_EXPORT_JOB_TTL", 3600)
+
+    # Directory of the export job files (the system temporary directory at default).
+    ADMIN_EXPORT_JOB_DIR: str | None = os.getenv("ADMIN_EXPORT_JOB_DIR") or None
+
+    # Number of seconds the total of a list query (per model, user, search and filters) is cached for,
+    # so paging through the same list counts once. Adding, changing, deleting or running an action
+    # on a model drops its cached totals. 0 disables the cache.
+    ADMIN_LIST_TOTAL_CACHE_TTL: int = _env_int("ADMIN_LIST_TOTAL_CACHE_TTL", 0)
+
+    # Maximum number of cached list totals (the least recently used are dropped first).
+    ADMIN_LIST_TOTAL_CACHE_SIZE: int = _env_int("ADMIN_LIST_TOTAL_CACHE_SIZE", 1024)
+
+    # Number of seconds the anchor index of a list query (see ModelAdmin.list_anchor_pages) is kept for.
+    # Adding, changing, deleting or running an action on a model drops its anchors.
+    ADMIN_LIST_ANCHOR_CACHE_TTL: int = _env_int("ADMIN_LIST_ANCHOR_CACHE_TTL", 300)
+
+    # Maximum number of cached anchor indexes (the least recently used are dropped first).
+    ADMIN_LIST_ANCHOR_CACHE_SIZE: int = _env_int("ADMIN_LIST_ANCHOR_CACHE_SIZE", 256)
+
+    # Number of seconds a signed-in user (per session) is cached for, so authenticating a request neither
+    # reads nor serializes the user again. Changing, deleting or changing the password of a user through
+    # the admin drops its cached sessions, but a user deactivated or deleted outside the admin keeps access
+    # for up to this number of seconds. 0 disables the cache.
+    ADMIN_USER_CACHE_TTL: int = _env_int("ADMIN_USER_CACHE_TTL", 5)
+
+    # Maximum number of cached signed-in users (the least recently used are dropped first).
+    ADMIN_USER_CACHE_SIZE: int = _env_int("ADMIN_USER_CACHE_SIZE", 1024)
+
+    # Server-side session store: "memory" (in process, for a single worker), "sqlite" (a file shared by
+    # the workers of one host), "redis" (needs the redis extra) or "" (default) for stateless sessions.
+    # With a store, requests are authenticated against it instead of the user table, signing out
+    # revokes the session and a user keeps at most ADMIN_SESSION_MAX_PER_USER sessions.
+    ADMIN_SESSION_STORE: str = os.getenv("ADMIN_SESSION_STORE", "")
+
+    # Path of the SQLite file (required by the sqlite store) or Redis URL (redis://localhost:6379/0
+    # at default) of the session store.
+    ADMIN_SESSION_STORE_URL: str | None = os.getenv("ADMIN_SESSION_STORE_URL") or None
+
+    # Maximum number of active sessions of a user in the session store (the oldest are revoked
+    # first). 0 for no limit.
+    ADMIN_SESSION_MAX_PER_USER: int = _env_int("ADMIN_SESSION_MAX_PER_USER", 10)
+
+    # Maximum number of sessions of the "memory" session store (the least recently used are dropped first).
+    ADMIN_SESSION_STORE_SIZE: int = _env_int("ADMIN_SESSION_STORE_SIZE", 10000)
+
     # This value is the date format for JS widgets.
     ADMIN_DATE_FORMAT: str = os.getenv("ADMIN_DATE_FORMAT", "YYYY-MM-DD")
 
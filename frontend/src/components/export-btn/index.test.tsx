@@ -99,11 +99,24 @@ vi.mock("antd", () => ({
         <button type="button" onClick={() => onFinish?.({ limit: 10 })}>
           trigger-submit
         </button>
+        <button
+          type="button"
+          onClick={() => onFinish?.({ limit: 10, format: "CSV", gzip: true })}
+        >
+          trigger-gzip-submit
+        </button>
+        <button
+          type="button"
+          onClick={() => onFinish?.({ limit: 10, format: "XLSX", gzip: true })}
+        >
+          trigger-xlsx-gzip-submit
+        </button>
         {children}
       </div>
     ),
     {
       useForm: () => [formMock],
+      useWatch: () => EExportFormat.CSV,
       Item: ({ children }: { children: React.ReactNode }) => (
         <div>{children}</div>
       ),
@@ -120,6 +133,18 @@ vi.mock("antd", () => ({
     },
   ),
   InputNumber: () => <input />,
+  Checkbox: ({
+    children,
+    disabled,
+  }: {
+    children: React.ReactNode;
+    disabled?: boolean;
+  }) => (
+    <label>
+      <input type="checkbox" disabled={disabled} />
+      {children}
+    </label>
+  ),
 }));
 
 describe("ExportBtn", () => {
@@ -141,14 +166,35 @@ describe("ExportBtn", () => {
     fireEvent.click(screen.getByRole("button", { name: /Export/i }));
     expect(screen.getByTestId("modal-open").textContent).toBe("true");
 
+    expect((screen.getByRole("checkbox") as HTMLInputElement).disabled).toBe(
+      false,
+    );
     fireEvent.click(screen.getByRole("button", { name: "trigger-submit" }));
-    expect(mockMutate).toHaveBeenCalledWith({ limit: 10 });
+    expect(mockMutate).toHaveBeenCalledWith({ limit: 10, gzip: false });
+
+    // XLSX and Parquet files are compressed already
+    fireEvent.click(
+      screen.getByRole("button", { name: "trigger-gzip-submit" }),
+    );
+    expect(mockMutate).toHaveBeenCalledWith({
+      limit: 10,
+      format: "CSV",
+      gzip: true,
+    });
+    fireEvent.click(
+      screen.getByRole("button", { name: "trigger-xlsx-gzip-submit" }),
+    );
+    expect(mockMutate).toHaveBeenLastCalledWith({
+      limit: 10,
+      format: "XLSX",
+      gzip: false,
+    });
 
     fireEvent.click(screen.getByRole("button", { name: "close-modal" }));
     expect(screen.getByTestId("modal-open").textContent).toBe("false");
   });
 
-  it("handles mutation success for JSON and CSV and handles error", async () => {
+  it("handles mutation success for every format and handles error", async () => {
     let mutationOptions: any;
     mockUseMutation.mockImplementation((options: any) => {
       mutationOptions = options;
@@ -165,10 +211,11 @@ describe("ExportBtn", () => {
     expect(mockPostFetcher).toHaveBeenCalledWith(
       expect.stringContaining("/export/Event?"),
       { limit: 5 },
+      { responseType: "blob" },
     );
 
-    mutationOptions.onSuccess({ rows: [1] });
-    expect(mockFileDownload).toHaveBeenCalledWith('{"rows":[1]}', "Event.json");
+    mutationOptions.onSuccess("[]");
+    expect(mockFileDownload).toHaveBeenCalledWith("[]", "Event.json");
     expect(formMock.resetFields).toHaveBeenCalled();
     expect(mockMessageSuccess).toHaveBeenCalledWith("Successfully exported");
 
@@ -179,6 +226,20 @@ describe("ExportBtn", () => {
     mutationOptions.onSuccess("a,b,csv");
     expect(mockFileDownload).toHaveBeenCalledWith("a,b,csv", "Event.csv");
 
+    formMock.getFieldValue.mockImplementation((field: string) => {
+      if (field === "format") return EExportFormat.PARQUET;
+      return undefined;
+    });
+    mutationOptions.onSuccess("PAR1");
+    expect(mockFileDownload).toHaveBeenCalledWith("PAR1", "Event.parquet");
+
+    formMock.getFieldValue.mockImplementation((field: string) => {
+      if (field === "format") return EExportFormat.NDJSON;
+      return undefined;
+    });
+    mutationOptions.onSuccess("gz", { format: EExportFormat.NDJSON, gzip: true });
+    expect(mockFileDownload).toHaveBeenCalledWith("gz", "Event.ndjson.gz");
+
     mutationOptions.onError();
     expect(mockMessageError).toHaveBeenCalledWith("Server error");
   });
@@ -2,6 +2,7 @@ import { DownloadOutlined } from "@ant-design/icons";
 import { useMutation } from "@tanstack/react-query";
 import {
   Button,
+  Checkbox,
   Col,
   Divider,
   Form,
@@ -22,6 +23,13 @@ import { postFetcher } from "@/fetchers/fetchers";
 import { transformFiltersToServer } from "@/helpers/transform";
 import { EExportFormat } from "@/interfaces/configuration";
 
+// text formats the server can compress (XLSX and Parquet files are compressed already)
+const GZIP_EXPORT_FORMATS: string[] = [
+  EExportFormat.CSV,
+  EExportFormat.JSON,
+  EExportFormat.NDJSON,
+];
+
 export interface IExportBtn {
   model?: string;
   search?: string;
@@ -43,6 +51,7 @@ export const ExportBtn: React.FC<IExportBtn> = ({
   const { t: _t } = useTranslation("ExportBtn");
 
   const [open, setOpen] = useState<boolean>(false);
+  const format = Form.useWatch("format", form);
 
   const exportQueryString = querystring.stringify({
     search,
@@ -52,15 +61,14 @@ export const ExportBtn: React.FC<IExportBtn> = ({
 
   const { mutate: mutateExport, isPending: isLoadingExport } = useMutation({
     mutationFn: (payload: any) =>
-      postFetcher(`/export/${model}?${exportQueryString}`, payload),
-    onSuccess: (data) => {
-      const fileData =
-        form.getFieldValue("format") === EExportFormat.JSON
-          ? JSON.stringify(data)
-          : data;
+      postFetcher(`/export/${model}?${exportQueryString}`, payload, {
+        // binary formats (XLSX, Parquet) must not be decoded as text
+        responseType: "blob",
+      }),
+    onSuccess: (data, payload) => {
       fileDownload(
-        fileData,
-        `${model}.${form.getFieldValue("format").toLowerCase()}`,
+        data,
+        `${model}.${form.getFieldValue("format").toLowerCase()}${payload?.gzip ? ".gz" : ""}`,
       );
       setOpen(false);
       form.resetFields();
@@ -72,7 +80,11 @@ export const ExportBtn: React.FC<IExportBtn> = ({
   });
 
   const onExport = useCallback(
-    (data: any) => mutateExport(data),
+    ({ gzip, ...data }: any) =>
+      mutateExport({
+        ...data,
+        gzip: Boolean(gzip) && GZIP_EXPORT_FORMATS.includes(data.format),
+      }),
     [mutateExport],
   );
   const onClose = useCallback(() => setOpen(false), []);
@@ -103,19 +115,25 @@ export const ExportBtn: React.FC<IExportBtn> = ({
               initialValues={{
                 limit: 1000,
                 format: EExportFormat.CSV,
+                gzip: false,
               }}
             >
               <Form.Item name="format" label={_t("Format")}>
                 <Select
-                  options={[
-                    { label: EExportFormat.CSV, value: EExportFormat.CSV },
-                    { label: EExportFormat.JSON, value: EExportFormat.JSON },
-                  ]}
+                  options={Object.values(EExportFormat).map((format) => ({
+                    label: format,
+                    value: format,
+                  }))}
                 />
               </Form.Item>
               <Form.Item name="limit" label={_t("Max Export Count")}>
                 <InputNumber style={{ width: "100%" }} />
               </Form.Item>
+              <Form.Item name="gzip" valuePropName="checked">
+                <Checkbox disabled={!GZIP_EXPORT_FORMATS.includes(format)}>
+                  {_t("Compress (gzip)")}
+                </Checkbox>
+              </Form.Item>
               <Divider />
               <Form.Item>
                 <Button type="primary" htmlType="submit">
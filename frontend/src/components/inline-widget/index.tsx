@@ -28,6 +28,7 @@ import {
   postFetcher,
 } from "@/fetchers/fetchers";
 import { handleError } from "@/helpers/forms";
+import { getUncountedTotal } from "@/helpers/pagination";
 import { getTitleFromModel } from "@/helpers/title";
 import {
   transformDataFromServer,
@@ -486,7 +487,8 @@ export const InlineWidget: React.FC<IInlineWidget> = ({
               pagination={{
                 current: page,
                 pageSize,
-                total: data?.total,
+                total:
+                  data?.total ?? getUncountedTotal(page, pageSize, data),
                 showSizeChanger: true,
               }}
               /* v8 ignore stop */
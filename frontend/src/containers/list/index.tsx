@@ -13,7 +13,7 @@ import {
 import fileDownload from "js-file-download";
 import querystring from "query-string";
 import type React from "react";
-import { useCallback, useContext } from "react";
+import { useCallback, useContext, useEffect, useState } from "react";
 import { useTranslation } from "react-i18next";
 import { Link, useNavigate, useParams } from "react-router-dom";
 import { CrudContainer } from "@/components/crud-container";
@@ -23,6 +23,7 @@ import { ROUTES } from "@/constants/routes";
 import { deleteFetcher, getFetcher, postFetcher } from "@/fetchers/fetchers";
 import { getConfigurationModel } from "@/helpers/configuration";
 import { handleError } from "@/helpers/forms";
+import { getUncountedTotal } from "@/helpers/pagination";
 import { getTitleFromModel } from "@/helpers/title";
 import { transformFiltersToServer } from "@/helpers/transform";
 import { useIsMobile } from "@/hooks/useIsMobile";
@@ -30,6 +31,7 @@ import { useTableColumns } from "@/hooks/useTableColumns";
 import { useTableQuery } from "@/hooks/useTableQuery";
 import {
   EActionResponseType,
+  EListPagination,
   EModelPermission,
   type IActionResponse,
   type IModelAction,
@@ -68,11 +70,26 @@ export const List: React.FC = () => {
     resetTable,
   } = useTableQuery(modelConfiguration);
 
+  // cursor pagination: pages next to a loaded page are fetched with its cursors
+  // (other pages fall back to the offset)
+  const isCursorPagination =
+    modelConfiguration?.list_pagination === EListPagination.CURSOR;
+  const [pageCursors, setPageCursors] = useState<Record<string, string>>({});
+  const cursorQueryString = querystring.stringify({
+    search,
+    sort_by: sortBy,
+    limit: pageSize,
+    ...transformFiltersToServer(filters),
+  });
+
   const queryString = querystring.stringify({
     search,
     sort_by: sortBy,
     offset: (page - 1) * pageSize,
     limit: pageSize,
+    cursor: isCursorPagination
+      ? pageCursors[`${cursorQueryString}#${page}`]
+      : undefined,
     ...transformFiltersToServer(filters),
   });
 
@@ -83,6 +100,21 @@ export const List: React.FC = () => {
     refetchOnWindowFocus: false,
   });
 
+  /* v8 ignore start */
+  useEffect(() => {
+    if (!isCursorPagination) return;
+    setPageCursors((prev) => ({
+      ...prev,
+      ...(data?.next_cursor
+        ? { [`${cursorQueryString}#${page + 1}`]: data.next_cursor }
+        : {}),
+      ...(data?.prev_cursor
+        ? { [`${cursorQueryString}#${page - 1}`]: data.prev_cursor }
+        : {}),
+    }));
+  }, [isCursorPagination, data, cursorQueryString, page]);
+  /* v8 ignore stop */
+
   const { mutate: mutateDelete } = useMutation({
     /* v8 ignore next -- covered via mutation integration */
     mutationFn: (id: string) => deleteFetcher(`/delete/${model}/${id}`),
@@ -215,7 +247,15 @@ export const List: React.FC = () => {
   const paginationProps = {
     current: page,
     pageSize,
-    total: data?.total,
+    total: data?.total ?? getUncountedTotal(page, pageSize, data),
+    showTotal: (total: number) =>
+      data?.total === null
+        ? ""
+        : data?.total_is_approximate
+        ? `~${total}`
+        : data?.total_is_capped
+          ? `${total}+`
+          : `${total}`,
     showSizeChanger: true,
   };
   /* v8 ignore stop */
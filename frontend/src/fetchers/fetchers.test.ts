@@ -35,10 +35,24 @@ describe("fetchers", () => {
   it("postFetcher sends payload and returns data", async () => {
     const { postFetcher } = await import("./fetchers");
     const data = await postFetcher("/api/add/Event", { name: "Test" });
-    expect(mockPost).toHaveBeenCalledWith("/api/add/Event", { name: "Test" });
+    expect(mockPost).toHaveBeenCalledWith(
+      "/api/add/Event",
+      { name: "Test" },
+      undefined,
+    );
     expect(data).toEqual({ created: true });
   });
 
+  it("postFetcher passes request config", async () => {
+    const { postFetcher } = await import("./fetchers");
+    await postFetcher("/api/export/Event", {}, { responseType: "blob" });
+    expect(mockPost).toHaveBeenCalledWith(
+      "/api/export/Event",
+      {},
+      { responseType: "blob" },
+    );
+  });
+
   it("patchFetcher sends payload and returns data", async () => {
     const { patchFetcher } = await import("./fetchers");
     const data = await patchFetcher("/api/change/Event/1", { name: "New" });
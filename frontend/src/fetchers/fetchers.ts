@@ -1,4 +1,4 @@
-import axios from "axios";
+import axios, { type AxiosRequestConfig } from "axios";
 
 const instance = axios.create({
   baseURL: window.SERVER_URL ?? "",
@@ -13,8 +13,9 @@ export const getFetcher = async (url: string): Promise<any> => {
 export const postFetcher = async (
   url: string,
   payload: unknown,
+  config?: AxiosRequestConfig,
 ): Promise<any> => {
-  const { data } = await instance.post(url, payload);
+  const { data } = await instance.post(url, payload, config);
   return data;
 };
 
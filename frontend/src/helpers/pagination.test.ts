@@ -0,0 +1,20 @@
+import { describe, expect, it } from "vitest";
+import { getUncountedTotal } from "./pagination";
+
+describe("getUncountedTotal", () => {
+  it("counts the objects up to the end of the page", () => {
+    expect(
+      getUncountedTotal(3, 10, { results: [1, 2], has_next: false }),
+    ).toBe(22);
+  });
+
+  it("adds one object when there is a next page", () => {
+    expect(
+      getUncountedTotal(1, 2, { results: [1, 2], has_next: true }),
+    ).toBe(3);
+  });
+
+  it("handles a missing page", () => {
+    expect(getUncountedTotal(1, 10)).toBe(0);
+  });
+});
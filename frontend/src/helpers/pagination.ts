@@ -0,0 +1,18 @@
+export interface IListPage {
+  results?: unknown[];
+  has_next?: boolean | null;
+}
+
+// Total for the paginator of a list that is not counted (total is null):
+// the objects up to the end of the page, plus one when there is a next page.
+export const getUncountedTotal = (
+  page: number,
+  pageSize: number,
+  data?: IListPage,
+) => {
+  return (
+    (page - 1) * pageSize +
+    (data?.results?.length || 0) +
+    (data?.has_next ? 1 : 0)
+  );
+};
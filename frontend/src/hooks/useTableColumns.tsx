@@ -94,8 +94,10 @@ export const useTableColumns = (
             if (value === undefined) {
               return field.list_configuration?.empty_value_display;
             }
+            // foreign key label sent by the server (list_display_fk_labels)
+            const label = record?.[`${field.name}__str__`];
             const transformedValue = transformColumnValueFromServer(
-              value,
+              label ?? value,
               field.list_configuration?.empty_value_display,
               dateTimeFormat,
             );
@@ -43,6 +43,14 @@ export enum EModelPermission {
 export enum EExportFormat {
   CSV = "CSV",
   JSON = "JSON",
+  NDJSON = "NDJSON",
+  XLSX = "XLSX",
+  PARQUET = "PARQUET",
+}
+
+export enum EListPagination {
+  OFFSET = "offset",
+  CURSOR = "cursor",
 }
 
 export enum EActionResponseType {
@@ -147,6 +155,7 @@ interface IBaseModel {
   preserve_filters?: boolean;
   list_max_show_all?: number;
   show_full_result_count?: boolean;
+  list_pagination?: EListPagination;
   verbose_name?: string;
   verbose_name_plural?: string;
   menu_section?: string;
@@ -192,3 +192,75 @@ async def test_django_sign_in_invalid_body_422():
 
     response = await sign_in(request)
     assert response.status_code == 422
+
+
+async def test_django_download_export_job_iterators(tmp_path):
+    """download_export_job streams an async iterator under ASGI and a sync one under WSGI."""
+    from django.core.handlers.asgi import ASGIRequest
+
+    from fastadmin.api.export_jobs import ExportJob
+    from fastadmin.api.frameworks.django.app import api as django_api_module
+    from fastadmin.api.frameworks.django.app.api import download_export_job
+    from fastadmin.api.schemas import ExportJobStatus
+
+    path = tmp_path / "Event.csv"
+    path.write_bytes(b"a,b\r\n1,2\r\n")
+    job = ExportJob(
+        id="job",
+        user_id="1",
+        model="Event",
+        file_name="Event.csv",
+        content_type="text/csv",
+        path=str(path),
+        status=ExportJobStatus.DONE,
+        size=10,
+    )
+    with patch.object(
+        django_api_module.api_service,
+        "download_export_job",
+        AsyncMock(return_value=(job, None)),
+    ):
+        wsgi_request = MagicMock()
+        wsgi_request.method = "GET"
+        response = await download_export_job(wsgi_request, "job")
+        assert not response.is_async
+        assert b"".join(response.streaming_content) == b"a,b\r\n1,2\r\n"
+
+        asgi_request = MagicMock(spec=ASGIRequest)
+        asgi_request.method = "GET"
+        response = await download_export_job(asgi_request, "job")
+        assert response.is_async
+        assert b"".join([chunk async for chunk in response.streaming_content]) == b"a,b\r\n1,2\r\n"
+
+
+async def test_django_export_spools_under_wsgi():
+    """export streams the async export under ASGI and spools it to a file under WSGI."""
+    from django.core.handlers.asgi import ASGIRequest
+    from django.http import FileResponse, QueryDict, StreamingHttpResponse
+
+    from fastadmin.api.frameworks.django.app import api as django_api_module
+    from fastadmin.api.frameworks.django.app.api import export
+
+    async def stream():
+        yield b"a,b\r\n"
+        yield b"1,2\r\n"
+
+    for request, response_class in ((MagicMock(), FileResponse), (MagicMock(spec=ASGIRequest), StreamingHttpResponse)):
+        request.method = "POST"
+        request.GET = QueryDict()
+        request.body = b'{"format": "CSV"}'
+        request.COOKIES = {}
+        with patch.object(
+            django_api_module.api_service,
+            "export",
+            AsyncMock(return_value=("Event.csv", "text/csv", stream())),
+        ):
+            response = await export(request, "Event")
+        assert type(response) is response_class
+        assert response["Content-Disposition"] == 'attachment; filename="Event.csv"'
+        if response.is_async:
+            assert b"".join([chunk async for chunk in response.streaming_content]) == b"a,b\r\n1,2\r\n"
+        else:
+            assert b"".join(response.streaming_content) == b"a,b\r\n1,2\r\n"
+            assert response["Content-Length"] == "10"
+            response.close()
@@ -1,4 +1,7 @@
-from fastadmin.api.service import get_user_id_from_session_id
+import pytest
+
+from fastadmin.api.service import authenticated_user_cache, get_user_id_from_session_id
+from fastadmin.api.sessions import create_session_store
 from fastadmin.settings import settings
 
 
@@ -56,6 +59,36 @@ async def test_me(session_id, client):
     assert str(me["id"]) == str(user_id)
 
 
+async def test_me_cache(session_id, admin_models, superuser, client, mocker):
+    assert session_id
+    user_admin_model = admin_models[superuser.__class__]
+    get_obj = mocker.spy(user_admin_model, "get_obj")
+    orm_get_obj = mocker.spy(user_admin_model, "orm_get_obj")
+
+    for _ in range(2):
+        r = await client.get("/api/me")
+        assert r.status_code == 200, r.text
+        assert r.json()["username"] == superuser.username
+    # the serialized user of the first request (which is the session check), nothing for the second one
+    assert get_obj.call_count == 1
+    assert orm_get_obj.call_count == 1
+    assert len(authenticated_user_cache) == 1
+
+    r = await client.patch(
+        f"/api/change-password/{superuser.id}",
+        json={"password": superuser.password, "confirm_password": superuser.password},
+    )
+    assert r.status_code == 200, r.text
+    assert len(authenticated_user_cache) == 0
+
+    r = await client.patch(f"/api/change/{superuser.get_model_name()}/{superuser.id}", json={"username": "Changed"})
+    assert r.status_code == 200, r.text
+    assert len(authenticated_user_cache) == 0
+    r = await client.get("/api/me")
+    assert r.status_code == 200, r.text
+    assert r.json()["username"] == "Changed"
+
+
 async def test_me_401(client):
     r = await client.get("/api/me")
     assert r.status_code == 401, r.text
@@ -106,3 +139,43 @@ async def test_sign_out_405(session_id, client):
     assert session_id
     r = await client.get("/api/sign-out")
     assert r.status_code == 405, r.text
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+async def test_session_store(backend, superuser, user, client, monkeypatch, tmp_path):
+    store = create_session_store(backend, str(tmp_path / "sessions.sqlite3"), ttl=60, max_sessions_per_user=2)
+    monkeypatch.setattr("fastadmin.api.service.session_store", store)
+    settings.ADMIN_USER_MODEL = superuser.get_model_name()
+
+    async def me(session_id):
+        client.cookies.clear()
+        client.cookies.set(settings.ADMIN_SESSION_ID_KEY, session_id)
+        return await client.get("/api/me")
+
+    session_ids = []
+    for _ in range(3):
+        r = await client.post(
+            "/api/sign-in",
+            json={"username": superuser.username, "password": superuser.password},
+        )
+        assert r.status_code == 200, r.text
+        session_ids.append(r.cookies[settings.ADMIN_SESSION_ID_KEY])
+    first, second, third = session_ids
+
+    # the oldest session is revoked beyond the limit
+    assert (await me(first)).status_code == 401
+    assert (await me(second)).status_code == 200
+    assert (await me(third)).status_code == 200
+
+    # sign-out revokes the session
+    assert (await me(second)).status_code == 200
+    r = await client.post("/api/sign-out")
+    assert r.status_code == 200, r.text
+    assert (await me(second)).status_code == 401
+    assert (await me(third)).status_code == 200
+
+    # deleting a user revokes its sessions
+    session_key = await store.create(str(user.id))
+    r = await client.delete(f"/api/delete/{user.get_model_name()}/{user.id}")
+    assert r.status_code == 200, r.text
+    assert not await store.exists(str(user.id), session_key)
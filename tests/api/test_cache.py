@@ -0,0 +1,41 @@
+from fastadmin.api.cache import TTLCache
+
+
+def test_ttl_cache(mocker):
+    monotonic = mocker.patch("fastadmin.api.cache.time.monotonic", return_value=100.0)
+    cache = TTLCache(maxsize=2, ttl=10)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    monotonic.return_value = 110.0
+    assert cache.get("a", "expired") == "expired"
+    assert len(cache) == 1
+
+    cache.set(("model", 1), 1)
+    cache.set(("other", 1), 2)
+    cache.delete_matching(lambda key: key[0] == "model")
+    assert cache.get(("model", 1)) is None
+    assert cache.get(("other", 1)) == 2
+    cache.delete(("other", 1))
+    cache.delete(("other", 1))
+    assert len(cache) == 0
+
+    cache.set("a", 1)
+    cache.clear()
+    assert cache.get("a") is None
+
+
+def test_ttl_cache_disabled():
+    cache = TTLCache(maxsize=10, ttl=0)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+
+    cache = TTLCache(maxsize=0, ttl=10)
+    cache.set("a", 1)
+    assert len(cache) == 0
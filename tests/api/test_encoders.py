@@ -1,12 +1,16 @@
+import abc
 import datetime
 from decimal import Decimal
+from typing import Protocol, runtime_checkable
 
 import pytest
 
 from fastadmin.api.encoders import (
+    _ENCODERS_DISPATCH_CACHE,
     CUSTOM_ENCODERS,
     apply_custom_encoders,
     clear_encoders,
+    get_encoder,
     register_encoder,
     unregister_encoder,
 )
@@ -64,3 +68,98 @@ def test_clear_encoders():
     register_encoder(datetime.date, lambda _: "y")
     clear_encoders()
     assert CUSTOM_ENCODERS == {}
+
+
+def test_get_encoder_caches_matches_and_misses():
+    class Base:
+        pass
+
+    class Child(Base):
+        pass
+
+    child = Child()
+    assert apply_custom_encoders(child) is child
+    register_encoder(Base, lambda _: "base")
+    assert get_encoder(Child) is CUSTOM_ENCODERS[Base]
+    assert get_encoder(int) is None
+    assert dict(_ENCODERS_DISPATCH_CACHE) == {Child: CUSTOM_ENCODERS[Base], int: None}
+    assert apply_custom_encoders(1) == 1
+
+    # registering an encoder drops the cached (negative) results
+    register_encoder(int, lambda _: "int")
+    assert not _ENCODERS_DISPATCH_CACHE
+    assert apply_custom_encoders(1) == "int"
+    assert apply_custom_encoders(True) == "int"
+
+    unregister_encoder(int)
+    assert apply_custom_encoders(1) == 1
+    assert apply_custom_encoders(Child()) == "base"
+
+    clear_encoders()
+    assert not _ENCODERS_DISPATCH_CACHE
+    assert get_encoder(Child) is None
+
+
+def test_get_encoder_follows_abc_registration():
+    class Money(abc.ABC):
+        @abc.abstractmethod
+        def amount(self): ...
+
+    class Amount:
+        pass
+
+    register_encoder(Money, lambda _: "money")
+    amount = Amount()
+    assert apply_custom_encoders(amount) is amount
+
+    Money.register(Amount)
+    assert apply_custom_encoders(Amount()) == "money"
+
+
+def test_get_encoder_cache_follows_registry_changes():
+    class Base:
+        pass
+
+    register_encoder(Base, lambda _: "base")
+    assert apply_custom_encoders(1) == 1
+    assert int in _ENCODERS_DISPATCH_CACHE
+
+    # the registry dict drops the cache when it is changed directly too
+    CUSTOM_ENCODERS[int] = lambda _: "int"
+    assert apply_custom_encoders(1) == "int"
+    del CUSTOM_ENCODERS[int]
+    assert apply_custom_encoders(1) == 1
+    CUSTOM_ENCODERS.update({int: lambda _: "updated"})
+    assert apply_custom_encoders(1) == "updated"
+    CUSTOM_ENCODERS.popitem()
+    registry = CUSTOM_ENCODERS
+    registry |= {int: lambda _: "merged"}
+    assert apply_custom_encoders(1) == "merged"
+    CUSTOM_ENCODERS.setdefault(str, lambda _: "str")
+    assert apply_custom_encoders("x") == "str"
+    assert CUSTOM_ENCODERS.pop(str)("x") == "str"
+    assert apply_custom_encoders("x") == "x"
+
+
+def test_apply_custom_encoders_matches_value_dependent_checks_uncached():
+    @runtime_checkable
+    class HasAmount(Protocol):
+        amount: int
+
+    class Value:
+        pass
+
+    register_encoder(HasAmount, lambda value: value.amount)
+    value = Value()
+    assert apply_custom_encoders(value) is value
+    value.amount = 5
+    assert apply_custom_encoders(value) == 5
+    assert not _ENCODERS_DISPATCH_CACHE
+    clear_encoders()
+
+    class Proxy:
+        __class__ = Value  # type: ignore[assignment]
+
+    register_encoder(Value, lambda _: "value")
+    assert apply_custom_encoders(Proxy()) == "value"
+    assert Proxy not in _ENCODERS_DISPATCH_CACHE
@@ -1,3 +1,13 @@
+import gzip
+import io
+import json
+
+import pytest
+
+from fastadmin.api.schemas import ExportFormat
+from fastadmin.api.service import EXPORT_CONTENT_TYPES
+
+
 async def test_export(session_id, event, client):
     assert session_id
     async with client.stream(
@@ -12,6 +22,67 @@ async def test_export(session_id, event, client):
     assert rows
 
 
+async def test_export_chunks(session_id, admin_models, superuser, event, client, mocker):
+    assert session_id
+    model_name = superuser.get_model_name()
+    r = await client.post(f"/api/export/{model_name}", json={"format": "JSON"})
+    assert r.status_code == 200, r.text
+    rows = json.loads(r.content)
+    assert len(rows) >= 2
+
+    user_admin_model = admin_models[superuser.__class__]
+    mocker.patch.object(user_admin_model, "export_chunk_size", 1)
+    orm_get_list = mocker.spy(user_admin_model, "orm_get_list")
+    r = await client.post(f"/api/export/{model_name}", json={"format": "JSON"})
+    assert r.status_code == 200, r.text
+    assert json.loads(r.content) == rows
+    assert orm_get_list.call_count == len(rows) + 1
+
+    r = await client.post(f"/api/export/{model_name}?sort_by=-username", json={"format": "CSV", "limit": 1000000})
+    assert r.status_code == 200, r.text
+    assert len(r.text.splitlines()) == len(rows) + 1
+
+
+@pytest.mark.parametrize("export_format", [ExportFormat.NDJSON, ExportFormat.XLSX, ExportFormat.PARQUET])
+async def test_export_formats(session_id, superuser, event, client, export_format):
+    import pyarrow.parquet as pq
+    from openpyxl import load_workbook
+
+    assert session_id
+    model_name = superuser.get_model_name()
+    r = await client.post(f"/api/export/{model_name}?sort_by=id", json={"format": export_format.value})
+    assert r.status_code == 200, r.text
+    assert r.headers["content-type"].startswith(EXPORT_CONTENT_TYPES[export_format])
+    assert f'filename="{model_name}.{export_format.value.lower()}"' in r.headers["content-disposition"]
+    match export_format:
+        case ExportFormat.NDJSON:
+            usernames = [json.loads(line)["username"] for line in r.text.splitlines()]
+        case ExportFormat.XLSX:
+            rows = list(load_workbook(io.BytesIO(r.content)).active.values)
+            usernames = [row[rows[0].index("username")] for row in rows[1:]]
+        case _:
+            usernames = pq.read_table(io.BytesIO(r.content)).column("username").to_pylist()
+    assert superuser.username in usernames
+    assert len(usernames) >= 2
+
+
+async def test_export_gzip(session_id, superuser, event, client):
+    assert session_id
+    model_name = superuser.get_model_name()
+    r = await client.post(f"/api/export/{model_name}?sort_by=id", json={"format": "NDJSON"})
+    assert r.status_code == 200, r.text
+    ndjson = r.content
+
+    r = await client.post(f"/api/export/{model_name}?sort_by=id", json={"format": "NDJSON", "gzip": True})
+    assert r.status_code == 200, r.text
+    assert r.headers["content-type"].startswith("application/gzip")
+    assert f'filename="{model_name}.ndjson.gz"' in r.headers["content-disposition"]
+    assert gzip.decompress(r.content) == ndjson
+
+    r = await client.post(f"/api/export/{model_name}", json={"format": "XLSX", "gzip": True})
+    assert r.status_code == 422, r.text
+
+
 async def test_export_405(session_id, event, client):
     assert session_id
     r = await client.get(
@@ -0,0 +1,182 @@
+import asyncio
+import gzip
+import io
+import json
+from pathlib import Path
+
+from asgiref.wsgi import WsgiToAsgi
+
+from fastadmin.api.export_jobs import ExportJobManager
+from fastadmin.api.schemas import ExportJobStatus
+from fastadmin.api.service import export_jobs
+from fastadmin.settings import settings
+
+
+async def _iter(*chunks):
+    for chunk in chunks:
+        if isinstance(chunk, Exception):
+            raise chunk
+        yield chunk
+
+
+async def _wait(job):
+    for _ in range(500):
+        if job.status in (ExportJobStatus.DONE, ExportJobStatus.FAILED):
+            return
+        await asyncio.sleep(0.01)
+
+
+async def test_export_job_manager(tmp_path):
+    now = [100.0]
+    manager = ExportJobManager(directory=str(tmp_path), ttl=10, clock=lambda: now[0])
+
+    job = manager.create("1", "Event", "Event.csv", "text/csv")
+    assert job.status == ExportJobStatus.PENDING
+    manager.run(job, _iter(b"a,b\r\n", b"1,2\r\n"), total=1)
+    await _wait(job)
+    assert job.status == ExportJobStatus.DONE
+    assert job.total == 1
+    assert job.size == 10
+    assert Path(job.path).read_bytes() == b"a,b\r\n1,2\r\n"
+    assert manager.get(job.id) is job
+
+    failed_job = manager.create("1", "Event", "Event.csv", "text/csv")
+    manager.run(failed_job, _iter(b"a,b\r\n", ValueError("boom")))
+    await _wait(failed_job)
+    assert failed_job.status == ExportJobStatus.FAILED
+    assert failed_job.detail == "Error exporting Event."
+    assert failed_job.total is None
+    assert not Path(failed_job.path).exists()
+
+    pending_job = manager.create("1", "Event", "Event.csv", "text/csv")
+    now[0] = 110.0
+    assert manager.get(job.id) is None
+    assert manager.get(failed_job.id) is None
+    assert not Path(job.path).exists()
+    assert manager.get(pending_job.id) is pending_job
+
+
+async def test_export_job(session_id, superuser, event, app, client, mocker):
+    assert session_id
+    mocker.patch.object(settings, "ADMIN_EXPORT_JOB_THRESHOLD", 1)
+    model_name = superuser.get_model_name()
+
+    r = await client.post(f"/api/export/{model_name}?sort_by=id", json={"format": "NDJSON", "limit": 1})
+    assert r.status_code == 200, r.text
+    assert len(r.text.splitlines()) == 1
+
+    # an export of fewer objects than the threshold is streamed, whatever its limit
+    mocker.patch.object(settings, "ADMIN_EXPORT_JOB_THRESHOLD", 1000)
+    r = await client.post(f"/api/export/{model_name}?sort_by=id", json={"format": "NDJSON"})
+    assert r.status_code == 200, r.text
+    assert len(r.text.splitlines()) >= 2
+
+    mocker.patch.object(settings, "ADMIN_EXPORT_JOB_THRESHOLD", 1)
+
+    r = await client.post(f"/api/export/{model_name}?sort_by=id", json={"format": "NDJSON"})
+    if isinstance(app, WsgiToAsgi):
+        # the event loop of an async Flask view ends with the request, so Flask always streams
+        assert r.status_code == 200, r.text
+        assert len(r.text.splitlines()) >= 2
+        return
+    assert r.status_code == 202, r.text
+    job = r.json()
+    assert job["status"] in ("pending", "running")
+    assert job["file_name"] == f"{model_name}.ndjson"
+
+    for _ in range(500):
+        r = await client.get(f"/api/export-jobs/{job['id']}")
+        assert r.status_code == 200, r.text
+        if r.json()["status"] == "done":
+            break
+        await asyncio.sleep(0.01)
+    job = r.json()
+    assert job["rows"] == job["total"] >= 2
+
+    r = await client.get(f"/api/export-jobs/{job['id']}/download")
+    assert r.status_code == 200, r.text
+    assert r.headers["content-type"].startswith("application/x-ndjson")
+    assert r.headers["accept-ranges"] == "bytes"
+    assert f'filename="{model_name}.ndjson"' in r.headers["content-disposition"]
+    assert len(r.content) == job["size"]
+    rows = [json.loads(line) for line in io.StringIO(r.text)]
+    assert superuser.username in [row["username"] for row in rows]
+
+    r = await client.get(f"/api/export-jobs/{job['id']}/download", headers={"Range": "bytes=10-"})
+    assert r.status_code == 206, r.text
+    assert r.headers["content-range"] == f"bytes 10-{job['size'] - 1}/{job['size']}"
+    assert r.content == Path(export_jobs.get(job["id"]).path).read_bytes()[10:]
+
+    r = await client.get(f"/api/export-jobs/{job['id']}/download", headers={"Range": f"bytes={job['size']}-"})
+    assert r.status_code == 416, r.text
+
+
+async def test_export_job_gzip(session_id, superuser, event, app, client, mocker):
+    assert session_id
+    mocker.patch.object(settings, "ADMIN_EXPORT_JOB_THRESHOLD", 1)
+    model_name = superuser.get_model_name()
+
+    r = await client.post(f"/api/export/{model_name}?sort_by=id", json={"format": "CSV", "gzip": True})
+    if isinstance(app, WsgiToAsgi):
+        assert r.status_code == 200, r.text
+        assert superuser.username in gzip.decompress(r.content).decode()
+        return
+    assert r.status_code == 202, r.text
+    job = r.json()
+    assert job["file_name"] == f"{model_name}.csv.gz"
+    await _wait(export_jobs.get(job["id"]))
+
+    r = await client.get(f"/api/export-jobs/{job['id']}/download")
+    assert r.status_code == 200, r.text
+    assert r.headers["content-type"].startswith("application/gzip")
+    assert superuser.username in gzip.decompress(r.content).decode()
+
+
+async def test_export_job_download(session_id, superuser, client):
+    assert session_id
+    job = export_jobs.create(str(superuser.id), "User", "User.csv", "text/csv")
+    export_jobs.run(job, _iter(b"a,b\r\n", b"1,2\r\n"))
+    await _wait(job)
+
+    r = await client.get(f"/api/export-jobs/{job.id}/download")
+    assert r.status_code == 200, r.text
+    assert r.content == b"a,b\r\n1,2\r\n"
+    assert r.headers["content-length"] == "10"
+
+    r = await client.get(f"/api/export-jobs/{job.id}/download", headers={"Range": "bytes=-5"})
+    assert r.status_code == 206, r.text
+    assert r.content == b"1,2\r\n"
+    assert r.headers["content-range"] == "bytes 5-9/10"
+
+
+async def test_export_job_errors(session_id, superuser, client):
+    assert session_id
+    other_job = export_jobs.create("other", "User", "User.csv", "text/csv")
+    pending_job = export_jobs.create(str(superuser.id), "User", "User.csv", "text/csv")
+
+    for job_id in ("unknown", other_job.id):
+        r = await client.get(f"/api/export-jobs/{job_id}")
+        assert r.status_code == 404, r.text
+        r = await client.get(f"/api/export-jobs/{job_id}/download")
+        assert r.status_code == 404, r.text
+
+    r = await client.get(f"/api/export-jobs/{pending_job.id}")
+    assert r.status_code == 200, r.text
+    assert r.json()["status"] == "pending"
+    r = await client.get(f"/api/export-jobs/{pending_job.id}/download")
+    assert r.status_code == 409, r.text
+
+
+async def test_export_job_401(client):
+    r = await client.get("/api/export-jobs/unknown")
+    assert r.status_code == 401, r.text
+    r = await client.get("/api/export-jobs/unknown/download")
+    assert r.status_code == 401, r.text
+
+
+async def test_export_job_405(session_id, client):
+    assert session_id
+    r = await client.post("/api/export-jobs/unknown")
+    assert r.status_code == 405, r.text
+    r = await client.post("/api/export-jobs/unknown/download")
+    assert r.status_code == 405, r.text
@@ -2,18 +2,26 @@ import uuid
 from datetime import UTC, datetime, timedelta
 
 import jwt
+import pytest
 
+from fastadmin.api.exceptions import AdminApiException
 from fastadmin.api.helpers import (
+    aiter_file_range,
     build_query_filters,
+    get_file_range_response,
+    get_list_response,
     get_template,
     is_valid_id,
     is_valid_uuid,
+    iter_file_range,
+    parse_fields_query_param,
     parse_list_filters_from_query_params,
+    parse_range_header,
     sanitize_filter_key,
     sanitize_filter_value,
 )
 from fastadmin.api.service import get_user_id_from_session_id
-from fastadmin.models.schemas import ModelFieldWidgetSchema, WidgetType
+from fastadmin.models.schemas import ListResult, ModelFieldWidgetSchema, WidgetType
 from fastadmin.settings import settings
 
 
@@ -26,6 +34,26 @@ async def test_sanitize_filter_value():
     assert sanitize_filter_value(["null", "foo"]) == [None, "foo"]
 
 
+async def test_parse_fields_query_param():
+    assert parse_fields_query_param(None) is None
+    assert parse_fields_query_param("") is None
+    assert parse_fields_query_param(" , ") is None
+    assert parse_fields_query_param("id, name,") == ["id", "name"]
+
+
+async def test_get_list_response():
+    response = get_list_response(ListResult(results=[{"id": 1}], total=1))
+    assert response["total"] == 1
+    assert response["has_next"] is None
+    assert response["next_cursor"] is None
+
+    response = get_list_response(ListResult(results=[], total=None, has_next=True, next_cursor="cursor"))
+    assert response["total"] is None
+    assert response["has_next"] is True
+    assert response["next_cursor"] == "cursor"
+    assert response["results"] == []
+
+
 async def test_parse_list_filters_from_query_params():
     def keys():
         return ["search", "name", "id__in", "other", "skip"]
@@ -224,3 +252,40 @@ def test_env_int_falls_back_on_blank_or_garbage(monkeypatch):
     assert _env_int("FASTADMIN_TEST_INT", 7) == 7  # non-numeric
     monkeypatch.setenv("FASTADMIN_TEST_INT", "42")
     assert _env_int("FASTADMIN_TEST_INT", 7) == 42  # valid
+
+
+async def test_parse_range_header():
+    assert parse_range_header(None, 10) is None
+    assert parse_range_header("items=0-1", 10) is None
+    assert parse_range_header("bytes=0-1,3-4", 10) is None
+    assert parse_range_header("bytes=1", 10) is None
+    assert parse_range_header("bytes=-", 10) is None
+    assert parse_range_header("bytes=a-1", 10) is None
+    assert parse_range_header("bytes=5-1", 10) is None
+    assert parse_range_header("bytes=2-5", 10) == (2, 5)
+    assert parse_range_header("bytes=2-", 10) == (2, 9)
+    assert parse_range_header("bytes=5-100", 10) == (5, 9)
+    assert parse_range_header("bytes=-3", 10) == (7, 9)
+    assert parse_range_header("bytes=-30", 10) == (0, 9)
+    for value in ("bytes=10-", "bytes=-0"):
+        with pytest.raises(AdminApiException) as e:
+            parse_range_header(value, 10)
+        assert e.value.status_code == 416
+
+
+async def test_file_range(tmp_path):
+    path = tmp_path / "export.csv"
+    path.write_bytes(b"0123456789")
+
+    status_code, headers, start, end = get_file_range_response("export.csv", 10, None)
+    assert (status_code, start, end) == (200, 0, 9)
+    assert headers["Content-Length"] == "10"
+    assert "Content-Range" not in headers
+    assert b"".join(iter_file_range(str(path), start, end, block_size=3)) == b"0123456789"
+
+    status_code, headers, start, end = get_file_range_response("export.csv", 10, (2, 5))
+    assert status_code == 206
+    assert headers["Content-Range"] == "bytes 2-5/10"
+    assert headers["Content-Length"] == "4"
+    assert b"".join(iter_file_range(str(path), start, end, block_size=3)) == b"2345"
+    assert b"".join([block async for block in aiter_file_range(str(path), start, end, block_size=3)]) == b"2345"
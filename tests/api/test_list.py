@@ -1,5 +1,8 @@
 from datetime import UTC, datetime
 
+from fastadmin.api.service import list_anchor_cache, list_total_cache
+from fastadmin.models.schemas import ListCountStrategy, ListPagination
+
 
 async def test_list(session_id, event, client):
     assert session_id
@@ -226,3 +229,283 @@ async def test_list_invalid_offset_limit_422(session_id, event, client):
         f"/api/list/{event.get_model_name()}?limit=xyz",
     )
     assert r2.status_code == 422, r2.text
+
+
+async def test_list_defers_heavy_fields(session_id, admin_models, event, client, mocker):
+    assert session_id
+
+    event_admin_model = admin_models[event.__class__]
+    assert event_admin_model.get_list_deferred_fields() == []
+
+    # heavy columns are loaded by default, so __str__ may read them
+    await event_admin_model.save_model(event.id, {"description": "long text"})
+    mocker.patch.object(type(event), "__str__", lambda obj: f"Event {obj.description}")
+    r = await client.get(f"/api/list/{event.get_model_name()}?limit=1000")
+    assert r.status_code == 200, r.text
+    item = next(result for result in r.json()["results"] if str(result["id"]) == str(event.id))
+    assert item["__str__"] == "Event long text"
+    assert "description" in item
+    assert "json" in item
+    mocker.stopall()
+
+    event_admin_model.list_defer_heavy_fields = True
+    event_admin_model.clear_model_fields_cache()
+    assert {f.name for f in event_admin_model.get_list_deferred_fields()} == {"description", "json"}
+    r = await client.get(f"/api/list/{event.get_model_name()}?limit=1000")
+    assert r.status_code == 200, r.text
+    item = next(result for result in r.json()["results"] if str(result["id"]) == str(event.id))
+    assert item["name"] == event.name
+    assert "description" not in item
+    assert "json" not in item
+
+    event_admin_model.list_display = ("id", "name", "description")
+    event_admin_model.list_select_related = ("tournament",)
+    event_admin_model.clear_model_fields_cache()
+    r = await client.get(f"/api/list/{event.get_model_name()}?limit=1000")
+    assert r.status_code == 200, r.text
+    item = next(result for result in r.json()["results"] if str(result["id"]) == str(event.id))
+    assert "description" in item
+    assert "json" not in item
+
+
+async def test_list_sparse_fields(session_id, admin_models, event, client):
+    assert session_id
+
+    event_admin_model = admin_models[event.__class__]
+    event_admin_model.list_defer_heavy_fields = True
+    assert {f.name for f in event_admin_model.get_list_deferred_fields(["name", "json"])} == {"description"}
+
+    r = await client.get(f"/api/list/{event.get_model_name()}?limit=1000&fields=name,json")
+    assert r.status_code == 200, r.text
+    item = next(result for result in r.json()["results"] if str(result["id"]) == str(event.id))
+    assert set(item) == {"id", "name", "json", "__str__"}
+    assert item["name"] == event.name
+
+    event_admin_model.list_display = ("id", "name", "tournament")
+    event_admin_model.list_display_fk_labels = True
+    r = await client.get(f"/api/list/{event.get_model_name()}?limit=1000&fields=name")
+    assert r.status_code == 200, r.text
+    item = next(result for result in r.json()["results"] if str(result["id"]) == str(event.id))
+    assert "tournament__str__" not in item
+
+    r = await client.get(f"/api/list/{event.get_model_name()}?fields=name,password")
+    assert r.status_code == 422, r.text
+
+
+async def test_list_estimated_total(session_id, admin_models, event, client, mocker):
+    assert session_id
+
+    r = await client.get(f"/api/list/{event.get_model_name()}")
+    assert r.status_code == 200, r.text
+    assert r.json()["total_is_approximate"] is False
+
+    event_admin_model = admin_models[event.__class__]
+    event_admin_model.list_count_strategy = ListCountStrategy.ESTIMATED
+    mocker.patch.object(event_admin_model, "orm_get_estimated_count", return_value=1000)
+    r = await client.get(f"/api/list/{event.get_model_name()}")
+    assert r.status_code == 200, r.text
+    assert r.json()["total"] == 1000
+    assert r.json()["total_is_approximate"] is True
+    assert r.json()["results"]
+
+    r = await client.get(f"/api/list/{event.get_model_name()}?search={event.name}")
+    assert r.status_code == 200, r.text
+    assert r.json()["total_is_approximate"] is False
+
+
+async def test_list_capped_total(session_id, admin_models, event, client):
+    assert session_id
+
+    r = await client.get(f"/api/list/{event.get_model_name()}")
+    assert r.status_code == 200, r.text
+    assert r.json()["total_is_capped"] is False
+
+    event_admin_model = admin_models[event.__class__]
+    event_admin_model.list_count_limit = 0
+    r = await client.get(f"/api/list/{event.get_model_name()}?offset=0&limit=1")
+    assert r.status_code == 200, r.text
+    assert r.json()["total"] == 1
+    assert r.json()["total_is_capped"] is True
+
+
+async def test_list_without_count(session_id, admin_models, event, client):
+    assert session_id
+
+    r = await client.get(f"/api/list/{event.get_model_name()}?offset=0&limit=1")
+    assert r.status_code == 200, r.text
+    assert r.json()["total"] >= 1
+    assert r.json()["has_next"] is None
+
+    event_admin_model = admin_models[event.__class__]
+    event_admin_model.list_count_strategy = ListCountStrategy.NONE
+    r = await client.get(f"/api/list/{event.get_model_name()}?offset=0&limit=1000")
+    assert r.status_code == 200, r.text
+    assert r.json()["total"] is None
+    assert r.json()["has_next"] is False
+    assert r.json()["results"]
+
+    r = await client.get(f"/api/list/{event.get_model_name()}?offset=0&limit=0")
+    assert r.status_code == 200, r.text
+    assert r.json()["total"] is None
+    assert r.json()["has_next"] is True
+    assert r.json()["results"] == []
+
+
+async def test_list_cached_total(session_id, admin_models, event, client, mocker, monkeypatch):
+    assert session_id
+    monkeypatch.setattr(list_total_cache, "ttl", 60)
+    list_total_cache.clear()
+
+    event_admin_model = admin_models[event.__class__]
+    event_admin_model.actions = ("make_is_active",)
+    orm_get_list = mocker.spy(event_admin_model, "orm_get_list")
+
+    r = await client.get(f"/api/list/{event.get_model_name()}?offset=0&limit=1&name__icontains=")
+    assert r.status_code == 200, r.text
+    total = r.json()["total"]
+    assert "with_count" not in orm_get_list.call_args.kwargs
+
+    r = await client.get(f"/api/list/{event.get_model_name()}?offset=1&limit=1&name__icontains=")
+    assert r.status_code == 200, r.text
+    assert r.json()["total"] == total
+    assert orm_get_list.call_args.kwargs["with_count"] is False
+    # only the count is cached, not the page metadata of the first response
+    assert [type(list_total_cache.get(key)) for key in list(list_total_cache)] == [int]
+
+    r = await client.get(f"/api/list/{event.get_model_name()}?offset=0&limit=1&search=other")
+    assert r.status_code == 200, r.text
+    assert "with_count" not in orm_get_list.call_args.kwargs
+
+    # capped counts are not cached
+    list_total_cache.clear()
+    event_admin_model.list_count_limit = 0
+    r = await client.get(f"/api/list/{event.get_model_name()}?offset=0&limit=1&name__icontains=")
+    assert r.status_code == 200, r.text
+    assert r.json()["total_is_capped"] is True
+    assert len(list_total_cache) == 0
+    event_admin_model.list_count_limit = None
+
+    r = await client.post(f"/api/action/{event.get_model_name()}/make_is_active", json={"ids": [event.id]})
+    assert r.status_code == 200, r.text
+    r = await client.get(f"/api/list/{event.get_model_name()}?offset=1&limit=1&name__icontains=")
+    assert r.status_code == 200, r.text
+    assert "with_count" not in orm_get_list.call_args.kwargs
+    list_total_cache.clear()
+
+
+async def test_list_anchors(session_id, admin_models, superuser, event, client, mocker):
+    assert session_id
+    list_anchor_cache.clear()
+
+    model_name = superuser.get_model_name()
+    r = await client.get(f"/api/list/{model_name}?offset=0&limit=1000")
+    assert r.status_code == 200, r.text
+    ids = sorted(result["id"] for result in r.json()["results"])
+    assert len(ids) >= 2
+
+    user_admin_model = admin_models[superuser.__class__]
+    user_admin_model.list_anchor_pages = 1
+    orm_get_list = mocker.spy(user_admin_model, "orm_get_list")
+    r = await client.get(f"/api/list/{model_name}?offset=0&limit=1")
+    assert r.status_code == 200, r.text
+    assert [result["id"] for result in r.json()["results"]] == ids[:1]
+
+    r = await client.get(f"/api/list/{model_name}?offset=1&limit=1")
+    assert r.status_code == 200, r.text
+    assert [result["id"] for result in r.json()["results"]] == ids[1:2]
+    assert orm_get_list.call_args.kwargs["offset"] == 0
+    assert orm_get_list.call_args.kwargs["keyset_values"]
+
+    r = await client.get(f"/api/list/{model_name}?offset=1&limit=1&search=")
+    assert r.status_code == 200, r.text
+    assert [result["id"] for result in r.json()["results"]] == ids[1:2]
+    list_anchor_cache.clear()
+
+
+async def test_list_fk_labels(session_id, admin_models, event, client):
+    assert session_id
+
+    event_admin_model = admin_models[event.__class__]
+    event_admin_model.list_display = ("id", "name", "tournament")
+
+    r = await client.get(f"/api/list/{event.get_model_name()}?limit=1000")
+    assert r.status_code == 200, r.text
+    item = next(result for result in r.json()["results"] if str(result["id"]) == str(event.id))
+    assert "tournament__str__" not in item
+
+    event_admin_model.list_display_fk_labels = True
+    assert [f.name for f in event_admin_model.get_list_fk_label_fields()] == ["tournament"]
+    r = await client.get(f"/api/list/{event.get_model_name()}?limit=1000")
+    assert r.status_code == 200, r.text
+    item = next(result for result in r.json()["results"] if str(result["id"]) == str(event.id))
+    assert item["tournament__str__"] == "Test Tournament"
+    assert "name__str__" not in item
+
+    event_admin_model.list_select_related = ("tournament",)
+    r = await client.get(f"/api/list/{event.get_model_name()}?limit=1000")
+    assert r.status_code == 200, r.text
+    item = next(result for result in r.json()["results"] if str(result["id"]) == str(event.id))
+    assert item["tournament__str__"] == "Test Tournament"
+
+
+async def test_list_cursor_pagination(session_id, admin_models, superuser, event, client):
+    assert session_id
+
+    model_name = superuser.get_model_name()
+    r = await client.get(f"/api/list/{model_name}?cursor=cursor")
+    assert r.status_code == 422, r.text
+
+    r = await client.get(f"/api/list/{model_name}?limit=1000")
+    assert r.status_code == 200, r.text
+    assert r.json()["next_cursor"] is None
+    assert r.json()["prev_cursor"] is None
+    ids = sorted(result["id"] for result in r.json()["results"])
+    assert len(ids) >= 2
+
+    admin_models[superuser.__class__].list_pagination = ListPagination.CURSOR
+    r = await client.get(f"/api/list/{model_name}?offset=0&limit=1")
+    assert r.status_code == 200, r.text
+    first_page = r.json()
+    assert [result["id"] for result in first_page["results"]] == ids[:1]
+    assert first_page["prev_cursor"] is None
+    assert first_page["next_cursor"]
+
+    r = await client.get(f"/api/list/{model_name}?offset=0&limit=1&cursor={first_page['next_cursor']}")
+    assert r.status_code == 200, r.text
+    second_page = r.json()
+    assert [result["id"] for result in second_page["results"]] == ids[1:2]
+    assert second_page["total"] == first_page["total"]
+    assert second_page["prev_cursor"]
+
+    r = await client.get(f"/api/list/{model_name}?offset=0&limit=1&cursor={second_page['prev_cursor']}")
+    assert r.status_code == 200, r.text
+    assert r.json()["results"] == first_page["results"]
+    assert r.json()["prev_cursor"] is None
+    assert r.json()["next_cursor"] == first_page["next_cursor"]
+
+    r = await client.get(f"/api/list/{model_name}?offset=0&limit=1&sort_by=-id&cursor={first_page['next_cursor']}")
+    assert r.status_code == 422, r.text
+
+
+async def test_list_documented_get_list(session_id, admin_models, superuser, event, client, mocker, monkeypatch):
+    assert session_id
+    monkeypatch.setattr(list_total_cache, "ttl", 60)
+    list_total_cache.clear()
+    list_anchor_cache.clear()
+
+    user_admin_model = admin_models[superuser.__class__]
+    user_admin_model.list_anchor_pages = 1
+    model_get_list = user_admin_model.get_list
+
+    # an override with the documented signature gets neither the cached total nor the anchors
+    async def get_list(offset=None, limit=None, search=None, sort_by=None, filters=None):
+        return await model_get_list(offset=offset, limit=limit, search=search, sort_by=sort_by, filters=filters)
+
+    mocker.patch.object(user_admin_model, "get_list", get_list)
+    for offset in (0, 1):
+        r = await client.get(f"/api/list/{superuser.get_model_name()}?offset={offset}&limit=1")
+        assert r.status_code == 200, r.text
+        assert r.json()["total"] >= 2
+    assert len(list_total_cache) == 1
+    assert len(list_anchor_cache) == 0
+    list_total_cache.clear()
@@ -21,6 +21,23 @@ async def test_retrieve(session_id, admin_models, event, client):
     assert item["participants"][0] == updated_event["participants"][0]
 
 
+async def test_retrieve_sparse_fields(session_id, event, client):
+    assert session_id
+
+    r = await client.get(
+        f"/api/retrieve/{event.get_model_name()}/{event.id}?fields=name,participants",
+    )
+    assert r.status_code == 200, r.text
+    item = r.json()
+    assert set(item) == {"id", "name", "participants", "__str__"}
+    assert item["participants"]
+
+    r = await client.get(
+        f"/api/retrieve/{event.get_model_name()}/{event.id}?fields=name,password",
+    )
+    assert r.status_code == 422, r.text
+
+
 async def test_list_405(session_id, event, client):
     assert session_id
     r = await client.post(
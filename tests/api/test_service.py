@@ -13,12 +13,14 @@ from fastadmin.api.schemas import (
     ExportInputSchema,
     SignInInputSchema,
 )
-from fastadmin.api.service import ApiService, get_user_id_from_session_id
+from fastadmin.api.service import ApiService, authenticated_user_cache, get_user_id_from_session_id
+from fastadmin.api.sessions import MemorySessionStore
 from fastadmin.models.decorators import action, widget_action
 from fastadmin.models.schemas import (
     ActionInputSchema,
     ActionResponseSchema,
     ActionResponseType,
+    ListResult,
     WidgetActionChartProps,
     WidgetActionInputSchema,
     WidgetActionResponseSchema,
@@ -48,6 +50,61 @@ async def test_get_user_id_from_session_id_empty_secret(monkeypatch):
     assert await get_user_id_from_session_id("any-token") is None
 
 
+async def test_get_authenticated_user_cache(monkeypatch):
+    current_user = {"id": 1, "username": "admin"}
+    admin_model = SimpleNamespace(
+        orm_get_obj=AsyncMock(return_value=object()), get_obj=AsyncMock(return_value=current_user)
+    )
+    monkeypatch.setattr("fastadmin.api.service.get_admin_model", lambda _model: admin_model)
+    token = jwt.encode(
+        {"user_id": 1, "session_expired_at": (datetime.now(UTC) + timedelta(minutes=5)).isoformat()},
+        settings.ADMIN_SECRET_KEY,
+        algorithm="HS256",
+    )
+    service = ApiService()
+
+    for _ in range(2):
+        assert await service._get_authenticated_user(token) == (1, current_user)
+        assert await service.me(token) == current_user
+    # the user read is the existence check, it is not looked up with orm_get_obj as well
+    assert admin_model.orm_get_obj.await_count == 0
+    assert admin_model.get_obj.await_count == 1
+
+    # a request changing its user does not change the cached user
+    _, user = await service._get_authenticated_user(token)
+    user["username"] = "changed"
+    assert await service.me(token) == {"id": 1, "username": "admin"}
+
+    service._invalidate_authenticated_users("Event", [1])
+    assert len(authenticated_user_cache) == 1
+    service._invalidate_authenticated_users(settings.ADMIN_USER_MODEL, ["2"])
+    assert len(authenticated_user_cache) == 1
+    service._invalidate_authenticated_users(settings.ADMIN_USER_MODEL, ["1"])
+    assert len(authenticated_user_cache) == 0
+
+    monkeypatch.setattr(authenticated_user_cache, "ttl", 0)
+    await service._get_authenticated_user(token)
+    assert admin_model.get_obj.await_count == 2
+    assert len(authenticated_user_cache) == 0
+
+    del admin_model.get_obj
+    with pytest.raises(AdminApiException) as exc:
+        await service.me(token)
+    assert exc.value.status_code == 404
+
+
+async def test_get_authenticated_user_deleted(monkeypatch):
+    monkeypatch.setattr("fastadmin.api.service.get_user_id_from_session_id", AsyncMock(return_value=1))
+    admin_model = SimpleNamespace(get_obj=AsyncMock(return_value=None))
+    monkeypatch.setattr("fastadmin.api.service.get_admin_model", lambda _model: admin_model)
+
+    for store in (None, MemorySessionStore(60)):
+        monkeypatch.setattr("fastadmin.api.service.session_store", store)
+        with pytest.raises(AdminApiException) as exc:
+            await ApiService()._get_authenticated_user("sid")
+        assert exc.value.status_code == 401
+
+
 async def test_sign_in_empty_secret_raises(monkeypatch):
     """sign_in refuses to issue a token when ADMIN_SECRET_KEY is unset/empty."""
     admin_model = SimpleNamespace(authenticate=AsyncMock(return_value=1))
@@ -260,9 +317,9 @@ async def test_list_skips_excluded_filter_fields(monkeypatch):
     )
     monkeypatch.setattr("fastadmin.api.service.get_admin_or_admin_inline_model", lambda _model: admin_model)
 
-    items, total = await ApiService().list("sid", "Event", filters={"search": "abc"})
-    assert total == 1
-    assert items == [{"name": "x"}]
+    # a get_list override returning an (objects, total) tuple
+    result = await ApiService().list("sid", "Event", filters={"search": "abc"})
+    assert result == ListResult(results=[{"name": "x"}], total=1)
     admin_model.get_list.assert_awaited_once_with(
         offset=0,
         limit=10,
@@ -287,15 +344,15 @@ async def test_list_binds_request_and_user_context(monkeypatch):
         list_select_related=[],
         get_fields_for_serialize=lambda: ["name"],
         get_model_fields_with_widget_types=list,
-        get_list=AsyncMock(return_value=([{"name": "x"}], 1)),
+        get_list=AsyncMock(return_value=ListResult(results=[{"name": "x"}], total=1)),
         set_context=set_context,
     )
     monkeypatch.setattr("fastadmin.api.service.get_admin_or_admin_inline_model", lambda _model: admin_model)
 
     request = object()
-    items, total = await ApiService().list("sid", "Event", request=request)
-    assert total == 1
-    assert items == [{"name": "x"}]
+    result = await ApiService().list("sid", "Event", request=request)
+    assert result.total == 1
+    assert result.results == [{"name": "x"}]
     set_context.assert_called_once_with(request=request, user=current_user)
 
 
@@ -520,6 +577,24 @@ async def test_export_skips_excluded_filters(monkeypatch):
     )
 
 
+async def test_export_clamps_limit(monkeypatch):
+    monkeypatch.setattr("fastadmin.api.service.get_user_id_from_session_id", AsyncMock(return_value=1))
+    admin_model = SimpleNamespace(
+        search_fields=[],
+        ordering=[],
+        get_fields_for_serialize=lambda: ["name"],
+        get_model_fields_with_widget_types=list,
+        get_export=AsyncMock(return_value=None),
+    )
+    monkeypatch.setattr("fastadmin.api.service.get_admin_or_admin_inline_model", lambda _model: admin_model)
+
+    await ApiService().export("sid", "Event", ExportInputSchema(limit=5000))
+    assert admin_model.get_export.await_args.kwargs["limit"] == 5000
+
+    await ApiService().export("sid", "Event", ExportInputSchema(limit=None))
+    assert admin_model.get_export.await_args.kwargs["limit"] == settings.ADMIN_EXPORT_MAX_LIMIT
+
+
 async def test_upload_file_401(monkeypatch):
     monkeypatch.setattr("fastadmin.api.service.get_user_id_from_session_id", AsyncMock(return_value=None))
     with pytest.raises(AdminApiException) as exc_info:
@@ -0,0 +1,192 @@
+import asyncio
+import time
+
+import pytest
+
+from fastadmin.api.sessions import (
+    MemorySessionStore,
+    RedisSessionStore,
+    SessionStore,
+    SQLiteSessionStore,
+    create_session_store,
+)
+
+
+class _RedisStandIn:
+    """A local Redis-protocol server with the commands of RedisSessionStore (RESP2, no persistence)"""
+
+    def __init__(self):
+        self.values = {}
+        self.sorted_sets = {}
+        self.expires_at = {}
+
+    def _expire(self):
+        now = time.monotonic()
+        for name in [name for name, expires_at in self.expires_at.items() if expires_at <= now]:
+            self.values.pop(name, None)
+            self.sorted_sets.pop(name, None)
+            del self.expires_at[name]
+
+    def _execute(self, command, *args):
+        self._expire()
+        match command.upper():
+            case "SET":
+                name, value = args[0], args[1]
+                self.values[name] = value
+                if len(args) == 4 and args[2].upper() == "PX":
+                    self.expires_at[name] = time.monotonic() + int(args[3]) / 1000
+                return "+OK"
+            case "PEXPIRE":
+                self.expires_at[args[0]] = time.monotonic() + int(args[1]) / 1000
+                return 1
+            case "ZADD":
+                members = self.sorted_sets.setdefault(args[0], {})
+                for index in range(1, len(args), 2):
+                    members[args[index + 1]] = float(args[index])
+                return len(args) // 2
+            case "ZRANGE":
+                members = self.sorted_sets.get(args[0], {})
+                return sorted(members, key=members.get)
+            case "ZREM":
+                members = self.sorted_sets.get(args[0], {})
+                return sum(members.pop(member, None) is not None for member in args[1:])
+            case "MGET":
+                return [self.values.get(name) for name in args]
+            case "EXISTS":
+                return sum(name in self.values for name in args)
+            case "DEL":
+                removed = 0
+                for name in args:
+                    removed += self.values.pop(name, None) is not None or self.sorted_sets.pop(name, None) is not None
+                    self.expires_at.pop(name, None)
+                return removed
+            case _:
+                # e.g. CLIENT SETINFO sent by the client on connect
+                return "+OK"
+
+    @staticmethod
+    def _encode(value):
+        if isinstance(value, int):
+            return f":{value}\r\n".encode()
+        if value is None:
+            return b"$-1\r\n"
+        if isinstance(value, list):
+            return f"*{len(value)}\r\n".encode() + b"".join(_RedisStandIn._encode(item) for item in value)
+        if value.startswith("+"):
+            return f"{value}\r\n".encode()
+        data = value.encode()
+        return f"${len(data)}\r\n".encode() + data + b"\r\n"
+
+    async def handle(self, reader, writer):
+        try:
+            while line := await reader.readline():
+                args = []
+                for _ in range(int(line[1:])):
+                    length = int((await reader.readline())[1:])
+                    args.append((await reader.readexactly(length + 2))[:-2].decode())
+                writer.write(self._encode(self._execute(*args)))
+                await writer.drain()
+        finally:
+            writer.close()
+
+
+@pytest.fixture
+async def redis_stand_in():
+    stand_in = _RedisStandIn()
+    server = await asyncio.start_server(stand_in.handle, "127.0.0.1", 0)
+    stand_in.url = f"redis://127.0.0.1:{server.sockets[0].getsockname()[1]}/0"
+    yield stand_in
+    server.close()
+
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+def make_store(request, tmp_path, redis_stand_in):
+    def make_store(ttl=60, max_sessions_per_user=2):
+        match request.param:
+            case "memory":
+                return MemorySessionStore(ttl, max_sessions_per_user)
+            case "sqlite":
+                return SQLiteSessionStore(str(tmp_path / "sessions.sqlite3"), ttl, max_sessions_per_user)
+            case _:
+                return RedisSessionStore(redis_stand_in.url, ttl, max_sessions_per_user)
+
+    return make_store
+
+
+async def test_session_store(make_store):
+    store = make_store()
+    first, second, third = [await store.create("1") for _ in range(3)]
+    other = await store.create("2")
+    assert len({first, second, third, other}) == 4
+
+    # a user keeps its two newest sessions
+    assert not await store.exists("1", first)
+    assert await store.exists("1", second)
+    assert await store.exists("1", third)
+    assert not await store.exists("2", second)
+    assert await store.exists("2", other)
+
+    await store.delete("1", second)
+    assert not await store.exists("1", second)
+    assert await store.exists("1", third)
+    await store.delete("1", second)
+
+    await store.delete_user("1")
+    assert not await store.exists("1", third)
+    assert await store.exists("2", other)
+
+    unlimited_store = make_store(max_sessions_per_user=0)
+    session_keys = [await unlimited_store.create("3") for _ in range(3)]
+    assert all([await unlimited_store.exists("3", key) for key in session_keys])
+
+
+async def test_session_store_expiry(make_store):
+    store = make_store(ttl=0.2)
+    expired = await store.create("1")
+    await asyncio.sleep(0.3)
+    assert not await store.exists("1", expired)
+
+    # expired sessions do not count towards the limit
+    active = [await store.create("1") for _ in range(2)]
+    assert all([await store.exists("1", key) for key in active])
+
+
+async def test_redis_session_store(redis_stand_in):
+    store = RedisSessionStore(redis_stand_in.url, 60, max_sessions_per_user=1, prefix="test:")
+    session_key = await store.create("1")
+    assert redis_stand_in.values == {f"test:session:1:{session_key}": "1"}
+    assert list(redis_stand_in.sorted_sets["test:user:1"]) == [session_key]
+
+    # the client is not bound to an event loop (Flask runs every async view on its own loop)
+    assert await asyncio.to_thread(asyncio.run, store.exists("1", session_key))
+    assert await store.exists("1", session_key)
+
+    await store.delete_user("1")
+    assert redis_stand_in.values == {}
+    assert redis_stand_in.sorted_sets == {}
+
+
+async def test_session_store_base():
+    store = SessionStore(60)
+    assert store.generate_session_key() != store.generate_session_key()
+    for call in (store.create("1"), store.exists("1", "key"), store.delete("1", "key"), store.delete_user("1")):
+        with pytest.raises(NotImplementedError):
+            await call
+
+
+def test_create_session_store(tmp_path, mocker):
+    assert create_session_store("", None, 60) is None
+    assert isinstance(create_session_store("memory", None, 60), MemorySessionStore)
+    with pytest.raises(ValueError, match="requires a path"):
+        create_session_store("sqlite", None, 60)
+    store = create_session_store("sqlite", str(tmp_path / "x.sqlite3"), 60, max_sessions_per_user=3)
+    assert isinstance(store, SQLiteSessionStore)
+    assert store.path == str(tmp_path / "x.sqlite3")
+    assert store.max_sessions_per_user == 3
+    assert create_session_store("redis", None, 60).url == "redis://localhost:6379/0"
+    with pytest.raises(ValueError, match="Unknown session store"):
+        create_session_store("memcached", None, 60)
+
+    mocker.patch("importlib.util.find_spec", return_value=None)
+    with pytest.raises(RuntimeError, match="redis package"):
+        create_session_store("redis", None, 60)
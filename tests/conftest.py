@@ -24,6 +24,7 @@ from fastadmin import (
     TortoiseModelAdmin,
     YaraOrmModelAdmin,
 )
+from fastadmin.api.service import authenticated_user_cache
 from fastadmin.models.base import admin_models as admin_models_objs
 from fastadmin.models.helpers import get_admin_model
 from fastadmin.settings import settings
@@ -44,6 +45,15 @@ def _restore_admin_user_model():
     settings.ADMIN_USER_MODEL = prev
 
 
+@pytest.fixture(autouse=True)
+def _clear_authenticated_user_cache():
+    # Tests mocking the session check share user ids (and session ids), so a user cached by
+    # one test must not authenticate the next one.
+    authenticated_user_cache.clear()
+    yield
+    authenticated_user_cache.clear()
+
+
 @pytest.fixture(scope="session")
 async def django_session():
     async def _django_session():
@@ -757,6 +767,8 @@ async def admin_models():
     prev_admin_models = {k: copy(v) for k, v in admin_models_objs.items()}
     yield admin_models_objs
     for k, v in prev_admin_models.items():
+        # the copies share the caches of the admins the test may have reconfigured
+        v.clear_model_fields_cache()
         admin_models_objs[k] = v
 
 
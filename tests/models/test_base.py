@@ -1,13 +1,29 @@
+import base64
+import datetime
+import gzip
+import io
+import json
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from decimal import Decimal
 from uuid import uuid4
 
 import pytest
 
-from fastadmin import ModelAdmin
+from fastadmin import ModelAdmin, display
 from fastadmin.api.exceptions import AdminApiException
 from fastadmin.api.schemas import ExportFormat
+from fastadmin.models import base as base_module
 from fastadmin.models.base import BaseModelAdmin
-from fastadmin.models.schemas import ModelFieldWidgetSchema, WidgetType
+from fastadmin.models.schemas import (
+    ListCountStrategy,
+    ListPagination,
+    ListResult,
+    ModelFieldWidgetSchema,
+    NumberType,
+    WidgetType,
+)
+from fastadmin.settings import settings
 
 
 async def test_not_implemented_methods():
@@ -30,6 +46,8 @@ async def test_not_implemented_methods():
     with pytest.raises(NotImplementedError):
         await base.orm_get_obj(0)
 
+    assert await base.orm_get_estimated_count() is None
+
     with pytest.raises(NotImplementedError):
         await base.orm_get_m2m_ids({}, "test")
 
@@ -89,6 +107,7 @@ async def test_export_wrong_format(mocker):
         for index in range(3)
     ]
     mocker.patch.object(base, "get_model_fields_with_widget_types", return_value=values)
+    base.clear_model_fields_cache()
     fields = base.get_fields_for_serialize()
     assert len(fields) == 3
     assert "test_0" in base.get_fields_for_serialize()
@@ -809,7 +828,7 @@ async def test_get_export_json_uses_custom_encoder():
     admin = ExportAdmin(type("Model", (), {}))
     stream = await admin.get_export(ExportFormat.JSON)
     assert stream is not None
-    content = stream.getvalue()
+    content = b"".join([chunk async for chunk in stream]).decode()
     assert '"id":' in content
 
 
@@ -851,3 +870,1087 @@ def test_get_writable_field_names_respects_fields_exclude_readonly(mocker):
     admin.readonly_fields = ("id",)
 
     assert admin.get_writable_field_names() == {"name"}
+
+
+def test_get_model_fields_metadata_is_cached_and_invalidated():
+    class CountingAdmin(ModelAdmin):
+        calls = 0
+
+        def get_model_fields_with_widget_types(self, with_m2m=None):
+            type(self).calls += 1
+            fields = [
+                ModelFieldWidgetSchema(
+                    name=name,
+                    column_name=column_name,
+                    is_m2m=is_m2m,
+                    is_pk=False,
+                    is_immutable=False,
+                    form_widget_type=WidgetType.Input,
+                    form_widget_props={"readOnly": name in self.readonly_fields},
+                    filter_widget_type=WidgetType.Input,
+                    filter_widget_props={},
+                )
+                for name, column_name, is_m2m in (("name", "name", False), ("author", "author_id", False))
+            ]
+            if with_m2m:
+                return []
+            return fields
+
+    admin = CountingAdmin(type("Model", (), {}))
+    metadata = admin.get_model_fields_metadata()
+    assert admin.get_model_fields_metadata() is metadata
+    assert CountingAdmin.calls == 1
+    assert metadata.by_name["author"].column_name == "author_id"
+    assert [f.name for f in metadata.fields] == ["name", "author"]
+
+    # with_m2m is a separate cache key.
+    assert admin.get_model_fields_metadata(with_m2m=True).fields == []
+    assert CountingAdmin.calls == 2
+    admin.get_fields_for_serialize()
+    admin.get_writable_field_names()
+    assert CountingAdmin.calls == 2
+
+    # Changing an admin setting keeps the cache until it is cleared.
+    admin.readonly_fields = ("name",)
+    assert admin.get_model_fields_metadata().by_name["name"].form_widget_props["readOnly"] is False
+    admin.clear_model_fields_cache()
+    assert admin.get_model_fields_metadata().by_name["name"].form_widget_props["readOnly"] is True
+    assert CountingAdmin.calls == 3
+
+
+async def test_get_serialization_plan_is_cached_and_executed_by_serialize_obj():
+    class PlanAdmin(ModelAdmin):
+        list_display = ("name", "title", "upper_name")
+
+        def get_model_fields_with_widget_types(self, with_m2m=None):
+            return [
+                ModelFieldWidgetSchema(
+                    name=name,
+                    column_name=name,
+                    is_m2m=is_m2m,
+                    is_pk=False,
+                    is_immutable=False,
+                    form_widget_type=WidgetType.Input,
+                    form_widget_props={},
+                    filter_widget_type=WidgetType.Input,
+                    filter_widget_props={},
+                )
+                for name, is_m2m in (("name", False), ("tags", True))
+            ]
+
+        async def orm_get_m2m_ids(self, obj, field):
+            return [1, 2]
+
+        @display
+        def upper_name(self, obj):
+            return obj.name.upper()
+
+        @display
+        async def title(self, obj):
+            return obj.name.title()
+
+    class Obj:
+        name = "ann smith"
+
+        def __str__(self):  # type: ignore[override]
+            return "obj"
+
+    admin = PlanAdmin(type("Model", (), {}))
+    list_plan = admin.get_serialization_plan(list_view=True)
+    assert admin.get_serialization_plan(list_view=True) is list_plan
+    assert [f.name for f in list_plan.attribute_fields] == ["name"]
+    assert list_plan.m2m_fields == []
+    assert {name for name, _ in list_plan.display_functions} == {"title", "upper_name"}
+
+    detail_plan = admin.get_serialization_plan()
+    assert detail_plan is not list_plan
+    assert [f.name for f in detail_plan.m2m_fields] == ["tags"]
+
+    assert await admin.serialize_obj(Obj(), list_view=True) == {
+        "name": "ann smith",
+        "__str__": "obj",
+        "title": "Ann Smith",
+        "upper_name": "ANN SMITH",
+    }
+    assert (await admin.serialize_obj(Obj()))["tags"] == [1, 2]
+
+    admin.list_display = ("name",)
+    assert admin.get_serialization_plan(list_view=True) is list_plan
+    admin.clear_model_fields_cache()
+    assert admin.get_serialization_plan(list_view=True) is not list_plan
+    assert admin.get_serialization_plan(list_view=True).display_functions == []
+
+
+async def test_get_serialization_plan_sparse_fields():
+    class SparseAdmin(ModelAdmin):
+        list_display = ("id", "name", "upper_name")
+
+        def get_model_fields_with_widget_types(self, with_m2m=None):
+            return [
+                ModelFieldWidgetSchema(
+                    name=name,
+                    column_name=name,
+                    is_m2m=is_m2m,
+                    is_pk=name == "id",
+                    is_immutable=False,
+                    form_widget_type=WidgetType.Input,
+                    form_widget_props={},
+                    filter_widget_type=WidgetType.Input,
+                    filter_widget_props={},
+                )
+                for name, is_m2m in (("id", False), ("name", False), ("tags", True))
+            ]
+
+        async def orm_get_m2m_ids(self, obj, field):
+            raise AssertionError("m2m ids are not requested")
+
+        @display
+        def upper_name(self, obj):
+            raise AssertionError("upper_name is not requested")
+
+    class Obj:
+        id = 1
+        name = "ann"
+
+        def __str__(self):  # type: ignore[override]
+            return "obj"
+
+    admin = SparseAdmin(type("Model", (), {}))
+    plan = admin.get_serialization_plan(fields=["name"])
+    assert admin.get_serialization_plan(fields=["name"]) is not plan
+    assert admin._serialization_plans == {}
+    assert sorted(f.name for f in plan.attribute_fields) == ["id", "name"]
+    assert plan.m2m_fields == []
+    assert plan.display_functions == []
+
+    assert await admin.serialize_obj(Obj(), fields=["name"]) == {"id": 1, "name": "ann", "__str__": "obj"}
+    assert await admin.serialize_objs([Obj()], list_view=True, fields=["name"]) == [
+        {"id": 1, "name": "ann", "__str__": "obj"}
+    ]
+    assert admin.get_serialization_plan(fields=["tags"]).m2m_fields[0].name == "tags"
+
+
+async def test_serialize_objs_batches_sync_functions(mocker):
+    class BatchAdmin(ModelAdmin):
+        list_display = ("name", "title", "upper_name", "initials")
+
+        def get_model_fields_with_widget_types(self, with_m2m=None):
+            return [
+                ModelFieldWidgetSchema(
+                    name=name,
+                    column_name=name,
+                    is_m2m=is_m2m,
+                    is_pk=False,
+                    is_immutable=False,
+                    form_widget_type=WidgetType.Input,
+                    form_widget_props={},
+                    filter_widget_type=WidgetType.Input,
+                    filter_widget_props={},
+                )
+                for name, is_m2m in (("name", False), ("tags", True))
+            ]
+
+        async def orm_get_m2m_ids(self, obj, field):
+            return [obj.name]
+
+        @display
+        def upper_name(self, obj):
+            return obj.name.upper()
+
+        @display(inline=True)
+        def initials(self, obj):
+            return obj.name[0]
+
+        @display
+        async def title(self, obj):
+            return obj.name.title()
+
+    class Obj:
+        def __init__(self, name):
+            self.name = name
+
+        def __str__(self):  # type: ignore[override]
+            return f"obj {self.name}"
+
+    class AsyncStrObj(Obj):
+        async def __str__(self):  # type: ignore[override]
+            return f"async {self.name}"
+
+    admin = BatchAdmin(type("Model", (), {}))
+    plan = admin.get_serialization_plan(list_view=True)
+    assert [name for name, _ in plan.sync_display_functions] == ["upper_name"]
+    assert [name for name, _ in plan.inline_display_functions] == ["initials"]
+    assert [name for name, _ in plan.async_display_functions] == ["title"]
+
+    sync_to_async_spy = mocker.spy(base_module, "sync_to_async")
+    objs = [Obj("ann"), AsyncStrObj("bob")]
+    result = await admin.serialize_objs(objs, list_view=True)
+    assert sync_to_async_spy.call_count == 1
+    assert result == [
+        {"name": "ann", "__str__": "obj ann", "title": "Ann", "upper_name": "ANN", "initials": "a"},
+        {"name": "bob", "__str__": "async bob", "title": "Bob", "upper_name": "BOB", "initials": "b"},
+    ]
+    assert [list(obj_dict) for obj_dict in result] == [
+        list(await admin.serialize_obj(obj, list_view=True)) for obj in objs
+    ]
+
+    detail = await admin.serialize_objs(objs)
+    assert [obj_dict["tags"] for obj_dict in detail] == [["ann"], ["bob"]]
+    assert await admin.serialize_objs([]) == []
+
+
+async def test_serialize_obj_attributes_without_str():
+    class Obj:
+        value = 1
+
+    base = ModelAdmin(type("Model", (), {}))
+    fields = [
+        ModelFieldWidgetSchema(
+            name="value",
+            column_name="value",
+            is_m2m=False,
+            is_pk=False,
+            is_immutable=False,
+            form_widget_type=WidgetType.Input,
+            form_widget_props={},
+            filter_widget_type=WidgetType.Input,
+            filter_widget_props={},
+        )
+    ]
+    assert await base.serialize_obj_attributes(Obj(), fields, with_str=False) == {"value": 1}
+
+
+async def test_serialize_objs_calls_batch_display_functions_once_per_page():
+    calls = []
+
+    class BatchAdmin(ModelAdmin):
+        list_display = ("id", "orders_count", "last_login_ip")
+
+        @staticmethod
+        def get_model_pk_name(orm_model_cls):
+            return "id"
+
+        def get_model_fields_with_widget_types(self, with_m2m=None):
+            return [
+                ModelFieldWidgetSchema(
+                    name="id",
+                    column_name="id",
+                    is_m2m=False,
+                    is_pk=True,
+                    is_immutable=True,
+                    form_widget_type=WidgetType.InputNumber,
+                    form_widget_props={},
+                    filter_widget_type=WidgetType.InputNumber,
+                    filter_widget_props={},
+                )
+            ]
+
+        @display(batch=True)
+        async def orders_count(self, objs):
+            calls.append(("orders_count", [obj.id for obj in objs]))
+            return {obj.id: obj.id * 10 for obj in objs}
+
+        @display(batch=True)
+        def last_login_ip(self, objs):
+            calls.append(("last_login_ip", [obj.id for obj in objs]))
+            return {1: "10.0.0.1"}
+
+    class Obj:
+        def __init__(self, id):
+            self.id = id
+
+        def __str__(self):  # type: ignore[override]
+            return f"obj {self.id}"
+
+    admin = BatchAdmin(type("Model", (), {}))
+    plan = admin.get_serialization_plan(list_view=True)
+    assert plan.pk_name == "id"
+    assert [name for name, _ in plan.async_batch_display_functions] == ["orders_count"]
+    assert [name for name, _ in plan.sync_batch_display_functions] == ["last_login_ip"]
+
+    objs = [Obj(1), Obj(2), Obj(3)]
+    result = await admin.serialize_objs(objs, list_view=True)
+    assert sorted(calls) == [("last_login_ip", [1, 2, 3]), ("orders_count", [1, 2, 3])]
+    assert [(r["orders_count"], r["last_login_ip"]) for r in result] == [(10, "10.0.0.1"), (20, None), (30, None)]
+
+    calls.clear()
+    obj_dict = await admin.serialize_obj(Obj(2))
+    assert (obj_dict["orders_count"], obj_dict["last_login_ip"]) == (20, None)
+    assert sorted(calls) == [("last_login_ip", [2]), ("orders_count", [2])]
+
+
+async def test_get_list_fk_labels(mocker):
+    class Author:
+        def __init__(self, id):
+            self.id = id
+
+        async def __str__(self):  # type: ignore[override]
+            return f"author {self.id}"
+
+    class Book:
+        def __init__(self, id, author_id):
+            self.id = id
+            self.author_id = author_id
+
+        def __str__(self):  # type: ignore[override]
+            return f"book {self.id}"
+
+    fk_field = ModelFieldWidgetSchema(
+        name="author",
+        column_name="author_id",
+        is_m2m=False,
+        is_pk=False,
+        is_immutable=False,
+        form_widget_type=WidgetType.Input,
+        form_widget_props={},
+        filter_widget_type=WidgetType.Input,
+        filter_widget_props={},
+    )
+
+    class AuthorAdmin(ModelAdmin):
+        @staticmethod
+        def get_model_pk_name(orm_model_cls):
+            return "id"
+
+        async def orm_get_list(self, **kwargs):
+            (((_, condition), ids),) = kwargs["filters"].items()
+            assert condition == "in"
+            # the labels are read without counting the related objects
+            assert kwargs["with_count"] is False
+            return [Author(pk) for pk in sorted(ids) if pk != 3], None
+
+    class BookAdmin(ModelAdmin):
+        list_display = ("id", "author")
+        list_display_fk_labels = True
+
+        def get_model_fields_with_widget_types(self, with_m2m=None):
+            return [fk_field]
+
+        def get_related_model_cls(self, field_name):
+            return Author if field_name == "author" else None
+
+        async def orm_get_list(self, **kwargs):
+            return [Book(1, 1), Book(2, 3), Book(3, None), Book(4, 1)], 4
+
+    book_admin = BookAdmin(Book)
+    get_admin_model = mocker.patch("fastadmin.models.helpers.get_admin_model", return_value=AuthorAdmin(Author))
+
+    result = await book_admin.get_list()
+    assert result.total == 4
+    assert [obj["author__str__"] for obj in result.results] == ["author 1", None, None, "author 1"]
+    get_admin_model.assert_called_once_with(Author)
+
+    assert await book_admin.get_list_fk_labels(fk_field, [Book(5, None)], [{"author": None}]) == [None]
+    get_admin_model.return_value = None
+    assert await book_admin.get_list_fk_labels(fk_field, [Book(1, 1)], [{"author": 1}]) == [None]
+
+    book_admin.list_display_fk_labels = False
+    result = await book_admin.get_list()
+    assert "author__str__" not in result.results[0]
+
+    with pytest.raises(NotImplementedError):
+        ModelAdmin(Book).get_related_model_cls("author")
+
+
+def test_estimated_count_query_and_parsing():
+    assert base_module.get_estimated_count_query("PostgreSQL", "$1") == (
+        "SELECT reltuples FROM pg_class WHERE oid = to_regclass($1)"
+    )
+    assert base_module.get_estimated_count_query("postgres", "$1") == base_module.get_estimated_count_query(
+        "postgresql", "$1"
+    )
+    assert "information_schema.TABLES" in base_module.get_estimated_count_query("mariadb", "%s")
+    assert base_module.get_estimated_count_query("sqlite", "?").endswith("tbl = ?")
+    assert base_module.get_estimated_count_query("oracle", ":1") is None
+
+    assert base_module.parse_estimated_count(None) is None
+    assert base_module.parse_estimated_count(-1.0) is None
+    assert base_module.parse_estimated_count(0) is None
+    assert base_module.parse_estimated_count(1234.0) == 1234
+    assert base_module.parse_estimated_count("1000 10") == 1000
+
+
+async def test_get_list_uses_estimated_total(mocker):
+    class EstimateAdmin(ModelAdmin):
+        list_count_strategy = ListCountStrategy.ESTIMATED
+
+        def get_model_fields_with_widget_types(self, with_m2m=None):
+            return []
+
+        async def orm_get_estimated_count(self):
+            return 5
+
+    admin = EstimateAdmin(type("Model", (), {}))
+    orm_get_list = mocker.patch.object(admin, "orm_get_list", return_value=([object()] * 3, None))
+    mocker.patch.object(admin, "serialize_objs", return_value=[{}, {}, {}])
+
+    result = await admin.get_list(offset=0, limit=3)
+    assert result.total == 5
+    assert result.total_is_approximate
+    assert orm_get_list.await_args.kwargs["with_count"] is False
+
+    # stale statistics never report fewer objects than the page reached
+    result = await admin.get_list(offset=10, limit=3)
+    assert result.total == 13
+
+    orm_get_list.return_value = ([], 0)
+    mocker.patch.object(admin, "serialize_objs", return_value=[])
+    result = await admin.get_list(search="x")
+    assert result == ListResult(results=[], total=0)
+    assert "with_count" not in orm_get_list.await_args.kwargs
+
+
+async def test_get_list_total_estimate_strategies(mocker):
+    admin = ModelAdmin(type("Model", (), {}))
+    estimate = mocker.patch.object(admin, "orm_get_estimated_count", return_value=50)
+
+    assert await admin.get_list_total_estimate() is None
+    estimate.assert_not_awaited()
+
+    admin.list_count_strategy = ListCountStrategy.ESTIMATED
+    assert await admin.get_list_total_estimate() == 50
+    assert await admin.get_list_total_estimate(search="x") is None
+    assert await admin.get_list_total_estimate(filters={("name", "exact"): "x"}) is None
+
+    admin.list_count_strategy = ListCountStrategy.AUTO
+    assert await admin.get_list_total_estimate() is None
+    admin.list_count_estimate_threshold = 50
+    assert await admin.get_list_total_estimate() == 50
+
+    estimate.return_value = None
+    assert await admin.get_list_total_estimate() is None
+
+
+async def test_get_list_caps_total(mocker):
+    class CappedAdmin(ModelAdmin):
+        list_count_limit = 3
+
+        def get_model_fields_with_widget_types(self, with_m2m=None):
+            return []
+
+    admin = CappedAdmin(type("Model", (), {}))
+    orm_get_list = mocker.patch.object(admin, "orm_get_list", return_value=([object()] * 2, 4))
+    mocker.patch.object(admin, "serialize_objs", return_value=[{}, {}])
+
+    result = await admin.get_list(offset=0, limit=2)
+    assert result.total == 3
+    assert result.total_is_capped
+    assert not result.total_is_approximate
+    assert orm_get_list.await_args.kwargs["count_limit"] == 3
+
+    result = await admin.get_list(offset=4, limit=2)
+    assert result.total == 6
+
+    orm_get_list.return_value = ([object()] * 2, 3)
+    result = await admin.get_list(offset=0, limit=2)
+    assert result == ListResult(results=[{}, {}], total=3)
+
+    result = await admin.get_list(offset=0, limit=2, known_total=3)
+    assert result.total == 3
+    assert orm_get_list.await_args.kwargs["with_count"] is False
+
+    # a cached total below the end of the page (objects were added since) is raised to it
+    result = await admin.get_list(offset=4, limit=2, known_total=3)
+    assert result.total == 6
+
+
+async def test_get_export_total(mocker):
+    admin = ModelAdmin(type("Model", (), {}))
+    orm_get_list = mocker.patch.object(admin, "orm_get_list", return_value=([object()], 20))
+    estimate = mocker.patch.object(admin, "orm_get_estimated_count", return_value=50)
+
+    assert await admin.get_export_total() == 20
+    assert await admin.get_export_total(offset=5, limit=10) == 10
+    assert await admin.get_export_total(offset=15, limit=10) == 5
+    estimate.assert_not_awaited()
+
+    admin.list_count_strategy = ListCountStrategy.ESTIMATED
+    assert await admin.get_export_total(offset=10) == 40
+    assert await admin.get_export_total(search="x") == 20
+
+    admin.list_count_strategy = ListCountStrategy.EXACT
+    admin.list_count_limit = 10
+    assert await admin.get_export_total() is None
+    assert orm_get_list.await_args.kwargs["count_limit"] == 10
+    orm_get_list.return_value = ([object()], 10)
+    assert await admin.get_export_total() == 10
+
+    admin.list_count_strategy = ListCountStrategy.NONE
+    orm_get_list.reset_mock()
+    assert await admin.get_export_total() is None
+    orm_get_list.assert_not_awaited()
+
+
+async def test_get_list_without_count(mocker):
+    class LogAdmin(ModelAdmin):
+        list_count_strategy = ListCountStrategy.NONE
+
+        def get_model_fields_with_widget_types(self, with_m2m=None):
+            return []
+
+    admin = LogAdmin(type("Model", (), {}))
+    orm_get_list = mocker.patch.object(admin, "orm_get_list", return_value=([object()] * 3, None))
+    estimate = mocker.patch.object(admin, "orm_get_estimated_count", return_value=1000)
+    mocker.patch.object(admin, "serialize_objs", side_effect=lambda objs, **kwargs: [{}] * len(objs))
+
+    result = await admin.get_list(offset=4, limit=2)
+    assert len(result.results) == 2
+    assert result.total is None
+    assert result.has_next
+    assert orm_get_list.await_args.kwargs["limit"] == 3
+    assert orm_get_list.await_args.kwargs["with_count"] is False
+    estimate.assert_not_awaited()
+
+    orm_get_list.return_value = ([object()], None)
+    result = await admin.get_list(offset=4, limit=2)
+    assert result.total is None
+    assert result.has_next is False
+
+    result = await admin.get_list()
+    assert orm_get_list.await_args.kwargs["limit"] is None
+    assert result.total is None
+    assert result.has_next is None
+
+
+def test_list_cursor():
+    ordering = ["-created_at", "id"]
+    for values in (
+        [datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.UTC), 1],
+        [datetime.date(2024, 1, 2), uuid4()],
+        [datetime.time(3, 4, 5), "a"],
+        [Decimal("1.10"), None],
+        [WidgetType.Input, 1.5],
+        [object, True],
+    ):
+        cursor = base_module.encode_list_cursor(ordering, values, backward=True)
+        assert "=" not in cursor
+        decoded_values, backward = base_module.decode_list_cursor(cursor, ordering)
+        assert backward
+        assert decoded_values[1] == values[1]
+        if isinstance(values[0], WidgetType):
+            assert decoded_values[0] == values[0].value
+        elif isinstance(values[0], type):
+            assert decoded_values[0] == str(values[0])
+        else:
+            assert decoded_values[0] == values[0]
+
+    cursor = base_module.encode_list_cursor(ordering, ["a", 1])
+    assert base_module.decode_list_cursor(cursor, ordering) == (["a", 1], False)
+    for invalid_cursor, invalid_ordering in (
+        (cursor, ["created_at", "id"]),
+        ("not a cursor", ordering),
+        (base_module.encode_list_cursor(["-created_at", "id"], ["a"]), ordering),
+        (base64.urlsafe_b64encode(b'{"o":["id"],"v":[["unknown","a"]],"b":false}').decode(), ["id"]),
+    ):
+        with pytest.raises(AdminApiException) as e:
+            base_module.decode_list_cursor(invalid_cursor, invalid_ordering)
+        assert e.value.status_code == 422
+
+
+def test_get_keyset_lookups():
+    assert base_module.get_keyset_lookups(["-name", "rating", "id"], ["a", 2, 3]) == [
+        {"name__lt": "a"},
+        {"name": "a", "rating__gt": 2},
+        {"name": "a", "rating": 2, "id__gt": 3},
+    ]
+
+
+def _cursor_admin(mocker, objs_count=3, **attrs):
+    class CursorAdmin(ModelAdmin):
+        list_pagination = ListPagination.CURSOR
+
+        @staticmethod
+        def get_model_pk_name(orm_model_cls):
+            return "id"
+
+        def get_related_model_cls(self, field_name):
+            return object if field_name == "tournament" else None
+
+        def get_model_fields_with_widget_types(self, with_m2m=None):
+            return [
+                ModelFieldWidgetSchema(
+                    name=name,
+                    column_name=name,
+                    is_m2m=False,
+                    is_pk=name == "id",
+                    is_immutable=False,
+                    form_widget_type=WidgetType.Input,
+                    form_widget_props={},
+                    filter_widget_type=WidgetType.Input,
+                    filter_widget_props={},
+                )
+                for name in ("id", "name", "tournament")
+            ]
+
+    for name, value in attrs.items():
+        setattr(CursorAdmin, name, value)
+    admin = CursorAdmin(type("Model", (), {}))
+    objs = [type("Obj", (), {"id": index, "name": f"name{index}"})() for index in range(objs_count)]
+    orm_get_list = mocker.patch.object(admin, "orm_get_list", return_value=(objs, 10))
+    mocker.patch.object(admin, "serialize_objs", side_effect=lambda objs, **kwargs: [{"id": o.id} for o in objs])
+    return admin, orm_get_list
+
+
+def test_get_list_keyset_ordering(mocker):
+    admin, _ = _cursor_admin(mocker)
+    assert admin.get_list_keyset_ordering() == ["id"]
+    assert admin.get_list_keyset_ordering("-name") == ["-name", "id"]
+    assert admin.get_list_keyset_ordering("-id") == ["-id"]
+
+    admin.ordering = ("name", "-id", "tournament")
+    assert admin.get_list_keyset_ordering() == ["name", "-id"]
+
+    for sort_by in ("tournament", "unknown"):
+        with pytest.raises(AdminApiException) as e:
+            admin.get_list_keyset_ordering(sort_by)
+        assert e.value.status_code == 422
+
+
+async def test_get_list_cursor_pagination(mocker):
+    admin, orm_get_list = _cursor_admin(mocker)
+
+    result = await admin.get_list(offset=0, limit=2, sort_by="-name")
+    assert result.results == [{"id": 0}, {"id": 1}]
+    assert result.total == 10
+    assert result.prev_cursor is None
+    assert orm_get_list.await_args.kwargs["limit"] == 3
+    assert orm_get_list.await_args.kwargs["keyset_ordering"] == ["-name", "id"]
+    assert "keyset_values" not in orm_get_list.await_args.kwargs
+    assert base_module.decode_list_cursor(result.next_cursor, ["-name", "id"]) == (["name1", 1], False)
+
+    result = await admin.get_list(offset=0, limit=2, sort_by="-name", cursor=result.next_cursor)
+    assert orm_get_list.await_args.kwargs["keyset_values"] == ["name1", 1]
+    assert base_module.decode_list_cursor(result.prev_cursor, ["-name", "id"]) == (["name0", 0], True)
+
+    result = await admin.get_list(offset=0, limit=2, sort_by="-name", cursor=result.prev_cursor)
+    assert orm_get_list.await_args.kwargs["keyset_ordering"] == ["name", "-id"]
+    assert orm_get_list.await_args.kwargs["keyset_values"] == ["name0", 0]
+    assert result.results == [{"id": 1}, {"id": 0}]
+    assert base_module.decode_list_cursor(result.next_cursor, ["-name", "id"]) == (["name0", 0], False)
+    assert base_module.decode_list_cursor(result.prev_cursor, ["-name", "id"]) == (["name1", 1], True)
+
+    orm_get_list.return_value = ([], 10)
+    result = await admin.get_list(offset=0, limit=2, cursor=base_module.encode_list_cursor(["id"], [9]))
+    assert result.next_cursor is None
+    assert result.prev_cursor is None
+
+    admin.list_pagination = ListPagination.OFFSET
+    with pytest.raises(AdminApiException) as e:
+        await admin.get_list(offset=0, limit=2, cursor="cursor")
+    assert e.value.status_code == 422
+
+
+async def test_get_list_anchors(mocker):
+    admin, orm_get_list = _cursor_admin(mocker, objs_count=2)
+    admin.list_pagination = ListPagination.OFFSET
+    admin.list_anchor_pages = 2
+    anchors = {}
+
+    # name is not declared unique and not nullable, so its pages are read by offset
+    assert admin.get_list_anchor_ordering("-name") is None
+    await admin.get_list(offset=6, limit=2, sort_by="-name", anchors=anchors)
+    assert orm_get_list.await_args.kwargs["offset"] == 6
+    assert "keyset_ordering" not in orm_get_list.await_args.kwargs
+    assert anchors == {}
+
+    admin.list_anchor_fields = ("name",)
+    assert admin.get_list_anchor_ordering("-name") == ["-name", "id"]
+    assert admin.get_list_anchor_ordering("-id") == ["-id"]
+    assert admin.get_list_anchor_ordering("tournament") is None
+
+    await admin.get_list(offset=2, limit=2, sort_by="-name", anchors=anchors)
+    assert orm_get_list.await_args.kwargs["offset"] == 2
+    assert orm_get_list.await_args.kwargs["keyset_ordering"] == ["-name", "id"]
+    assert "keyset_values" not in orm_get_list.await_args.kwargs
+    assert anchors == {3: ["name1", 1]}
+
+    result = await admin.get_list(offset=6, limit=2, sort_by="-name", anchors=anchors)
+    assert orm_get_list.await_args.kwargs["offset"] == 2
+    assert orm_get_list.await_args.kwargs["keyset_values"] == ["name1", 1]
+    assert result.results == [{"id": 0}, {"id": 1}]
+    assert anchors == {3: ["name1", 1], 7: ["name1", 1]}
+
+    await admin.get_list(offset=2, limit=2, sort_by="tournament", anchors=anchors)
+    assert orm_get_list.await_args.kwargs["offset"] == 2
+    assert "keyset_ordering" not in orm_get_list.await_args.kwargs
+
+    mocker.patch.object(base_module, "_MAX_LIST_ANCHORS", 2)
+    await admin.get_list(offset=10, limit=2, sort_by="-name", anchors=anchors)
+    assert orm_get_list.await_args.kwargs["offset"] == 2
+    assert 11 not in anchors
+
+
+async def test_get_list_anchors_skip_null_and_duplicate_sort_values(mocker):
+    admin, orm_get_list = _cursor_admin(mocker, objs_count=0)
+    admin.list_pagination = ListPagination.OFFSET
+    admin.list_anchor_pages = 1
+    objs = [type("Obj", (), {"id": index, "name": name})() for index, name in enumerate(["a", "a", None, None])]
+    anchors = {}
+
+    # duplicate sort values of an undeclared column: no anchors, every page is read by offset
+    for offset in (0, 2):
+        orm_get_list.return_value = (objs[offset : offset + 2], 4)
+        result = await admin.get_list(offset=offset, limit=2, sort_by="name", anchors=anchors)
+        assert orm_get_list.await_args.kwargs["offset"] == offset
+        assert result.results == [{"id": offset}, {"id": offset + 1}]
+    assert anchors == {}
+
+    # a NULL sort value of a declared column is never recorded
+    admin.list_anchor_fields = ("name",)
+    for offset in (0, 2):
+        orm_get_list.return_value = (objs[offset : offset + 2], 4)
+        await admin.get_list(offset=offset, limit=2, sort_by="name", anchors=anchors)
+    assert anchors == {1: ["a", 1]}
+    await admin.get_list(offset=4, limit=2, sort_by="name", anchors=anchors)
+    assert orm_get_list.await_args.kwargs["keyset_values"] == ["a", 1]
+    assert orm_get_list.await_args.kwargs["offset"] == 2
+
+
+async def test_get_list_documented_orm_get_list(mocker):
+    admin, _ = _cursor_admin(mocker, list_count_limit=10, list_anchor_pages=2, export_chunk_size=2)
+    admin.list_pagination = ListPagination.OFFSET
+    objs = [type("Obj", (), {"id": index, "name": f"name{index}"})() for index in range(5)]
+    offsets = []
+
+    # an override with the documented signature gets neither the counting, deferring nor the keyset arguments
+    async def orm_get_list(offset=None, limit=None, search=None, sort_by=None, filters=None):
+        offsets.append(offset)
+        return objs[offset or 0 : (offset or 0) + limit], len(objs)
+
+    mocker.patch.object(admin, "orm_get_list", orm_get_list)
+    anchors = {}
+    result = await admin.get_list(offset=0, limit=2, sort_by="id", anchors=anchors)
+    assert result.results == [{"id": 0}, {"id": 1}]
+    assert result.total == 5
+    result = await admin.get_list(offset=4, limit=2, sort_by="id", anchors=anchors)
+    assert result.results == [{"id": 4}]
+    assert anchors == {}
+    assert [obj.id async for chunk in admin.iter_export_objs(sort_by="id") for obj in chunk] == [0, 1, 2, 3, 4]
+    assert offsets == [0, 4, None, 2, 4]
+
+    assert base_module.accepts_keyword(lambda **kwargs: None, "with_count")
+    assert not base_module.accepts_keyword(orm_get_list, "with_count")
+
+
+async def test_get_export_chunks(mocker):
+    admin, orm_get_list = _cursor_admin(mocker, export_chunk_size=2)
+    objs = [type("Obj", (), {"id": index, "name": f"=name{index}"})() for index in range(5)]
+
+    def get_objs(**kwargs):
+        start = kwargs["offset"] or 0
+        if kwargs.get("keyset_values") is not None:
+            start += kwargs["keyset_values"][0] + 1
+        return objs[start : start + kwargs["limit"]], None
+
+    orm_get_list.side_effect = get_objs
+    admin.serialize_objs.side_effect = lambda objs, **kwargs: [{"id": o.id, "name": o.name, "x": 1} for o in objs]
+
+    stream = await admin.get_export(ExportFormat.CSV)
+    chunks = [chunk async for chunk in stream]
+    assert chunks == [
+        b"id,name,tournament\r\n0,'=name0,\r\n1,'=name1,\r\n",
+        b"2,'=name2,\r\n3,'=name3,\r\n",
+        b"4,'=name4,\r\n",
+    ]
+    assert [call.kwargs.get("keyset_values") for call in orm_get_list.await_args_list] == [None, [1], [3]]
+    assert orm_get_list.await_args.kwargs["keyset_ordering"] == ["id"]
+    assert orm_get_list.await_args.kwargs["with_count"] is False
+
+    orm_get_list.reset_mock()
+    stream = await admin.get_export(ExportFormat.JSON, offset=1, limit=3, sort_by="name")
+    assert b"".join([chunk async for chunk in stream]) == (
+        b'[{"id": 1, "name": "=name1", "tournament": null}, {"id": 2, "name": "=name2", "tournament": null}, '
+        b'{"id": 3, "name": "=name3", "tournament": null}]'
+    )
+    assert [call.kwargs["offset"] for call in orm_get_list.await_args_list] == [1, 3]
+    assert [call.kwargs["limit"] for call in orm_get_list.await_args_list] == [2, 1]
+    assert "keyset_ordering" not in orm_get_list.await_args.kwargs
+
+    stream = await admin.get_export(ExportFormat.JSON, offset=5, sort_by="tournament")
+    assert b"".join([chunk async for chunk in stream]) == b"[]"
+    stream = await admin.get_export(ExportFormat.CSV, offset=5)
+    assert [chunk async for chunk in stream] == [b"id,name,tournament\r\n"]
+
+
+async def test_get_export_fields(mocker):
+    def get_model_fields_with_widget_types(self, with_m2m=None):
+        return [
+            ModelFieldWidgetSchema(
+                name=name,
+                column_name=name,
+                is_m2m=False,
+                is_pk=name == "id",
+                is_immutable=False,
+                form_widget_type=widget_type,
+                form_widget_props={},
+                filter_widget_type=widget_type,
+                filter_widget_props={},
+            )
+            for name, widget_type in (
+                ("id", WidgetType.Input),
+                ("name", WidgetType.Input),
+                ("bio", WidgetType.TextArea),
+            )
+        ]
+
+    @display
+    def upper_name(self, obj):
+        return obj.name.upper()
+
+    str_calls = []
+
+    class Obj:
+        def __init__(self, id):
+            self.id = id
+            self.name = f"name{id}"
+            self.bio = "long text"
+
+        def __str__(self):
+            str_calls.append(self.id)
+            return f"Obj {self.id}"
+
+    admin, orm_get_list = _cursor_admin(
+        mocker,
+        list_defer_heavy_fields=True,
+        upper_name=upper_name,
+        get_model_fields_with_widget_types=get_model_fields_with_widget_types,
+    )
+    mocker.stop(admin.serialize_objs)
+    orm_get_list.return_value = ([Obj(0), Obj(1)], None)
+    assert admin.get_export_fields() == ["id", "name", "bio"]
+
+    stream = await admin.get_export(ExportFormat.CSV, limit=2)
+    assert b"".join([chunk async for chunk in stream]) == b"id,name,bio\r\n0,name0,long text\r\n1,name1,long text\r\n"
+    assert "defer_fields" not in orm_get_list.await_args.kwargs
+    assert str_calls == []
+
+    admin.export_fields = ("name", "upper_name", "__str__")
+    stream = await admin.get_export(ExportFormat.CSV, limit=2)
+    assert b"".join([chunk async for chunk in stream]) == (
+        b"name,upper_name,__str__\r\nname0,NAME0,Obj 0\r\nname1,NAME1,Obj 1\r\n"
+    )
+    assert orm_get_list.await_args.kwargs["defer_fields"] == ["bio"]
+    assert str_calls == [0, 1]
+
+    plan = admin.get_export_serialization_plan(["name"])
+    assert [field.name for field in plan.attribute_fields] == ["id", "name"]
+    assert plan.display_functions == []
+
+
+async def test_get_export_encoder_pool(mocker):
+    import pyarrow.parquet as pq
+    from openpyxl import load_workbook
+
+    admin, orm_get_list = _cursor_admin(mocker, export_chunk_size=2)
+    objs = [type("Obj", (), {"id": index, "name": f"=name{index}"})() for index in range(5)]
+    orm_get_list.side_effect = lambda **kwargs: (
+        objs[(kwargs["offset"] or 0) : (kwargs["offset"] or 0) + kwargs["limit"]],
+        None,
+    )
+    admin.serialize_objs.side_effect = lambda objs, **kwargs: [{"id": o.id, "name": o.name} for o in objs]
+    mocker.patch.dict(base_module._export_executors, clear=True)
+
+    async def export(export_format):
+        stream = await admin.get_export(export_format, sort_by="name")
+        data = b"".join([chunk async for chunk in stream])
+        if export_format == ExportFormat.XLSX:
+            return list(load_workbook(io.BytesIO(data)).active.values)
+        if export_format == ExportFormat.PARQUET:
+            return pq.read_table(io.BytesIO(data)).to_pylist()
+        return data
+
+    mocker.patch.object(settings, "ADMIN_EXPORT_ENCODER_POOL", "none")
+    expected = {export_format: await export(export_format) for export_format in ExportFormat}
+    assert expected[ExportFormat.CSV].splitlines()[1] == b"0,'=name0,"
+    assert not base_module._export_executors
+
+    encoder_threads = []
+    encode_ndjson_rows = base_module._encode_ndjson_rows
+
+    def record_thread(*args):
+        encoder_threads.append(threading.current_thread().name)
+        return encode_ndjson_rows(*args)
+
+    mocker.patch.object(settings, "ADMIN_EXPORT_ENCODER_WORKERS", 2)
+    for pool in ("thread", "process"):
+        mocker.patch.object(settings, "ADMIN_EXPORT_ENCODER_POOL", pool)
+        for export_format, data in expected.items():
+            assert await export(export_format) == data
+    assert isinstance(base_module._export_executors[("process", 2)], ProcessPoolExecutor)
+
+    mocker.patch.object(settings, "ADMIN_EXPORT_ENCODER_POOL", "thread")
+    mocker.patch.object(base_module, "_encode_ndjson_rows", record_thread)
+    await export(ExportFormat.NDJSON)
+    assert len(encoder_threads) == 3
+    assert all(name.startswith("fastadmin-export") for name in encoder_threads)
+    for executor in base_module._export_executors.values():
+        executor.shutdown()
+
+
+async def test_gzip_export_stream(mocker):
+    chunks = [str(list(range(index * 5000, (index + 1) * 5000))).encode() for index in range(10)]
+
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+
+    mocker.patch.dict(base_module._export_executors, clear=True)
+    for pool in ("none", "process"):
+        mocker.patch.object(settings, "ADMIN_EXPORT_ENCODER_POOL", pool)
+        compressed = [chunk async for chunk in base_module.gzip_export_stream(stream())]
+        assert len(compressed) > 1
+        assert gzip.decompress(b"".join(compressed)) == b"".join(chunks)
+    for executor in base_module._export_executors.values():
+        executor.shutdown()
+
+
+async def test_get_export_formats(mocker):
+    import pyarrow.parquet as pq
+    from openpyxl import load_workbook
+
+    def get_model_fields_with_widget_types(self, with_m2m=None):
+        return [
+            ModelFieldWidgetSchema(
+                name=name,
+                column_name=name,
+                is_m2m=False,
+                is_pk=name == "id",
+                is_immutable=False,
+                form_widget_type=widget_type,
+                form_widget_props={},
+                filter_widget_type=widget_type,
+                filter_widget_props={},
+                number_type=NumberType.Float if name == "tournament" else None,
+            )
+            for name, widget_type in (
+                ("id", WidgetType.InputNumber),
+                ("name", WidgetType.Input),
+                ("tournament", WidgetType.InputNumber),
+                ("is_active", WidgetType.Switch),
+            )
+        ]
+
+    admin, orm_get_list = _cursor_admin(
+        mocker, export_chunk_size=2, get_model_fields_with_widget_types=get_model_fields_with_widget_types
+    )
+    objs = [type("Obj", (), {"id": index})() for index in range(4)]
+    orm_get_list.side_effect = lambda **kwargs: (
+        objs[(kwargs["offset"] or 0) : (kwargs["offset"] or 0) + kwargs["limit"]],
+        None,
+    )
+    values = [
+        {"id": 0, "name": "=x", "tournament": None, "is_active": True},
+        {"id": 1, "name": 5, "tournament": 3, "is_active": None},
+        {"id": 2, "name": None, "tournament": Decimal("2.5"), "is_active": False},
+        {"id": 3, "name": "y", "tournament": "abc", "is_active": "yes"},
+    ]
+    admin.serialize_objs.side_effect = lambda objs, **kwargs: [values[o.id] for o in objs]
+
+    stream = await admin.get_export(ExportFormat.NDJSON, sort_by="name")
+    lines = b"".join([chunk async for chunk in stream]).decode().splitlines()
+    assert [json.loads(line) for line in lines] == [*values[:2], {**values[2], "tournament": "2.5"}, values[3]]
+
+    stream = await admin.get_export(ExportFormat.XLSX, sort_by="name")
+    workbook = load_workbook(io.BytesIO(b"".join([chunk async for chunk in stream])))
+    assert workbook.sheetnames == ["Model"]
+    rows = list(workbook.active.values)
+    assert rows[0] == ("id", "name", "tournament", "is_active")
+    assert rows[1] == (0, "'=x", None, True)
+    assert rows[2] == (1, 5, 3, None)
+    assert rows[3] == (2, None, "2.5", False)
+
+    # the types come from the fields, so a chunk unlike the first one still fits the schema
+    stream = await admin.get_export(ExportFormat.PARQUET, sort_by="name")
+    chunks = [chunk async for chunk in stream]
+    assert len(chunks) == 3
+    table = pq.read_table(io.BytesIO(b"".join(chunks)))
+    assert [str(field.type) for field in table.schema] == ["int64", "string", "double", "bool"]
+    assert table.to_pylist() == [
+        {"id": 0, "name": "=x", "tournament": None, "is_active": True},
+        {"id": 1, "name": "5", "tournament": 3.0, "is_active": None},
+        {"id": 2, "name": None, "tournament": 2.5, "is_active": False},
+        {"id": 3, "name": "y", "tournament": None, "is_active": None},
+    ]
+
+    values[3]["id"] = 2**63
+    stream = await admin.get_export(ExportFormat.PARQUET, offset=3, sort_by="name")
+    table = pq.read_table(io.BytesIO(b"".join([chunk async for chunk in stream])))
+    assert table.to_pylist() == [{"id": None, "name": "y", "tournament": None, "is_active": None}]
+
+    stream = await admin.get_export(ExportFormat.PARQUET, offset=4, sort_by="name")
+    table = pq.read_table(io.BytesIO(b"".join([chunk async for chunk in stream])))
+    assert table.num_rows == 0
+    assert table.column_names == ["id", "name", "tournament", "is_active"]
+
+    mocker.patch.object(base_module.importlib.util, "find_spec", return_value=None)
+    for export_format, package in ((ExportFormat.XLSX, "openpyxl"), (ExportFormat.PARQUET, "pyarrow")):
+        with pytest.raises(AdminApiException) as e:
+            await admin.get_export(export_format)
+        assert e.value.status_code == 422
+        assert e.value.detail == f"{export_format.value} export requires the {package} package."
+
+
+async def test_get_export_parquet_number_types(mocker):
+    import pyarrow.parquet as pq
+
+    number_fields = (
+        ("id", None, None, None),
+        ("rating", NumberType.Integer, None, None),
+        ("latitude", NumberType.Float, None, None),
+        ("price", NumberType.Decimal, 5, 2),
+        ("amount", NumberType.Decimal, None, None),
+        ("score", None, None, None),
+    )
+
+    def get_model_fields_with_widget_types(self, with_m2m=None):
+        return [
+            ModelFieldWidgetSchema(
+                name=name,
+                column_name=name,
+                is_m2m=False,
+                is_pk=name == "id",
+                is_immutable=False,
+                form_widget_type=WidgetType.InputNumber,
+                form_widget_props={},
+                filter_widget_type=WidgetType.InputNumber,
+                filter_widget_props={},
+                number_type=number_type,
+                number_precision=precision,
+                number_scale=scale,
+            )
+            for name, number_type, precision, scale in number_fields
+        ]
+
+    admin, orm_get_list = _cursor_admin(
+        mocker, export_chunk_size=2, get_model_fields_with_widget_types=get_model_fields_with_widget_types
+    )
+    values = [
+        {"id": 0, "rating": 3, "latitude": 1.5, "price": Decimal("12.345"), "amount": Decimal("1.10"), "score": 7},
+        {"id": 1, "rating": "4", "latitude": "x", "price": 1234, "amount": 2, "score": Decimal("0.1")},
+        {"id": 2, "rating": 2**63, "latitude": None, "price": "abc", "amount": None, "score": 2.5},
+        {"id": 3, "rating": None, "latitude": 2, "price": float("nan"), "amount": "3", "score": None},
+    ]
+    objs = [type("Obj", (), {"id": index})() for index in range(len(values))]
+    orm_get_list.side_effect = lambda **kwargs: (
+        objs[(kwargs["offset"] or 0) : (kwargs["offset"] or 0) + kwargs["limit"]],
+        None,
+    )
+    admin.serialize_objs.side_effect = lambda objs, **kwargs: [values[o.id] for o in objs]
+
+    stream = await admin.get_export(ExportFormat.PARQUET, sort_by="name")
+    table = pq.read_table(io.BytesIO(b"".join([chunk async for chunk in stream])))
+    # integers are not rounded to doubles, and numbers of an unknown type are kept as strings
+    assert [str(field.type) for field in table.schema] == [
+        "int64",
+        "int64",
+        "double",
+        "decimal128(5, 2)",
+        "string",
+        "string",
+    ]
+    assert table.to_pylist() == [
+        {"id": 0, "rating": 3, "latitude": 1.5, "price": Decimal("12.34"), "amount": "1.10", "score": "7"},
+        {"id": 1, "rating": 4, "latitude": None, "price": None, "amount": "2", "score": "0.1"},
+        {"id": 2, "rating": None, "latitude": None, "price": None, "amount": None, "score": "2.5"},
+        {"id": 3, "rating": None, "latitude": 2.0, "price": None, "amount": "3", "score": None},
+    ]
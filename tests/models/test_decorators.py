@@ -127,3 +127,32 @@ def test_widget_action_used_without_parentheses():
     # Defaults are preserved
     assert simple_action.widget_action_type is WidgetActionType.Action
     assert simple_action.widget_action_props is None
+
+
+def test_display_inline():
+    """@display(inline=True) marks the function as cheap to call on the event loop."""
+
+    @display(inline=True)
+    def initials(self, obj):
+        return str(obj)[0]
+
+    assert initials.is_display is True
+    assert initials.inline is True
+
+    @display
+    def name(self, obj):
+        return str(obj)
+
+    assert name.inline is False
+
+
+def test_display_batch():
+    """@display(batch=True) marks the function as called once per page."""
+
+    @display(batch=True)
+    async def orders_count(self, objs):
+        return {}
+
+    assert orders_count.is_display is True
+    assert orders_count.batch is True
+    assert orders_count.inline is False
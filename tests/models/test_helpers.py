@@ -39,6 +39,30 @@ async def test_uregister_admin_model_class():
     assert not get_admin_model(OrmModelClass)
 
 
+async def test_register_admin_model_class_invalidates_fields_metadata(mocker):
+    class AdminModelClass(ModelAdmin):
+        pass
+
+    class OrmModelClass:
+        pass
+
+    register_admin_model_class(AdminModelClass, [OrmModelClass])
+    admin_model = get_admin_model(OrmModelClass)
+    mocker.patch.object(admin_model, "get_model_fields_with_widget_types", return_value=[])
+    admin_model.get_model_fields_metadata()
+    assert admin_model._model_fields_cache
+
+    register_admin_model_class(AdminModelClass, [OrmModelClass])
+    assert not admin_model._model_fields_cache
+    assert get_admin_model(OrmModelClass) is not admin_model
+
+    new_admin_model = get_admin_model(OrmModelClass)
+    mocker.patch.object(new_admin_model, "get_model_fields_with_widget_types", return_value=[])
+    new_admin_model.get_model_fields_metadata()
+    unregister_admin_model_class([OrmModelClass])
+    assert not new_admin_model._model_fields_cache
+
+
 async def test_admin_model_list_configuration_ordering(tournament, base_model_admin):
     Tournament = tournament.__class__
 
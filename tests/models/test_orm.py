@@ -1,7 +1,8 @@
 import pytest
+from asgiref.sync import sync_to_async
 
 from fastadmin.models.helpers import get_admin_model
-from fastadmin.models.schemas import ModelFieldWidgetSchema, WidgetType
+from fastadmin.models.schemas import ModelFieldWidgetSchema, NumberType, WidgetType
 
 
 def test_get_form_widget_user(user):
@@ -332,6 +333,26 @@ def test_get_form_widget_event(event):
                 raise ValueError(f"Unexpected field: {field.name}")
 
 
+def test_get_number_types(event, session_with_type):
+    _, session_type = session_with_type
+    admin_model_obj = get_admin_model(event.__class__)
+    by_name = {f.name: f for f in admin_model_obj.get_model_fields_with_widget_types()}
+
+    assert by_name["rating"].number_type == NumberType.Integer
+    assert by_name["latitude"].number_type == NumberType.Float
+    assert by_name["name"].number_type is None
+    price = by_name["price"]
+    match session_type:
+        case "sqlalchemy":
+            # Float(asdecimal=True)
+            assert price.number_type == NumberType.Float
+        case "ponyorm":
+            # the default precision and scale of PonyORM
+            assert (price.number_type, price.number_precision, price.number_scale) == (NumberType.Decimal, 12, 2)
+        case _:
+            assert (price.number_type, price.number_precision, price.number_scale) == (NumberType.Decimal, 10, 2)
+
+
 def test_nullable_foreign_key_form_required(event):
     """Nullable FK (base) must have required=False; non-nullable FK (tournament) required=True.
 
@@ -370,6 +391,10 @@ def test_sqlalchemy_field_mapping_special_cases(monkeypatch):
     class ARRAY:
         pass
 
+    class Decimal:
+        precision = 8
+        scale = 3
+
     # First mapper: MANYTOONE without matching *_id FK column -> skip by continue at line 55.
     mapper_missing_fk = SimpleNamespace(
         c=[],
@@ -388,6 +413,7 @@ def test_sqlalchemy_field_mapping_special_cases(monkeypatch):
     mapper_full = SimpleNamespace(
         c=[
             SimpleNamespace(key="tags", foreign_keys=[], type=ARRAY()),
+            SimpleNamespace(key="amount", foreign_keys=[], type=Decimal()),
             SimpleNamespace(key="profile_id", foreign_keys=[1], nullable=False),
         ],
         relationships=[
@@ -406,6 +432,12 @@ def test_sqlalchemy_field_mapping_special_cases(monkeypatch):
     assert by_name["tags"].form_widget_type == WidgetType.Select
     assert by_name["tags"].form_widget_props["mode"] == "tags"
     assert by_name["tags"].filter_widget_props["mode"] == "tags"
+    assert by_name["amount"].form_widget_type == WidgetType.InputNumber
+    assert (by_name["amount"].number_type, by_name["amount"].number_precision, by_name["amount"].number_scale) == (
+        NumberType.Decimal,
+        8,
+        3,
+    )
     assert by_name["profile"].form_widget_type == WidgetType.AsyncSelect
     assert by_name["profile"].form_widget_props["parentModel"] == "RelModel"
     assert by_name["profile"].filter_widget_type == WidgetType.AsyncSelect
@@ -1252,3 +1284,225 @@ def test_sqlalchemy_escape_like_and_order_column_helpers(session_with_type):
     # Wildcards are escaped; non-strings pass through unchanged.
     assert _escape_like("a%b_c\\d") == "a\\%b\\_c\\\\d"
     assert _escape_like(123) == 123
+
+
+async def test_orm_get_m2m_ids_bulk(event, session_with_type):
+    from types import SimpleNamespace
+
+    admin_model = get_admin_model(event.__class__)
+    pk_name = admin_model.get_model_pk_name(event.__class__)
+    missing = SimpleNamespace(**{pk_name: -1})
+
+    ids = await admin_model.orm_get_m2m_ids_bulk([missing, event], "participants")
+    assert ids == [[], await admin_model.orm_get_m2m_ids(event, "participants")]
+    assert len(ids[1]) == 1
+    assert await admin_model.orm_get_m2m_ids_bulk([], "participants") == []
+
+    await admin_model.orm_save_m2m_ids(event, "participants", [])
+    assert await admin_model.orm_get_m2m_ids_bulk([event], "participants") == [[]]
+
+
+async def test_ponyorm_serialize_objs_in_one_db_session(event, session_with_type):
+    _, session_type = session_with_type
+    if session_type != "ponyorm":
+        return
+
+    from fastadmin import display
+    from fastadmin.models.orms.ponyorm import PonyORMModelAdmin
+
+    class EventAdmin(PonyORMModelAdmin):
+        list_display = ("id", "name", "tournament_name", "participants_count", "name_length", "upper_name")
+
+        @display
+        def tournament_name(self, obj):
+            # lazy relation access needs a live db_session
+            return obj.tournament.name
+
+        @display(batch=True)
+        def participants_count(self, objs):
+            return {obj.id: len(obj.participants) for obj in objs}
+
+        @display(batch=True)
+        async def name_length(self, objs):
+            return {obj.id: len(obj.name) for obj in objs}
+
+        @display
+        async def upper_name(self, obj):
+            return obj.name.upper()
+
+    admin_model = EventAdmin(event.__class__)
+    (result,) = await admin_model.serialize_objs([event], list_view=True)
+    assert result["id"] == event.id
+    assert result["__str__"] == "Test Event"
+    assert result["tournament_name"] == "Test Tournament"
+    assert result["participants_count"] == 1
+    assert result["name_length"] == len("Test Event")
+    assert result["upper_name"] == "TEST EVENT"
+    assert "participants" not in result
+
+    obj = await admin_model.serialize_obj(event)
+    assert len(obj["participants"]) == 1
+    assert obj["tournament_name"] == "Test Tournament"
+    assert await admin_model.serialize_objs([]) == []
+
+
+async def test_ponyorm_serialize_objs_deleted_object(event, session_with_type):
+    from types import SimpleNamespace
+
+    _, session_type = session_with_type
+    if session_type != "ponyorm":
+        return
+
+    from fastadmin.models.orms.ponyorm import PonyORMModelAdmin
+
+    class DeletedEvent(SimpleNamespace):
+        async def __str__(self):  # type: ignore[override]
+            return "deleted"
+
+    admin_model = PonyORMModelAdmin(event.__class__)
+    admin_model.get_model_fields_with_widget_types = lambda: [  # type: ignore[method-assign]
+        ModelFieldWidgetSchema(
+            name=name,
+            column_name=name,
+            is_m2m=is_m2m,
+            is_pk=False,
+            is_immutable=False,
+            form_widget_type=WidgetType.Input,
+            form_widget_props={},
+            filter_widget_type=WidgetType.Input,
+            filter_widget_props={},
+        )
+        for name, is_m2m in (("participants", True),)
+    ]
+    assert await admin_model.serialize_obj(DeletedEvent(id=-1)) == {"participants": [], "__str__": "deleted"}
+    assert await admin_model.serialize_obj(event) == {
+        "participants": await admin_model.orm_get_m2m_ids(event, "participants"),
+        "__str__": "Test Event",
+    }
+
+
+async def test_ponyorm_serialize_obj_attributes(event, session_with_type):
+    from types import SimpleNamespace
+
+    _, session_type = session_with_type
+    if session_type != "ponyorm":
+        return
+
+    admin_model = get_admin_model(event.__class__)
+    fields = [f for f in admin_model.get_model_fields_metadata().fields if f.name == "name"]
+    assert await admin_model.serialize_obj_attributes(event, fields) == {"name": "Test Event", "__str__": "Test Event"}
+    assert await admin_model.serialize_obj_attributes(event, fields, with_str=False) == {"name": "Test Event"}
+    assert await admin_model.serialize_obj_attributes(SimpleNamespace(id=-1), fields) == {}
+
+
+async def _execute_sql(admin_model, session_type, sql):
+    match session_type:
+        case "tortoiseorm":
+            await admin_model.model_cls._meta.db.execute_script(sql)
+        case "djangoorm":
+            from django.db import connection
+
+            def execute():
+                with connection.cursor() as cursor:
+                    cursor.execute(sql)
+
+            await sync_to_async(execute)()
+        case "sqlalchemy":
+            from sqlalchemy import text
+
+            async with admin_model.get_sessionmaker()() as session:
+                await session.execute(text(sql))
+                await session.commit()
+        case "ponyorm":
+            from pony.orm import db_session
+
+            await sync_to_async(db_session(lambda: admin_model.model_cls._database_.execute(sql)))()
+        case "yaraorm":
+            from yara_orm.connection import get_executor
+
+            await get_executor(admin_model.model_cls).execute(sql)
+
+
+async def test_orm_get_estimated_count(event, session_with_type, mocker):
+    _, session_type = session_with_type
+    admin_model = get_admin_model(event.__class__)
+
+    await _execute_sql(admin_model, session_type, "ANALYZE")
+    assert await admin_model.orm_get_estimated_count() >= 1
+
+    # sqlite_stat1 only exists once the database was analyzed
+    await _execute_sql(admin_model, session_type, "DROP TABLE sqlite_stat1")
+    assert await admin_model.orm_get_estimated_count() is None
+
+    adapter_module = {
+        "tortoiseorm": "tortoise",
+        "djangoorm": "django",
+        "sqlalchemy": "sqlalchemy",
+        "ponyorm": "ponyorm",
+        "yaraorm": "yaraorm",
+    }[session_type]
+    # dialects without statistics queries are never estimated
+    mocker.patch(f"fastadmin.models.orms.{adapter_module}.get_estimated_count_query", return_value=None)
+    assert await admin_model.orm_get_estimated_count() is None
+
+
+async def test_orm_get_list_without_count(event, session_with_type):
+    admin_model = get_admin_model(event.__class__)
+
+    objs, total = await admin_model.orm_get_list(offset=0, limit=10, with_count=False)
+    assert total is None
+    assert len(objs) == (await admin_model.orm_get_list(offset=0, limit=10))[1]
+
+
+async def test_orm_get_list_count_limit(superuser, event, session_with_type):
+    admin_model = get_admin_model(superuser.__class__)
+
+    _, total = await admin_model.orm_get_list()
+    assert total >= 2
+
+    objs, total = await admin_model.orm_get_list(offset=0, limit=10, count_limit=0)
+    assert total == 1
+    assert len(objs) >= 2
+
+    _, total = await admin_model.orm_get_list(count_limit=1000)
+    assert total == (await admin_model.orm_get_list())[1]
+
+
+async def test_orm_get_list_keyset(superuser, event, session_with_type):
+    admin_model = get_admin_model(superuser.__class__)
+    pk_name = admin_model.get_model_pk_name(admin_model.model_cls)
+    keyset_ordering = ["-username", pk_name]
+
+    objs, total = await admin_model.orm_get_list(keyset_ordering=keyset_ordering)
+    assert len(objs) == total >= 2
+    usernames = [obj.username for obj in objs]
+    assert usernames == sorted(usernames, reverse=True)
+
+    first_values = [getattr(objs[0], field.lstrip("-")) for field in keyset_ordering]
+    seek_objs, seek_total = await admin_model.orm_get_list(
+        offset=0, limit=10, keyset_ordering=keyset_ordering, keyset_values=first_values
+    )
+    assert seek_total == total
+    assert [getattr(obj, pk_name) for obj in seek_objs] == [getattr(obj, pk_name) for obj in objs[1:10]]
+
+    backward_objs, _ = await admin_model.orm_get_list(
+        keyset_ordering=["username", f"-{pk_name}"], keyset_values=first_values
+    )
+    assert backward_objs == []
+
+
+async def test_orm_get_list_count_concurrently(mocker, superuser, event, session_with_type):
+    admin_model = get_admin_model(superuser.__class__)
+    pk_name = admin_model.get_model_pk_name(admin_model.model_cls)
+    objs, total = await admin_model.orm_get_list(offset=0, limit=1)
+
+    mocker.patch.object(admin_model, "list_count_concurrently", True)
+    concurrent_objs, concurrent_total = await admin_model.orm_get_list(offset=0, limit=1)
+    assert concurrent_total == total >= 2
+    assert [getattr(obj, pk_name) for obj in concurrent_objs] == [getattr(obj, pk_name) for obj in objs]
+
+    _, capped_total = await admin_model.orm_get_list(offset=0, limit=1, count_limit=0)
+    assert capped_total == 1
+
+    _, no_total = await admin_model.orm_get_list(offset=0, limit=1, with_count=False)
+    assert no_total is None